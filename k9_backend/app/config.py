@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -28,6 +30,18 @@ class APISettings(BaseSettings):
     # CORS (comma-separated list)
     allowed_origins: str = Field(default="*", description="CORS origins, comma-separated or '*'")
 
+    # Graph result cache (LRU + TTL, keyed by command / scenario / dataset version)
+    result_cache_size: int = Field(default=128, description="Max cached graph results")
+    result_cache_ttl_seconds: float = Field(default=300.0, description="Cached result lifetime in seconds")
+
+    # Graph state mode: True = slotted dataclass inside the graph, K9State validated only at the edges
+    graph_fast_state: bool = Field(default=False, description="Skip per-node K9State validation inside the graph")
+
+    # Graph executor: "langgraph" = graph.invoke, "compiled" = per-intent node plans (same outputs)
+    graph_executor: Literal["langgraph", "compiled"] = Field(
+        default="langgraph", description="Executor for the deterministic graph path"
+    )
+
     # Neo4j (Knowledge Graph)
     # Leave uri empty to disable Neo4j integration (demo can still run without KG).
     neo4j_uri: str = Field(default="", description="Neo4j URI, e.g. bolt://localhost:7687 or neo4j+s://...")
@@ -44,6 +44,12 @@ DEFAULT_DATASETS: Dict[str, DatasetDescriptor] = {
         primary_time_keys=["semana_id", "semana"],
         description="12-week proactive ranking view",
     ),
+    "k9_observaciones_semana.csv": DatasetDescriptor(
+        name="k9_observaciones_semana.csv",
+        granularity="week",
+        primary_time_keys=["semana"],
+        description="Observation counts by week and type (maintained by daily ingestion)",
+    ),
     "stde_trayectorias_diarias.csv": DatasetDescriptor(
         name="stde_trayectorias_diarias.csv",
         granularity="day",
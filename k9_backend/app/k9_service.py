@@ -4,6 +4,10 @@ import json
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple, List
 
+from src.data.data_manager import DataManager
+from src.data.dataset_handle import DatasetHandle
+from src.data.ingestion import DailyIngestor
+from src.graph.executor import K9PlanExecutor
 from src.graph.main_graph import build_k9_graph
 from src.llm.factory import create_llm_client
 from src.llm.language_bundle import load_k9_language_bundle
@@ -15,12 +19,15 @@ from src.llm.payload import (
     LLMKnowledgeScaffold,
 )
 from src.llm.validators import validate_llm_output_schema
+from src.scenarios import ScenarioEngine, scenario_for_event
 from src.llm.json_utils import extract_json_object, safe_json_loads
+from src.state.fast_state import to_fast_state, to_k9_state
 from src.state.state import K9State
 
 from app.config import APISettings
-from app.data_catalog import collect_sources, describe_sources
+from app.data_catalog import DEFAULT_DATASETS, collect_sources, describe_sources
 from app.neo4j_client import Neo4jClient, Neo4jConfig
+from app.result_cache import ResultCache, freeze_state, result_cache_key, serve_state
 
 
 @dataclass(frozen=True)
@@ -52,11 +59,30 @@ class K9Service:
         # LLM client (Gemini) created from env (K9_PROVIDER, K9_GEMINI_API_KEY, K9_GEMINI_MODEL)
         self.llm = create_llm_client()
 
+        settings = APISettings()
+
         # Compile graph once
-        self.graph = build_k9_graph()
+        self.graph = build_k9_graph(fast_state=settings.graph_fast_state)
+
+        # Deterministic path executor: the LangGraph graph itself, or flat
+        # per-intent node plans (same nodes and memo, no Pregel scheduling)
+        self.executor = (
+            K9PlanExecutor(fallback=self.graph, fast_state=settings.graph_fast_state)
+            if settings.graph_executor == "compiled"
+            else self.graph
+        )
+        self.fast_state = settings.graph_fast_state
+
+        # Daily data ingestion (CWD is k9_core, see main._bootstrap_k9_core)
+        self.ingestor = DailyIngestor("data/synthetic")
+
+        # Final graph results (deterministic per command / scenario / dataset version)
+        self.results = ResultCache(
+            maxsize=settings.result_cache_size,
+            ttl_seconds=settings.result_cache_ttl_seconds,
+        )
 
         # Optional: Neo4j client (knowledge graph)
-        settings = APISettings()
         self._neo4j: Optional[Neo4jClient] = None
         if settings.neo4j_enabled:
             self._neo4j = Neo4jClient(
@@ -119,6 +145,21 @@ class K9Service:
         active_event: Optional[Dict[str, Any]] = None,
         demo_mode: bool = False,
     ) -> K9State:
+        # Cached results are read-only (FrozenK9State); a new query, dataset
+        # version or scenario yields a new key
+        scenario = scenario_for_event(active_event)
+        key = result_cache_key(
+            user_query=user_query,
+            k9_command=k9_command,
+            active_event=active_event,
+            demo_mode=demo_mode,
+            dataset_version=DataManager("data/synthetic").dataset_version(),
+            scenario_id=scenario.scenario_id if scenario else None,
+        )
+        cached = self.results.get(key)
+        if cached is not None:
+            return serve_state(cached, user_query=user_query)
+
         # state.k9_command is the graph source of truth
         state = K9State(
             user_query=user_query,
@@ -129,8 +170,43 @@ class K9Service:
             active_event=active_event,
         )
 
-        result = self.graph.invoke(state)
-        return result if isinstance(result, K9State) else K9State(**result)
+        # Input edge: nodes get K9FastState (no per-node validation) when enabled
+        graph_input = to_fast_state(state) if self.fast_state else state
+
+        # Output edge: the only K9State validation after the input state
+        result = to_k9_state(self.executor.invoke(graph_input))
+
+        frozen = freeze_state(result)
+        self.results.put(key, frozen)
+        return serve_state(frozen)
+
+    def result_cache_stats(self) -> Dict[str, Any]:
+        return self.results.stats()
+
+    # ------------------------------------------------------------
+    # 2b) Daily ingestion (append + incremental weekly aggregates)
+    # ------------------------------------------------------------
+    def ingest_daily(self, batch: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        report = self.ingestor.ingest(batch).to_dict()
+        # New dataset version: cached results can no longer be hit
+        self.results.clear()
+        return report
+
+    # ------------------------------------------------------------
+    # 2c) Scenarios (overlay materialized once per data version)
+    # ------------------------------------------------------------
+    def warm_scenario(self, scenario_id: str) -> Dict[str, Any]:
+        view = ScenarioEngine(DataManager("data/synthetic")).materialize(scenario_id)
+        return {"scenario": view.scenario_id, "dataset_version": view.dataset_version}
+
+    # ------------------------------------------------------------
+    # 2d) Dataset records on demand (paged, from analysis handles)
+    # ------------------------------------------------------------
+    def read_records(self, handle: Dict[str, Any], *, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        ref = DatasetHandle.from_dict(handle)
+        if ref.dataset not in DEFAULT_DATASETS:
+            raise ValueError(f"Unknown dataset: {ref.dataset}")
+        return DataManager("data/synthetic").read_page(ref, offset=offset, limit=limit)
 
     def build_trace(self, *, state: K9State, k9_command: Dict[str, Any]) -> Dict[str, Any]:
         analysis = state.analysis if isinstance(state.analysis, dict) else {}
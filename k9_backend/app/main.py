@@ -3,11 +3,11 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.config import APISettings, parse_origins
 
@@ -74,7 +74,7 @@ class ChatRequest(BaseModel):
 
 @app.get("/health")
 def health() -> Dict[str, Any]:
-    return {"ok": True}
+    return {"ok": True, "result_cache": svc.result_cache_stats()}
 
 
 class ScenarioRequest(BaseModel):
@@ -84,9 +84,45 @@ class ScenarioRequest(BaseModel):
 @app.post("/api/scenario/critical-monday")
 def set_critical_monday(req: ScenarioRequest) -> Dict[str, Any]:
     SCENARIOS["critical_monday"] = bool(req.enabled)
+    if SCENARIOS["critical_monday"]:
+        # Pre-warm: graph runs reuse the cached overlay + weekly signals
+        svc.warm_scenario("critical_monday")
     return {"ok": True, "scenario": "critical_monday", "enabled": SCENARIOS["critical_monday"]}
 
 
+class IngestDailyRequest(BaseModel):
+    observaciones: List[Dict[str, Any]] = Field(default_factory=list)
+    eventos: List[Dict[str, Any]] = Field(default_factory=list)
+    auditorias: List[Dict[str, Any]] = Field(default_factory=list)
+    fdo: List[Dict[str, Any]] = Field(default_factory=list)
+    trayectorias: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+@app.post("/api/ingest/daily")
+def ingest_daily(req: IngestDailyRequest) -> Dict[str, Any]:
+    try:
+        result = svc.ingest_daily(req.model_dump())
+    except (ValueError, FileNotFoundError) as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, **result}
+
+
+class RecordsRequest(BaseModel):
+    handle: Dict[str, Any]
+    offset: int = 0
+    limit: int = 50
+
+
+@app.post("/api/records")
+def records(req: RecordsRequest) -> Dict[str, Any]:
+    # Materializes one page of a dataset handle carried in `analysis`
+    try:
+        page = svc.read_records(req.handle, offset=req.offset, limit=req.limit)
+    except (ValueError, FileNotFoundError) as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, **page}
+
+
 @app.get("/api/summary")
 def summary(window: str = "CURRENT_WEEK") -> Dict[str, Any]:
     # Minimal deterministic command (no LLM) to compute metrics + risk_summary.
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from pydantic import ConfigDict
+
+from src.state.state import K9State
+
+
+# ------------------------------------------------------------
+# Immutable containers (still dict / list for isinstance checks
+# and JSON encoding)
+# ------------------------------------------------------------
+def _read_only(*_args: Any, **_kwargs: Any) -> None:
+    raise TypeError("Cached K9 results are read-only; copy them before mutating.")
+
+
+class FrozenDict(dict):
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def copy(self) -> Dict[Any, Any]:
+        # Mutable shallow copy owned by the caller
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+class FrozenList(list):
+    __setitem__ = __delitem__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __iadd__ = __imul__ = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively wrap dicts / lists / sets into read-only containers."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+class FrozenK9State(K9State):
+    """K9State served from the result cache: no attribute assignment, read-only containers."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+
+# Nested pydantic models stay mutable; each caller gets its own copy
+# (DataSlice is already a frozen dataclass)
+_MODEL_FIELDS = ("time_context", "llm_session_context")
+
+
+def freeze_state(state: K9State) -> FrozenK9State:
+    # Request-scoped frames are not part of the result
+    fields = {
+        name: freeze(getattr(state, name))
+        for name in K9State.model_fields
+        if name != "data_context"
+    }
+    return FrozenK9State.model_construct(**fields)
+
+
+def serve_state(state: FrozenK9State, **update: Any) -> FrozenK9State:
+    """Cached state for one caller (own copies of nested models, optional overrides)."""
+    models = {
+        name: getattr(state, name).model_copy(deep=True)
+        for name in _MODEL_FIELDS
+        if getattr(state, name) is not None
+    }
+    return state.model_copy(update={**models, **update})
+
+
+# ------------------------------------------------------------
+# Cache key
+# ------------------------------------------------------------
+def normalize_query(user_query: Optional[str]) -> str:
+    # Graph nodes only read user_query.lower() (keyword / substring matching)
+    return (user_query or "").lower()
+
+
+def result_cache_key(
+    *,
+    user_query: Optional[str],
+    k9_command: Dict[str, Any],
+    active_event: Optional[Dict[str, Any]],
+    demo_mode: bool,
+    dataset_version: str,
+    scenario_id: Optional[str],
+) -> str:
+    """
+    Canonical hash of the graph inputs (key order independent).
+    The query text is part of the key: semantic retrieval and metrics
+    derive `answer` / `visual_suggestions` from it.
+    """
+    canonical = json.dumps(
+        {
+            "user_query": normalize_query(user_query),
+            "k9_command": k9_command,
+            "active_event": active_event,
+            "demo_mode": bool(demo_mode),
+            "dataset_version": dataset_version,
+            "scenario_id": scenario_id,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ------------------------------------------------------------
+# Bounded LRU + TTL cache
+# ------------------------------------------------------------
+class ResultCache:
+    """
+    LRU + TTL cache of final graph results.
+    - At most `maxsize` entries (least recently used evicted first)
+    - Entries older than `ttl_seconds` are treated as misses
+    - Thread-safe (FastAPI runs sync endpoints in a thread pool)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("ResultCache: maxsize must be > 0")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": (self._hits / lookups) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -0,0 +1,323 @@
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# --------------------------------------------------
+# k9_backend (app.*) + k9_core (src.*)
+# --------------------------------------------------
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+K9_CORE_ROOT = BACKEND_ROOT.parent / "k9_core"
+sys.path.insert(0, str(K9_CORE_ROOT))
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.result_cache import (
+    FrozenDict,
+    FrozenK9State,
+    FrozenList,
+    ResultCache,
+    freeze,
+    freeze_state,
+    result_cache_key,
+    serve_state,
+)
+from src.state.state import K9State
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _key(**overrides):
+    params = {
+        "user_query": "¿Cuáles son los top riesgos?",
+        "k9_command": {
+            "intent": "ANALYTICAL_QUERY",
+            "entity": "risks",
+            "operation": "rank",
+            "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+        },
+        "active_event": None,
+        "demo_mode": False,
+        "dataset_version": "v1",
+        "scenario_id": None,
+    }
+    params.update(overrides)
+    return result_cache_key(**params)
+
+
+# ------------------------------------------------------------
+# LRU + TTL
+# ------------------------------------------------------------
+def test_lru_evicts_least_recently_used_at_capacity():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_put_existing_key_refreshes_without_evicting():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry_with_injected_clock():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=4, ttl_seconds=10.0, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 10.0
+    assert cache.get("a") == 1  # exactly at the TTL: still fresh
+
+    clock.now = 10.5
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["size"] == 0
+
+    # A new put restarts the entry's age
+    cache.put("a", 2)
+    clock.now = 15.0
+    assert cache.get("a") == 2
+
+
+def test_invalid_maxsize_and_clear():
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+    cache = ResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+# ------------------------------------------------------------
+# Cache key
+# ------------------------------------------------------------
+def test_key_is_independent_of_dict_key_order():
+    command = {
+        "intent": "ANALYTICAL_QUERY",
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}, "limit": 5},
+    }
+    reordered = {
+        "payload": {"limit": 5, "time": {"value": "LAST_4_WEEKS", "type": "RELATIVE"}},
+        "operation": "rank",
+        "entity": "risks",
+        "intent": "ANALYTICAL_QUERY",
+    }
+    assert _key(k9_command=command) == _key(k9_command=reordered)
+    assert _key(active_event={"id": "e1", "kind": "x"}) == _key(active_event={"kind": "x", "id": "e1"})
+
+
+def test_key_changes_with_graph_inputs():
+    base = _key()
+    assert _key(dataset_version="v2") != base
+    assert _key(demo_mode=True) != base
+    assert _key(scenario_id="critical-monday") != base
+    assert _key(active_event={"id": "e1"}) != base
+    assert _key(k9_command={"intent": "OPERATIONAL_QUERY"}) != base
+    assert _key(user_query="Explica el modelo proactivo") != base
+    # Nodes match on the lower-cased query: case-only variants share a key
+    assert _key(user_query="¿CUÁLES SON LOS TOP RIESGOS?") == base
+
+
+def test_queries_sharing_a_command_get_their_own_results(monkeypatch):
+    from src.graph.main_graph import build_k9_graph
+
+    # Nodes read `data/...` relative to k9_core (see main._bootstrap_k9_core)
+    monkeypatch.chdir(K9_CORE_ROOT)
+    graph = build_k9_graph(parallel=False)
+    command = {
+        "type": "K9_COMMAND",
+        "intent": "ANALYTICAL_QUERY",
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    cache = ResultCache(maxsize=4)
+
+    def run(query):
+        # Same flow as K9Service.run_graph
+        key = _key(user_query=query, k9_command=command)
+        cached = cache.get(key)
+        if cached is not None:
+            return serve_state(cached, user_query=query)
+        state = K9State(user_query=query, k9_command=command, context_bundle={"k9_command": command})
+        frozen = freeze_state(K9State(**graph.invoke(state)))
+        cache.put(key, frozen)
+        return serve_state(frozen)
+
+    top = run("¿Cuáles son los top riesgos?")
+    proactive = run("Explica el modelo proactivo")
+
+    assert top.answer and proactive.answer
+    assert top.answer != proactive.answer
+    assert top.reasoning != proactive.reasoning
+    assert cache.stats()["misses"] == 2
+
+    again = run("¿CUÁLES SON LOS TOP RIESGOS?")
+    assert again.answer == top.answer
+    assert again.user_query == "¿CUÁLES SON LOS TOP RIESGOS?"
+    assert cache.stats()["hits"] == 1
+
+
+# ------------------------------------------------------------
+# Read-only containers
+# ------------------------------------------------------------
+def test_frozen_dict_is_read_only():
+    frozen = freeze({"a": 1, "nested": {"b": [1, 2]}})
+    assert isinstance(frozen, FrozenDict) and isinstance(frozen, dict)
+    assert isinstance(frozen["nested"], FrozenDict)
+    assert isinstance(frozen["nested"]["b"], FrozenList)
+
+    mutations = [
+        lambda d: d.__setitem__("a", 2),
+        lambda d: d.__delitem__("a"),
+        lambda d: d.clear(),
+        lambda d: d.pop("a"),
+        lambda d: d.popitem(),
+        lambda d: d.setdefault("c", 3),
+        lambda d: d.update({"c": 3}),
+        lambda d: d.__ior__({"c": 3}),
+    ]
+    for mutate in mutations:
+        with pytest.raises(TypeError):
+            mutate(frozen)
+    assert frozen == {"a": 1, "nested": {"b": [1, 2]}}
+
+    # Copies belong to the caller and are mutable
+    own = frozen.copy()
+    own["a"] = 2
+    assert type(own) is dict and frozen["a"] == 1
+
+    deep = copy.deepcopy(frozen)
+    deep["nested"]["b"].append(3)
+    assert type(deep["nested"]) is dict and type(deep["nested"]["b"]) is list
+    assert frozen["nested"]["b"] == [1, 2]
+
+    # Still JSON-encodable as a plain dict
+    assert json.loads(json.dumps(frozen)) == {"a": 1, "nested": {"b": [1, 2]}}
+
+
+def test_frozen_list_is_read_only():
+    frozen = freeze([1, {"a": 1}, [2]])
+    assert isinstance(frozen, FrozenList) and isinstance(frozen, list)
+    assert isinstance(frozen[1], FrozenDict) and isinstance(frozen[2], FrozenList)
+
+    mutations = [
+        lambda l: l.__setitem__(0, 9),
+        lambda l: l.__delitem__(0),
+        lambda l: l.append(4),
+        lambda l: l.extend([4]),
+        lambda l: l.insert(0, 4),
+        lambda l: l.pop(),
+        lambda l: l.remove(1),
+        lambda l: l.clear(),
+        lambda l: l.sort(),
+        lambda l: l.reverse(),
+        lambda l: l.__iadd__([4]),
+        lambda l: l.__imul__(2),
+    ]
+    for mutate in mutations:
+        with pytest.raises(TypeError):
+            mutate(frozen)
+    assert frozen == [1, {"a": 1}, [2]]
+
+    own = frozen.copy()
+    own.append(4)
+    assert type(own) is list and len(frozen) == 3
+
+    deep = copy.deepcopy(frozen)
+    deep[1]["a"] = 2
+    assert frozen[1]["a"] == 1
+
+
+def test_frozen_state_is_read_only_and_served_per_caller():
+    state = K9State(
+        user_query="q",
+        k9_command={"intent": "ANALYTICAL_QUERY"},
+        reasoning=["step"],
+        analysis={"ranking": [{"id": "R01"}]},
+    )
+    frozen = freeze_state(state)
+    assert isinstance(frozen, FrozenK9State)
+
+    with pytest.raises(Exception):
+        frozen.user_query = "other"
+    with pytest.raises(TypeError):
+        frozen.reasoning.append("more")
+    with pytest.raises(TypeError):
+        frozen.analysis["ranking"][0]["id"] = "R02"
+
+    served = serve_state(frozen, user_query="again")
+    assert served.user_query == "again"
+    assert frozen.user_query == "q"
+    assert served.analysis == {"ranking": [{"id": "R01"}]}
+
+    # The source state is untouched by freezing
+    state.reasoning.append("more")
+    assert frozen.reasoning == ["step"]
+
+
+# ------------------------------------------------------------
+# Invalidation on daily ingestion
+# ------------------------------------------------------------
+class _Report:
+    def to_dict(self):
+        return {"ingested": {"eventos": 1}}
+
+
+class _Ingestor:
+    def __init__(self):
+        self.batches = []
+
+    def ingest(self, batch):
+        self.batches.append(batch)
+        return _Report()
+
+
+def test_ingest_daily_invalidates_cached_results():
+    # app.k9_service imports the optional Neo4j driver at module level
+    pytest.importorskip("neo4j")
+    from app.k9_service import K9Service
+
+    service = K9Service.__new__(K9Service)
+    service.ingestor = _Ingestor()
+    service.results = ResultCache(maxsize=4)
+
+    key = _key()
+    service.results.put(key, freeze_state(K9State(user_query="q")))
+    assert service.results.get(key) is not None
+
+    batch = {"eventos": [{"id_evento": "E1"}]}
+    report = service.ingest_daily(batch)
+
+    assert report == {"ingested": {"eventos": 1}}
+    assert service.ingestor.batches == [batch]
+    assert service.results.get(key) is None
+    assert service.result_cache_stats()["size"] == 0
@@ -0,0 +1,85 @@
+"""
+Benchmark del ejecutor de planes compilados por intent (K9PlanExecutor)
+vs `graph.invoke` de LangGraph, sobre la misma tabla de nodos.
+
+Por intent: latencia mediana con memo de nodos (fase determinista ≈
+overhead de orquestación) y sin memo (nodos ejecutados completos).
+Verifica además que ambos produzcan el mismo estado final.
+
+Uso (desde k9_core/):
+    python scripts/bench_executor.py
+    python scripts/bench_executor.py --intents ANALYTICAL_QUERY ONTOLOGY_QUERY --repeat 50
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.graph.executor import K9PlanExecutor  # noqa: E402
+from src.graph.main_graph import build_k9_graph  # noqa: E402
+from src.graph.memoize import NodeMemoCache  # noqa: E402
+from src.state.fast_state import to_k9_state  # noqa: E402
+from src.state.state import K9State  # noqa: E402
+
+
+def make_state(intent: str) -> K9State:
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    return K9State(user_query="bench", k9_command=command, context_bundle={"k9_command": command})
+
+
+def dump(result) -> str:
+    return json.dumps(to_k9_state(result).model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def median_of(fn: Callable[[], object], repeat: int) -> float:
+    out: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return statistics.median(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--intents",
+        nargs="+",
+        default=["ANALYTICAL_QUERY", "OPERATIONAL_QUERY", "GREETING_QUERY", "ONTOLOGY_QUERY"],
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'intent':<20} {'memo':<5} {'nodos':>5} {'graph ms':>9} {'plan ms':>9} {'speedup':>8}")
+    for memoize in (True, False):
+        graph = build_k9_graph(memoize=memoize, memo_cache=NodeMemoCache(), parallel=False)
+        executor = K9PlanExecutor(memoize=memoize, memo_cache=NodeMemoCache(), fallback=graph)
+
+        for intent in args.intents:
+            # Warm-up (CSV en cache de proceso, memo poblada) + misma salida
+            if dump(graph.invoke(make_state(intent))) != dump(executor.invoke(make_state(intent))):
+                raise SystemExit(f"Estados finales distintos para {intent} (memo={memoize})")
+
+            t_graph = median_of(lambda: to_k9_state(graph.invoke(make_state(intent))), args.repeat)
+            t_plan = median_of(lambda: executor.invoke(make_state(intent)), args.repeat)
+            print(
+                f"{intent:<20} {'sí' if memoize else 'no':<5} {len(executor.plan(intent)):>5}"
+                f" {t_graph * 1e3:>9.2f} {t_plan * 1e3:>9.2f} {t_graph / t_plan:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark del grafo K9: data_engine → occ_enrichment en cadena vs ramas
+paralelas (mismo superstep, fan-in en evidence_join).
+
+Reporta la latencia extremo a extremo (sin memo de nodos) y el camino
+crítico de la etapa de evidencia: suma de ramas (secuencial) vs máximo.
+
+Uso (desde k9_core/):
+    python scripts/bench_graph_parallel.py
+    python scripts/bench_graph_parallel.py --intents ANALYTICAL_QUERY OPERATIONAL_QUERY --repeat 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.graph.main_graph import build_k9_graph  # noqa: E402
+from src.nodes.data_engine_node import data_engine_node  # noqa: E402
+from src.nodes.occ_enrichment_node import occ_enrichment_node  # noqa: E402
+from src.nodes.time_resolution_node import time_resolution_node  # noqa: E402
+from src.state.state import K9State  # noqa: E402
+
+
+def make_state(intent: str) -> K9State:
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    return K9State(user_query="bench", k9_command=command, context_bundle={"k9_command": command})
+
+
+def dump(result: Dict) -> str:
+    return json.dumps(K9State(**result).model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def timings(fn: Callable[[], object], repeat: int) -> List[float]:
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return out
+
+
+def branch_times(intent: str, repeat: int) -> Dict[str, float]:
+    """Mediana por rama, cada una con su propio contexto de datos (frío por request)."""
+    def run(node):
+        def once():
+            node(time_resolution_node(make_state(intent)))
+        return statistics.median(timings(once, repeat))
+
+    base = statistics.median(timings(lambda: time_resolution_node(make_state(intent)), repeat))
+    return {
+        "data_engine": run(data_engine_node) - base,
+        "occ_enrichment": run(occ_enrichment_node) - base,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--intents",
+        nargs="+",
+        default=["ANALYTICAL_QUERY", "OPERATIONAL_QUERY", "COMPARATIVE_QUERY"],
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    sequential = build_k9_graph(memoize=False, parallel=False)
+    parallel = build_k9_graph(memoize=False, parallel=True)
+
+    print(f"CPUs: {os.cpu_count()}  (con 1 CPU las ramas no pueden solaparse)")
+    print(
+        f"{'intent':<20} {'seq ms':>9} {'par ms':>9} {'speedup':>8}"
+        f" {'ramas Σ ms':>11} {'ramas max ms':>13}"
+    )
+    for intent in args.intents:
+        # Warm-up (parseo de CSV en el cache de proceso) + misma salida
+        if dump(sequential.invoke(make_state(intent))) != dump(parallel.invoke(make_state(intent))):
+            raise SystemExit(f"Estados finales distintos para {intent}")
+
+        seq = statistics.median(timings(lambda: sequential.invoke(make_state(intent)), args.repeat))
+        par = statistics.median(timings(lambda: parallel.invoke(make_state(intent)), args.repeat))
+        branches = branch_times(intent, args.repeat)
+        print(
+            f"{intent:<20} {seq * 1e3:>9.1f} {par * 1e3:>9.1f} {seq / par:>7.2f}x"
+            f" {sum(branches.values()) * 1e3:>11.1f} {max(branches.values()) * 1e3:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark del overhead de estado por nodo: K9State (pydantic, re-validado
+en cada nodo) vs K9FastState (dataclass con slots, validación en los bordes).
+
+1) Reconstrucción del estado en la entrada de un nodo (lo que LangGraph
+   hace con el esquema: `schema(**canales)`), sobre un estado real poblado
+   (analysis / risk_enrichment / narrative_context de un run completo).
+2) Micro: cadena de N nodos no-op (overhead total por nodo de LangGraph).
+3) Grafo K9 completo memoizado (fase determinista ≈ overhead del grafo).
+
+Uso (desde k9_core/):
+    python scripts/bench_state_modes.py
+    python scripts/bench_state_modes.py --nodes 50 --repeat 50
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from langgraph.graph import END, START, StateGraph
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.graph.main_graph import build_k9_graph  # noqa: E402
+from src.graph.memoize import NodeMemoCache  # noqa: E402
+from src.state.fast_state import K9FastState, _FIELDS, to_k9_state  # noqa: E402
+from src.state.state import K9State  # noqa: E402
+
+
+def make_state(intent: str) -> K9State:
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    return K9State(user_query="bench", k9_command=command, context_bundle={"k9_command": command})
+
+
+def chain(schema: type, n_nodes: int):
+    """START → n nodos no-op → END."""
+    graph = StateGraph(schema)
+
+    def noop(state):
+        state.reasoning.append("noop")
+        return state
+
+    names = [f"n{i}" for i in range(n_nodes)]
+    for name in names:
+        graph.add_node(name, noop)
+    for src, dst in zip([START, *names], [*names, END]):
+        graph.add_edge(src, dst)
+    return graph.compile()
+
+
+def median_of(fn: Callable[[], object], repeat: int) -> float:
+    out: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return statistics.median(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--intent", default="OPERATIONAL_QUERY")
+    args = parser.parse_args()
+
+    # Estado realista: salida completa del grafo (sin el contexto de datos)
+    populated = to_k9_state(build_k9_graph(memoize=False).invoke(make_state(args.intent)))
+    populated = populated.model_copy(update={"data_context": None})
+
+    channels = {name: getattr(populated, name) for name in _FIELDS}
+    print("Entrada de nodo: schema(**canales)")
+    print(f"{'modo':<12} {'µs':>10}")
+    for label, schema in (("pydantic", K9State), ("fast", K9FastState)):
+        t = median_of(lambda: [schema(**channels) for _ in range(1000)], args.repeat) / 1000
+        print(f"{label:<12} {t * 1e6:>10.2f}")
+    print()
+
+    print(f"Micro: cadena de {args.nodes} nodos no-op (estado poblado)")
+    print(f"{'modo':<12} {'total ms':>10} {'µs/nodo':>10}")
+    per_node = {}
+    for label, schema in (("pydantic", K9State), ("fast", K9FastState)):
+        graph = chain(schema, args.nodes)
+        total = median_of(lambda: graph.invoke(populated), args.repeat)
+        per_node[label] = total / args.nodes
+        print(f"{label:<12} {total * 1e3:>10.2f} {per_node[label] * 1e6:>10.1f}")
+    print(f"overhead/nodo pydantic ÷ fast: {per_node['pydantic'] / per_node['fast']:.2f}x\n")
+
+    print(f"Grafo K9 memoizado ({args.intent}, salida validada con to_k9_state)")
+    print(f"{'modo':<12} {'ms':>10}")
+    outputs = {}
+    for label, fast in (("pydantic", False), ("fast", True)):
+        graph = build_k9_graph(memo_cache=NodeMemoCache(), fast_state=fast)
+        outputs[label] = json.dumps(
+            to_k9_state(graph.invoke(make_state(args.intent))).model_dump(mode="json"),
+            sort_keys=True,
+            default=str,
+        )
+        t = median_of(lambda: to_k9_state(graph.invoke(make_state(args.intent))), args.repeat)
+        print(f"{label:<12} {t * 1e3:>10.2f}")
+    if outputs["pydantic"] != outputs["fast"]:
+        raise SystemExit("Estados finales distintos entre modos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark del ranking semanal de weekly_signals (ruta CRITICAL_MONDAY):
+implementación por filas (iterrows + sort) vs matriz semana × riesgo vectorizada.
+
+Uso (desde k9_core/):
+    python scripts/bench_weekly_signals.py
+    python scripts/bench_weekly_signals.py --risks 3 50 500 --weeks 12 52 500 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.scenarios.signals import weekly_signals_from_trajectories  # noqa: E402
+
+
+def legacy_weekly_signals(df_tray: pd.DataFrame) -> Dict[str, Dict]:
+    """Implementación previa (referencia de resultados y tiempos)."""
+    risk_cols = [c for c in df_tray.columns if c.startswith("criticidad_") and c.endswith("_media") and c != "criticidad_global_media"]
+    risks = [c.replace("criticidad_", "").replace("_media", "") for c in risk_cols]
+
+    df_sorted = df_tray.sort_values("semana").reset_index(drop=True)
+    ranks_by_risk: Dict[str, List[int]] = {rid: [] for rid in risks}
+
+    for _, row in df_sorted.iterrows():
+        vals = []
+        for rid in risks:
+            col = f"criticidad_{rid}_media"
+            vals.append((rid, float(row.get(col, 0) or 0)))
+        vals.sort(key=lambda x: x[1], reverse=True)
+        for pos, (rid, _) in enumerate(vals, start=1):
+            ranks_by_risk[rid].append(pos)
+
+    signals: Dict[str, Dict] = {}
+    for rid in risks:
+        col = f"criticidad_{rid}_media"
+        values = [float(v) for v in df_sorted[col].tolist()]
+        if not values:
+            continue
+        rp = ranks_by_risk.get(rid, [])
+        signals[rid] = {
+            "avg_criticidad": float(sum(values) / len(values)),
+            "avg_rank_pos": float(sum(rp) / len(rp)) if rp else None,
+            "top3_weeks": int(sum(1 for x in rp if x <= 3)),
+            "weeks_considered": int(len(values)),
+        }
+    return signals
+
+
+def make_trajectories(n_risks: int, n_weeks: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Redondeo a 2 decimales → empates frecuentes (ejercita el orden estable)
+    values = rng.random((n_weeks, n_risks)).round(2)
+    df = pd.DataFrame(values, columns=[f"criticidad_R{i:03d}_media" for i in range(1, n_risks + 1)])
+    df.insert(0, "semana", np.arange(n_weeks, 0, -1))
+    df["criticidad_global_media"] = values.mean(axis=1)
+    return df
+
+
+def best_of(fn, df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--risks", type=int, nargs="+", default=[3, 50, 500])
+    parser.add_argument("--weeks", type=int, nargs="+", default=[12, 52, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'riesgos':>8} {'semanas':>8} {'legacy ms':>12} {'vector ms':>12} {'speedup':>9}")
+    for n_risks in args.risks:
+        for n_weeks in args.weeks:
+            df = make_trajectories(n_risks, n_weeks)
+            if legacy_weekly_signals(df) != weekly_signals_from_trajectories(df):
+                raise SystemExit(f"Resultados distintos para {n_risks} riesgos × {n_weeks} semanas")
+
+            legacy = best_of(legacy_weekly_signals, df, args.repeat)
+            vector = best_of(weekly_signals_from_trajectories, df, args.repeat)
+            print(
+                f"{n_risks:>8} {n_weeks:>8} {legacy * 1e3:>12.2f} "
+                f"{vector * 1e3:>12.2f} {legacy / vector:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
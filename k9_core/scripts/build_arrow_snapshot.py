@@ -0,0 +1,37 @@
+"""
+Construye un snapshot Arrow IPC versionado de los datasets STDE.
+
+Uso (desde k9_core/):
+    python scripts/build_arrow_snapshot.py
+    python scripts/build_arrow_snapshot.py --source data/synthetic --out data/snapshots
+
+Luego activar el modo snapshot del DataManager con:
+    K9_DATA_SNAPSHOT_DIR=data/snapshots
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.data.arrow_snapshot import ArrowSnapshot, build_snapshot  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", default=str(ROOT / "data" / "synthetic"))
+    parser.add_argument("--out", default=str(ROOT / "data" / "snapshots"))
+    args = parser.parse_args()
+
+    snapshot_dir = build_snapshot(args.source, args.out)
+    snapshot = ArrowSnapshot(snapshot_dir)
+
+    print(f"Snapshot {snapshot.version} → {snapshot_dir}")
+    for name, entry in sorted(snapshot.manifest["datasets"].items()):
+        print(f"  {name:<45} {entry['rows']:>8} filas")
+
+
+if __name__ == "__main__":
+    main()
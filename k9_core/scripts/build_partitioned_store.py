@@ -0,0 +1,37 @@
+"""
+Construye el store Parquet particionado por semana (observaciones, eventos,
+auditorías e incidentes).
+
+Uso (desde k9_core/):
+    python scripts/build_partitioned_store.py
+    python scripts/build_partitioned_store.py --source data/synthetic --out data/partitioned
+
+Luego activar la poda de particiones del DataManager con:
+    K9_DATA_PARTITIONED_DIR=data/partitioned
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.data.partitioned_store import build_partitioned_store  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", default=str(ROOT / "data" / "synthetic"))
+    parser.add_argument("--out", default=str(ROOT / "data" / "partitioned"))
+    args = parser.parse_args()
+
+    written = build_partitioned_store(args.source, args.out)
+
+    print(f"Store particionado → {args.out}")
+    for name, weeks in written.items():
+        print(f"  {name:<35} {len(weeks):>4} particiones (semanas {weeks[0]}–{weeks[-1]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Genera un dataset STDE v3 sintético escalado (N sitios × M semanas × K riesgos)
+para pruebas de carga.
+
+Uso (desde k9_core/):
+    python scripts/generate_stde.py --sites 10
+    python scripts/generate_stde.py --sites 1000 --weeks 52 --risks 10 --seed 7 \
+        --out data/generated/synthetic --partitioned data/generated/partitioned
+
+Luego apuntar el DataManager al resultado, p.ej. vía snapshot:
+    python scripts/build_arrow_snapshot.py --source data/generated/synthetic --out data/generated/snapshots
+    K9_DATA_SNAPSHOT_DIR=data/generated/snapshots K9_DATA_PARTITIONED_DIR=data/generated/partitioned
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.data.synthetic_generator import DEFAULT_OMS_PATH, STDEGenerator  # noqa: E402
+
+
+def _risks(value: str):
+    return int(value) if value.isdigit() else [r.strip() for r in value.split(",") if r.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sites", type=int, default=1)
+    parser.add_argument("--weeks", type=int, default=None)
+    parser.add_argument("--risks", type=_risks, default=None, help="K o lista R01,R02,...")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--oms", default=str(DEFAULT_OMS_PATH))
+    parser.add_argument("--out", default=str(ROOT / "data" / "generated" / "synthetic"))
+    parser.add_argument("--partitioned", default=str(ROOT / "data" / "generated" / "partitioned"))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = STDEGenerator(args.oms).generate(args.sites, args.weeks, args.risks, args.seed)
+    generated = time.perf_counter() - start
+    summary = dataset.write(args.out, args.partitioned or None)
+    written = time.perf_counter() - start - generated
+
+    print(
+        f"STDE sintético → {summary['out_dir']} "
+        f"({dataset.n_sites} sitios × {dataset.n_weeks} semanas × {len(dataset.risks)} riesgos, "
+        f"seed={dataset.seed})"
+    )
+    for name, rows in summary["rows"].items():
+        parts = summary["partitions"].get(name)
+        suffix = f"  [{parts} particiones]" if parts else ""
+        print(f"  {name:<35} {rows:>10} filas{suffix}")
+    if summary["copied"]:
+        print(f"  + {len(summary['copied'])} datasets copiados del template")
+    print(f"Generación {generated:.2f}s · escritura {written:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+# src/data/analytical_cube.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data.time_dimension import WEEK_KEY
+from src.time.data_slice import DataSlice
+
+
+# Ejes del cubo (orden fijo de las dimensiones del arreglo)
+CUBE_DIMENSIONS: Tuple[str, ...] = ("week", "risk", "area", "type")
+
+# Miembro para valores nulos (p.ej. observaciones OPG sin riesgo)
+MISSING_MEMBER = "N/A"
+
+# Medidas implícitas: conteo de filas
+COUNT_MEASURE = "count"
+
+# Fuente lógica: tabla unificada de observaciones (baseline + STDE 12s)
+OBSERVACIONES_UNIFICADAS = "observaciones_unificadas"
+
+_Selection = Union[None, Any, Sequence[Any]]
+
+
+@dataclass(frozen=True)
+class CubeSpec:
+    """
+    Declaración de un cubo: dataset fuente, columna de cada dimensión y
+    medidas numéricas (sumas; la media se obtiene como suma / conteo).
+    """
+
+    entity: str
+    dataset: str
+    columns: Mapping[str, str]
+    measures: Tuple[str, ...] = field(default_factory=tuple)
+
+
+CUBE_SPECS: Dict[str, CubeSpec] = {
+    "observations": CubeSpec(
+        entity="observations",
+        dataset=OBSERVACIONES_UNIFICADAS,
+        columns={"week": WEEK_KEY, "risk": "riesgo_id", "area": "id_area", "type": "tipo_observacion"},
+    ),
+    "events": CubeSpec(
+        entity="events",
+        dataset="stde_eventos.csv",
+        columns={"week": WEEK_KEY, "risk": "riesgo_id", "area": "id_area", "type": "tipo_evento"},
+        measures=("criticidad",),
+    ),
+    "audits": CubeSpec(
+        entity="audits",
+        dataset="stde_auditorias.csv",
+        columns={"week": WEEK_KEY, "risk": "riesgo_focal", "area": "id_area", "type": "tipo_auditoria"},
+    ),
+}
+
+
+def _members(values: pd.Series, is_week: bool) -> Tuple[np.ndarray, np.ndarray]:
+    # Códigos densos 0..k-1 por dimensión; nulos → MISSING_MEMBER (al final)
+    codes, uniques = pd.factorize(values, sort=True)
+    members = np.asarray(uniques, dtype=np.int64 if is_week else object)
+    if not is_week:
+        members = np.array([str(m) for m in members], dtype=object)
+    if (codes < 0).any():
+        members = np.append(members, MISSING_MEMBER)
+        codes = np.where(codes < 0, len(members) - 1, codes)
+    return codes, members
+
+
+def _dimension_values(spec: CubeSpec, dim: str, df: pd.DataFrame) -> pd.Series:
+    column = spec.columns[dim]
+    if column in df.columns:
+        return df[column]
+    return pd.Series([None] * len(df), index=df.index)
+
+
+def _merge_members(
+    old: np.ndarray, values: pd.Series, is_week: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Une los miembros existentes con los de `values` (mismo orden que
+    `_members` sobre los datos completos). Retorna (posición nueva de cada
+    miembro existente, códigos de `values`, miembros).
+    """
+    has_missing = len(old) > 0 and not is_week and old[-1] == MISSING_MEMBER
+    present = old[:-1] if has_missing else old
+    prior = pd.Series(present).astype(values.dtype)
+    parts = [prior, values.reset_index(drop=True)]
+    if has_missing:
+        parts.append(pd.Series([None], dtype=values.dtype))
+    combined = pd.concat(parts, ignore_index=True)
+
+    codes, members = _members(combined, is_week)
+    n = len(present)
+    positions = codes[:n] if not has_missing else np.append(codes[:n], codes[-1])
+    return positions, codes[n : n + len(values)], members
+
+
+class AnalyticalCube:
+    """
+    Cubo pre-agregado semana × riesgo × área × tipo sobre un dataset de hechos.
+
+    - Arreglo denso de conteos (+ una suma y un conteo no-nulo por medida)
+    - Cualquier combinación de slice / rollup se resuelve con indexación
+      y sumas sobre ejes, sin volver a recorrer filas
+    - Miembros en orden de catálogo (categóricos) o natural; la semana usa
+      `semana_ord` (un DataSlice es un rango de posiciones sobre sus semanas)
+
+    Inmutable: se construye una vez por versión del dataset.
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        members: Dict[str, np.ndarray],
+        counts: np.ndarray,
+        sums: Dict[str, np.ndarray],
+        non_null: Dict[str, np.ndarray],
+        dtypes: Optional[Dict[str, Any]] = None,
+    ):
+        self.entity = entity
+        self.members = members
+        self.counts = counts
+        self._sums = sums
+        self._non_null = non_null
+        # dtype de origen por dimensión (orden de miembros al extender)
+        self.dtypes = dtypes or {}
+        self._positions = {
+            dim: {m: i for i, m in enumerate(values.tolist())} for dim, values in members.items()
+        }
+
+    # ---------- Construcción ----------
+
+    @classmethod
+    def build(cls, spec: CubeSpec, df: pd.DataFrame) -> "AnalyticalCube":
+        codes: List[np.ndarray] = []
+        members: Dict[str, np.ndarray] = {}
+        dtypes: Dict[str, Any] = {}
+        for dim in CUBE_DIMENSIONS:
+            values = _dimension_values(spec, dim, df)
+            dim_codes, dim_members = _members(values, is_week=(dim == "week"))
+            codes.append(dim_codes)
+            members[dim] = dim_members
+            dtypes[dim] = values.dtype
+
+        shape = tuple(len(members[d]) for d in CUBE_DIMENSIONS)
+        size = int(np.prod(shape))
+        flat = np.ravel_multi_index(codes, shape) if len(df) else np.empty(0, dtype=np.intp)
+
+        counts = np.bincount(flat, minlength=size).reshape(shape)
+        sums: Dict[str, np.ndarray] = {}
+        non_null: Dict[str, np.ndarray] = {}
+        for measure in spec.measures:
+            values = pd.to_numeric(df[measure], errors="coerce").to_numpy(dtype=np.float64)
+            present = ~np.isnan(values)
+            sums[measure] = np.bincount(
+                flat[present], weights=values[present], minlength=size
+            ).reshape(shape)
+            non_null[measure] = np.bincount(flat[present], minlength=size).reshape(shape)
+
+        return cls(spec.entity, members, counts, sums, non_null, dtypes)
+
+    def extend(self, spec: CubeSpec, df: pd.DataFrame) -> "AnalyticalCube":
+        """
+        Cubo con las filas nuevas `df` sumadas celda a celda (ingesta diaria):
+        mismo resultado que `build` sobre los datos completos, sin volver a
+        recorrer el histórico. Miembros nuevos expanden los ejes en el orden
+        que usaría `build`.
+
+        ValueError si las filas no calzan con el dtype de una dimensión
+        (el llamador debe reconstruir el cubo).
+        """
+        if df.empty:
+            return self
+
+        codes: List[np.ndarray] = []
+        old_positions: List[np.ndarray] = []
+        members: Dict[str, np.ndarray] = {}
+        for dim in CUBE_DIMENSIONS:
+            values = _dimension_values(spec, dim, df)
+            dtype = self.dtypes.get(dim)
+            if dtype is not None and values.dtype != dtype:
+                cast = values.astype(dtype)
+                if (cast.isna() & values.notna()).any():
+                    raise ValueError(f"AnalyticalCube: valores fuera del dtype de '{dim}'")
+                values = cast
+            positions, dim_codes, dim_members = _merge_members(
+                self.members[dim], values, is_week=(dim == "week")
+            )
+            old_positions.append(positions)
+            codes.append(dim_codes)
+            members[dim] = dim_members
+
+        shape = tuple(len(members[d]) for d in CUBE_DIMENSIONS)
+        size = int(np.prod(shape))
+        old_cells = np.ix_(*old_positions)
+        flat = np.ravel_multi_index(codes, shape)
+
+        def grow(old: np.ndarray, delta: np.ndarray) -> np.ndarray:
+            out = np.zeros(shape, dtype=old.dtype)
+            out[old_cells] = old
+            out += delta.reshape(shape).astype(old.dtype)
+            return out
+
+        counts = grow(self.counts, np.bincount(flat, minlength=size))
+        sums: Dict[str, np.ndarray] = {}
+        non_null: Dict[str, np.ndarray] = {}
+        for measure in spec.measures:
+            values = pd.to_numeric(df[measure], errors="coerce").to_numpy(dtype=np.float64)
+            present = ~np.isnan(values)
+            sums[measure] = grow(
+                self._sums[measure],
+                np.bincount(flat[present], weights=values[present], minlength=size),
+            )
+            non_null[measure] = grow(
+                self._non_null[measure], np.bincount(flat[present], minlength=size)
+            )
+
+        return AnalyticalCube(self.entity, members, counts, sums, non_null, dict(self.dtypes))
+
+    # ---------- Selección ----------
+
+    @property
+    def measures(self) -> Tuple[str, ...]:
+        return (COUNT_MEASURE, *self._sums)
+
+    @property
+    def weeks(self) -> List[int]:
+        return [int(w) for w in self.members["week"]]
+
+    def week_positions(self, data_slice: Optional[DataSlice] = None) -> Tuple[int, int]:
+        """Rango [i, j) de posiciones de semana para el DataSlice."""
+        n_weeks = len(self.members["week"])
+        if data_slice is None or data_slice.is_full():
+            return 0, n_weeks
+        data_slice.validate()
+        if data_slice.end > n_weeks:
+            raise ValueError(
+                f"AnalyticalCube: DataSlice {data_slice.start}:{data_slice.end} "
+                f"fuera de rango para total_weeks={n_weeks}."
+            )
+        return data_slice.start, data_slice.end
+
+    def _index(self, dim: str, selection: _Selection) -> np.ndarray:
+        if selection is None:
+            return np.arange(len(self.members[dim]))
+        if isinstance(selection, (str, int, np.integer)):
+            selection = [selection]
+        positions = self._positions[dim]
+        key = int if dim == "week" else str
+        return np.array(
+            sorted({positions[key(v)] for v in selection if key(v) in positions}), dtype=np.intp
+        )
+
+    def _select(
+        self,
+        array: np.ndarray,
+        filters: Mapping[str, _Selection],
+        data_slice: Optional[DataSlice],
+    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+        unknown = set(filters) - set(CUBE_DIMENSIONS)
+        if unknown:
+            raise KeyError(f"AnalyticalCube: dimensiones desconocidas {sorted(unknown)}")
+
+        index = [self._index(dim, filters.get(dim)) for dim in CUBE_DIMENSIONS]
+        i, j = self.week_positions(data_slice)
+        index[0] = index[0][(index[0] >= i) & (index[0] < j)]
+        return array[np.ix_(*index)], index
+
+    # ---------- Agregación ----------
+
+    def aggregate(
+        self,
+        measure: str = COUNT_MEASURE,
+        agg: str = "sum",
+        filters: Optional[Mapping[str, _Selection]] = None,
+        group_by: Sequence[str] = (),
+        data_slice: Optional[DataSlice] = None,
+    ) -> Union[float, pd.Series]:
+        """
+        Agrega `measure` sobre el slice (`filters` por dimensión + DataSlice
+        sobre semanas) y hace rollup de las dimensiones fuera de `group_by`.
+
+        - measure="count", agg="sum" → número de filas
+        - measure=<medida>, agg="sum" | "mean" (media ponderada por filas no nulas)
+        Retorna un escalar sin `group_by`, o una Series indexada por los
+        miembros de `group_by` (solo grupos con filas).
+        """
+        filters = filters or {}
+        group_by = tuple(group_by)
+        unknown = set(group_by) - set(CUBE_DIMENSIONS)
+        if unknown:
+            raise KeyError(f"AnalyticalCube: dimensiones desconocidas {sorted(unknown)}")
+        if agg not in ("sum", "mean"):
+            raise ValueError(f"AnalyticalCube: agregación no soportada '{agg}'")
+        if measure != COUNT_MEASURE and measure not in self._sums:
+            raise KeyError(f"AnalyticalCube: medida desconocida '{measure}' para {self.entity}")
+        if measure == COUNT_MEASURE and agg != "sum":
+            raise ValueError("AnalyticalCube: el conteo solo admite agg='sum'")
+
+        rollup = tuple(a for a, d in enumerate(CUBE_DIMENSIONS) if d not in group_by)
+        counts, index = self._select(self.counts, filters, data_slice)
+        counts = counts.sum(axis=rollup)
+
+        if measure == COUNT_MEASURE:
+            values = counts
+        else:
+            sums = self._select(self._sums[measure], filters, data_slice)[0].sum(axis=rollup)
+            if agg == "sum":
+                values = sums
+            else:
+                weights = self._select(self._non_null[measure], filters, data_slice)[0].sum(axis=rollup)
+                values = np.where(weights > 0, sums / np.maximum(weights, 1), np.nan)
+
+        if not group_by:
+            return int(values) if measure == COUNT_MEASURE else float(values)
+
+        # Orden de los ejes resultantes = orden de CUBE_DIMENSIONS
+        kept = [d for d in CUBE_DIMENSIONS if d in group_by]
+        labels = [self.members[d][index[CUBE_DIMENSIONS.index(d)]] for d in kept]
+        grid = pd.MultiIndex.from_product(labels, names=kept)
+        series = pd.Series(np.ravel(values), index=grid)
+        series = series[np.ravel(counts) > 0]
+        if list(group_by) != kept:
+            series = series.reorder_levels(list(group_by))
+        if len(group_by) == 1:
+            series.index = series.index.get_level_values(0)
+        return series
+
+    def to_records(
+        self,
+        result: Union[float, pd.Series],
+        value_name: str = "value",
+    ) -> Union[float, List[Dict[str, Any]]]:
+        """Serializa el resultado de `aggregate` para el estado (JSON)."""
+        if not isinstance(result, pd.Series):
+            return result
+        names = list(result.index.names)
+        records = []
+        for key, value in result.items():
+            key = key if isinstance(key, tuple) else (key,)
+            record = {n: (k.item() if isinstance(k, np.generic) else k) for n, k in zip(names, key)}
+            record[value_name] = value.item() if isinstance(value, np.generic) else value
+            records.append(record)
+        return records
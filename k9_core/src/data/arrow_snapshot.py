@@ -0,0 +1,461 @@
+# src/data/arrow_snapshot.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.types as pat
+
+from src.data.atomic_io import atomic_write_text
+from src.data.config import get_data_settings
+from src.data.dtype_registry import DtypeRegistry, get_dtype_registry
+from src.data.time_dimension import (
+    DAY_KEY,
+    MISSING_ORDINAL,
+    TIME_DOMAIN_COLUMNS,
+    WEEK_KEY,
+    TimeDimension,
+    describe_time_domain,
+    needs_dimension,
+    normalize_time_keys,
+)
+
+
+MANIFEST_FILENAME = "manifest.json"
+CURRENT_POINTER = "CURRENT"
+# v2: frames guardados ya normalizados (claves temporales int32 + IDs
+# categóricos); v1 (frames crudos) se sigue leyendo
+SNAPSHOT_FORMAT = "arrow-ipc/v2"
+SUPPORTED_FORMATS = ("arrow-ipc/v1", SNAPSHOT_FORMAT)
+
+# Datasets no-CSV que también forman parte del snapshot
+EXTRA_DATASETS = ("k9_weekly_signals.parquet",)
+
+
+def source_stat(path: Path) -> Tuple[int, int]:
+    """Huella barata de una fuente: (mtime_ns, size)."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass(frozen=True)
+class AppendedRows:
+    """
+    Filas agregadas al final de una fuente (ingesta diaria).
+
+    `previous_stat` es la huella del archivo ANTES del append: el snapshot
+    previo solo se extiende si fue construido sobre ese mismo archivo.
+    `rows` son las filas tal como las lee `_read_source`.
+    """
+    previous_stat: Tuple[int, int]
+    rows: pd.DataFrame
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_source(path: Path) -> pd.DataFrame:
+    # Mismo parseo que DataManager → el snapshot es intercambiable con la fuente
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _normalize_source(
+    df: pd.DataFrame,
+    dimension: Optional[TimeDimension],
+    dtypes: Optional[DtypeRegistry],
+) -> pd.DataFrame:
+    # Mismo pipeline que DataManager._normalize, pagado al construir
+    df = normalize_time_keys(df, dimension if needs_dimension(df.columns) else None)
+    return dtypes.apply(df) if dtypes is not None else df
+
+
+def _dictionaries_digest(dtypes: DtypeRegistry) -> str:
+    categories = {d: list(map(str, t.categories)) for d, t in sorted(dtypes.dtypes.items())}
+    return hashlib.sha256(json.dumps(categories).encode("utf-8")).hexdigest()
+
+
+def list_source_datasets(source_dir: Path) -> List[Path]:
+    sources = sorted(source_dir.glob("*.csv"))
+    for name in EXTRA_DATASETS:
+        p = source_dir / name
+        if p.exists():
+            sources.append(p)
+    return sources
+
+
+def _snapshot_version(
+    digests: Dict[str, str], normalized: Dict[str, bool], dictionaries: Optional[str]
+) -> str:
+    fingerprint = {"sources": digests, "normalized": normalized, "dictionaries": dictionaries}
+    return hashlib.sha256(
+        json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+
+
+def _write_table(path: Path, table: pa.Table) -> None:
+    # IPC sin compresión → los buffers se pueden mapear tal cual
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _table_time_domain(table: pa.Table) -> Optional[Dict[str, Any]]:
+    # Solo columnas temporales crudas (se conservan junto a las claves int32)
+    columns = [c for c in TIME_DOMAIN_COLUMNS if c in table.column_names]
+    return describe_time_domain(table.select(columns).to_pandas())
+
+
+def _convert_dataset(
+    path: Path,
+    snapshot_dir: Path,
+    dimension: Optional[TimeDimension],
+    dtypes: Optional[DtypeRegistry],
+) -> Tuple[str, pa.Table, Optional[Dict[str, Any]]]:
+    df = _read_source(path)
+    # Dominio temporal precalculado: metadatos sin leer filas
+    time_domain = describe_time_domain(df)
+    df = _normalize_source(df, dimension, dtypes)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    arrow_name = f"datasets/{path.stem}.arrow"
+    _write_table(snapshot_dir / arrow_name, table)
+    return arrow_name, table, time_domain
+
+
+def _dataset_entry(
+    arrow_name: str,
+    table: pa.Table,
+    digest: str,
+    stat: Tuple[int, int],
+    time_domain: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        "file": arrow_name,
+        "rows": int(table.num_rows),
+        "columns": table.column_names,
+        "source_sha256": digest,
+        "source_stat": list(stat),
+        "time": time_domain,
+    }
+
+
+def _publish(
+    out_root: Path,
+    snapshot_dir: Path,
+    version: str,
+    source_dir: Path,
+    normalized: Dict[str, bool],
+    dictionaries: Optional[str],
+    datasets: Dict[str, Dict[str, Any]],
+) -> None:
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "source_dir": str(source_dir),
+        "normalized": normalized,
+        "dictionaries": dictionaries,
+        "datasets": datasets,
+    }
+    atomic_write_text(
+        snapshot_dir / MANIFEST_FILENAME, json.dumps(manifest, ensure_ascii=False, indent=2)
+    )
+    # Publicación atómica: los lectores toman CURRENT completo
+    atomic_write_text(out_root / CURRENT_POINTER, version)
+
+
+def build_snapshot(
+    source_dir: str | Path,
+    out_root: str | Path,
+    categorical_ids: Optional[bool] = None,
+) -> Path:
+    """
+    Convierte los datasets STDE de `source_dir` en un snapshot Arrow IPC
+    versionado bajo `out_root/<version>/` y actualiza `out_root/CURRENT`.
+
+    Los frames se guardan normalizados (claves `dia_ord` / `semana_ord`
+    int32 y, con `categorical_ids`, IDs como diccionarios Arrow con los
+    códigos globales del DtypeRegistry): la lectura no vuelve a parsear
+    fechas ni a convertir columnas. `categorical_ids=None` → configuración del proceso.
+
+    La versión es un hash del contenido de las fuentes y de la
+    normalización: reconstruir sin cambios reutiliza el mismo directorio.
+    """
+    source_dir = Path(source_dir)
+    out_root = Path(out_root)
+
+    sources = list_source_datasets(source_dir)
+    if not sources:
+        raise FileNotFoundError(f"Sin datasets en {source_dir}")
+
+    if categorical_ids is None:
+        categorical_ids = get_data_settings().categorical_ids
+    dtypes = get_dtype_registry() if categorical_ids else None
+    dates = source_dir / "dates.csv"
+    dimension = TimeDimension(pd.read_csv(dates)) if dates.exists() else None
+
+    normalized = {"time_keys": True, "categorical_ids": bool(categorical_ids)}
+    dictionaries = _dictionaries_digest(dtypes) if dtypes is not None else None
+    # Huella (mtime, size) ANTES del hash: permite reusar el dataset en `update_snapshot`
+    stats = {p.name: source_stat(p) for p in sources}
+    digests = {p.name: _file_digest(p) for p in sources}
+    version = _snapshot_version(digests, normalized, dictionaries)
+
+    snapshot_dir = out_root / version
+    (snapshot_dir / "datasets").mkdir(parents=True, exist_ok=True)
+
+    datasets: Dict[str, Dict[str, Any]] = {}
+    for path in sources:
+        arrow_name, table, time_domain = _convert_dataset(path, snapshot_dir, dimension, dtypes)
+        datasets[path.name] = _dataset_entry(
+            arrow_name, table, digests[path.name], stats[path.name], time_domain
+        )
+
+    _publish(out_root, snapshot_dir, version, source_dir, normalized, dictionaries, datasets)
+    return snapshot_dir
+
+
+def update_snapshot(
+    source_dir: str | Path,
+    out_root: str | Path,
+    appended: Mapping[str, AppendedRows],
+    categorical_ids: Optional[bool] = None,
+) -> Path:
+    """
+    Publica una versión nueva del snapshot a partir de CURRENT, convirtiendo
+    solo lo que cambió en `source_dir`:
+
+    - Fuente con la misma huella (mtime, size) → se enlaza el archivo Arrow
+      de la versión previa (sin leer ni convertir)
+    - Fuente en `appended` cuya huella previa es la del snapshot → tabla
+      previa (memory-map) + filas nuevas normalizadas
+    - Cualquier otro cambio → conversión completa de ese dataset
+
+    Misma versión y mismos frames que `build_snapshot` sobre las fuentes
+    actuales. Sin snapshot previo compatible → `build_snapshot`.
+    """
+    source_dir = Path(source_dir)
+    out_root = Path(out_root)
+
+    if categorical_ids is None:
+        categorical_ids = get_data_settings().categorical_ids
+    dtypes = get_dtype_registry() if categorical_ids else None
+    normalized = {"time_keys": True, "categorical_ids": bool(categorical_ids)}
+    dictionaries = _dictionaries_digest(dtypes) if dtypes is not None else None
+
+    try:
+        previous = ArrowSnapshot(out_root)
+    except (FileNotFoundError, ValueError):
+        return build_snapshot(source_dir, out_root, categorical_ids)
+    if (
+        previous.manifest.get("format") != SNAPSHOT_FORMAT
+        or previous.manifest.get("source_dir") != str(source_dir)
+        or previous.normalized != normalized
+        or previous.manifest.get("dictionaries") != dictionaries
+        or "dates.csv" not in previous.manifest["datasets"]
+    ):
+        return build_snapshot(source_dir, out_root, categorical_ids)
+
+    sources = list_source_datasets(source_dir)
+    if not sources:
+        raise FileNotFoundError(f"Sin datasets en {source_dir}")
+    entries: Dict[str, Dict[str, Any]] = previous.manifest["datasets"]
+
+    stats = {p.name: source_stat(p) for p in sources}
+    unchanged = {
+        p.name
+        for p in sources
+        if p.name in entries and entries[p.name].get("source_stat") == list(stats[p.name])
+    }
+    digests = {
+        p.name: entries[p.name]["source_sha256"] if p.name in unchanged else _file_digest(p)
+        for p in sources
+    }
+    version = _snapshot_version(digests, normalized, dictionaries)
+
+    snapshot_dir = out_root / version
+    if (snapshot_dir / MANIFEST_FILENAME).exists():
+        # Contenido ya publicado (p.ej. ingesta sin cambios efectivos)
+        atomic_write_text(out_root / CURRENT_POINTER, version)
+        return snapshot_dir
+    (snapshot_dir / "datasets").mkdir(parents=True, exist_ok=True)
+
+    dates = source_dir / "dates.csv"
+    dimension = TimeDimension(pd.read_csv(dates)) if dates.exists() else None
+    calendar_changed = "dates.csv" not in unchanged
+
+    datasets: Dict[str, Dict[str, Any]] = {}
+    for path in sources:
+        name = path.name
+        entry = entries.get(name)
+        previous_path = previous.root / entry["file"] if entry is not None else None
+
+        reusable = name in unchanged and not (
+            calendar_changed and _has_unresolved_keys(previous_path)
+        )
+        if reusable:
+            _link(previous_path, snapshot_dir / entry["file"])
+            datasets[name] = {**entry, "source_stat": list(stats[name])}
+            continue
+
+        table = None
+        append = appended.get(name)
+        if (
+            append is not None
+            and entry is not None
+            and entry.get("source_stat") == list(append.previous_stat)
+            and not (calendar_changed and _has_unresolved_keys(previous_path))
+        ):
+            table = _append_rows(previous_path, append.rows, dimension, dtypes)
+
+        if table is not None:
+            arrow_name = entry["file"]
+            _write_table(snapshot_dir / arrow_name, table)
+            time_domain = _table_time_domain(table)
+        else:
+            arrow_name, table, time_domain = _convert_dataset(path, snapshot_dir, dimension, dtypes)
+        datasets[name] = _dataset_entry(arrow_name, table, digests[name], stats[name], time_domain)
+
+    _publish(out_root, snapshot_dir, version, source_dir, normalized, dictionaries, datasets)
+    return snapshot_dir
+
+
+def _link(src: Path, dst: Path) -> None:
+    # Hard link: mismo archivo (y mismas páginas en el page cache); copia si no se puede
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _has_unresolved_keys(path: Path) -> bool:
+    # Calendario extendido: solo cambian las filas cuya clave temporal no resolvía
+    table = ArrowSnapshot.read_table(path)
+    for column in (DAY_KEY, WEEK_KEY):
+        if column in table.column_names:
+            if pc.any(pc.equal(table.column(column), MISSING_ORDINAL)).as_py():
+                return True
+    return False
+
+
+def _align(column: pa.ChunkedArray, target: pa.DataType) -> Optional[pa.ChunkedArray]:
+    # Solo lo que la conversión completa daría igual:
+    # - columna nueva toda nula (salvo enteros: con nulos pasan a float)
+    # - enteros dentro de una columna float
+    # - IDs del catálogo en una columna que ya no es categórica
+    if column.null_count == len(column) and not pat.is_integer(target):
+        return pa.chunked_array([pa.nulls(len(column), target)])
+    if pat.is_floating(target) and pat.is_integer(column.type):
+        return column.cast(target)
+    if pat.is_dictionary(column.type) and column.type.value_type == target:
+        return column.cast(target)
+    return None
+
+
+def _append_rows(
+    previous_path: Path,
+    rows: pd.DataFrame,
+    dimension: Optional[TimeDimension],
+    dtypes: Optional[DtypeRegistry],
+) -> Optional[pa.Table]:
+    """
+    Tabla previa + `rows` normalizadas. None si el esquema de las filas
+    nuevas no calza (la conversión completa decide los tipos).
+    """
+    old = ArrowSnapshot.read_table(previous_path)
+    new = pa.Table.from_pandas(
+        _normalize_source(rows.copy(), dimension, dtypes), preserve_index=False
+    )
+    if new.column_names != old.column_names:
+        return None
+
+    columns = []
+    for field, column in zip(old.schema, new.columns):
+        if column.type != field.type:
+            column = _align(column, field.type)
+            if column is None:
+                return None
+        columns.append(column)
+    return pa.concat_tables([old, pa.Table.from_arrays(columns, schema=old.schema)])
+
+
+class ArrowSnapshot:
+    """
+    Lector de snapshot Arrow IPC versionado.
+
+    Los archivos se abren con memory-map y el page cache del sistema
+    operativo los comparte entre workers. Desde v2 los frames ya vienen
+    normalizados (ver `normalized`): el DataManager no repite la etapa de
+    carga. En v1 (frames crudos) la normaliza al leer.
+    """
+
+    def __init__(self, path: str | Path):
+        root = Path(path)
+
+        # Se acepta la raíz (con CURRENT) o un directorio de versión
+        pointer = root / CURRENT_POINTER
+        if not (root / MANIFEST_FILENAME).exists() and pointer.exists():
+            root = root / pointer.read_text(encoding="utf-8").strip()
+
+        manifest_path = root / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Snapshot sin manifest: {manifest_path}")
+
+        self.root = root.resolve()
+        self.manifest: Dict[str, Any] = json.loads(
+            manifest_path.read_text(encoding="utf-8")
+        )
+        if self.manifest.get("format") not in SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Formato de snapshot no soportado: {self.manifest.get('format')}"
+            )
+
+    @property
+    def version(self) -> str:
+        return str(self.manifest["version"])
+
+    @property
+    def normalized(self) -> Dict[str, bool]:
+        """Etapa de carga ya aplicada al construir (vacío en snapshots v1)."""
+        return dict(self.manifest.get("normalized") or {})
+
+    def path_for(self, filename: str) -> Optional[Path]:
+        entry = self.manifest["datasets"].get(filename)
+        if entry is None:
+            return None
+        return self.root / entry["file"]
+
+    def time_domain(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Dominio temporal del manifest. KeyError si el dataset no está en el
+        snapshot o el snapshot es anterior a los metadatos temporales.
+        """
+        return self.manifest["datasets"][filename]["time"]
+
+    @staticmethod
+    def read_table(path: Path) -> pa.Table:
+        # El memory map queda referenciado por los buffers de la tabla
+        source = pa.memory_map(str(path), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    @classmethod
+    def read_frame(cls, path: Path) -> pd.DataFrame:
+        return cls.read_table(path).to_pandas(split_blocks=True)
@@ -0,0 +1,104 @@
+# src/data/atomic_io.py
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pandas as pd
+
+try:  # POSIX: lock entre procesos (workers de uvicorn / gunicorn)
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+# =====================================================
+# Escrituras atómicas
+# =====================================================
+#
+# Se escribe a un temporal del MISMO directorio y se publica con
+# os.replace: un lector (DatasetCache, requests en curso) ve el archivo
+# anterior completo o el nuevo completo, nunca uno truncado; un fallo a
+# mitad de escritura deja el archivo original intacto.
+# Los temporales (".<nombre>.*.tmp") no calzan con los globs de datasets.
+
+
+def atomic_write(path: str | Path, write: Callable[[Path], None]) -> Path:
+    """Ejecuta `write(tmp)` y reemplaza `path` por `tmp` atómicamente."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        write(tmp)
+        if path.exists():
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def atomic_write_text(path: str | Path, text: str) -> Path:
+    return atomic_write(path, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+
+def atomic_append_csv(path: str | Path, df: pd.DataFrame) -> Path:
+    """
+    Agrega filas a un CSV sin que un lector vea una línea a medias:
+    copia + append sobre el temporal + reemplazo.
+    """
+    path = Path(path)
+
+    def write(tmp: Path) -> None:
+        shutil.copyfile(path, tmp)
+        last = b"\n"
+        with tmp.open("rb") as f:
+            f.seek(0, 2)
+            if f.tell() > 0:
+                f.seek(-1, 2)
+                last = f.read(1)
+
+        with tmp.open("a", encoding="utf-8", newline="") as f:
+            if last != b"\n":
+                f.write("\n")
+            df.to_csv(f, header=False, index=False, lineterminator="\n")
+
+    return atomic_write(path, write)
+
+
+# =====================================================
+# Lock de directorio (entre procesos)
+# =====================================================
+
+_THREAD_LOCKS: dict = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def directory_lock(directory: str | Path, name: str = ".ingest.lock") -> Iterator[None]:
+    """
+    Exclusión mutua sobre `directory`: threads del proceso (lock en memoria)
+    y procesos distintos (flock sobre `directory/name`).
+    """
+    lockfile = Path(directory) / name
+    with _THREAD_LOCKS_GUARD:
+        thread_lock = _THREAD_LOCKS.setdefault(str(lockfile.resolve()), threading.Lock())
+
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with lockfile.open("a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,79 @@
+# src/data/config.py
+
+import threading
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class DataSettings(BaseSettings):
+    """
+    Configuración de infraestructura de datos para K9.
+
+    - NO conoce nodos
+    - NO conoce estado
+    - SOLO define de dónde y cómo se cargan los datasets
+    """
+
+    # -------------------------------------------------
+    # Snapshot Arrow IPC (memory-mapped)
+    # -------------------------------------------------
+    snapshot_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directorio de snapshot Arrow IPC (raíz con CURRENT o versión "
+            "con manifest.json). Vacío = leer CSV/Parquet directamente."
+        ),
+    )
+
+    # -------------------------------------------------
+    # Store Parquet particionado por semana
+    # -------------------------------------------------
+    partitioned_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Raíz del layout <dataset>/semana=<N>/ para observaciones, "
+            "eventos, auditorías e incidentes. Vacío = sin poda de particiones."
+        ),
+    )
+
+    # -------------------------------------------------
+    # IDs categóricos (diccionarios desde la ontología)
+    # -------------------------------------------------
+    categorical_ids: bool = Field(
+        default=True,
+        description=(
+            "Cargar columnas ID (área, riesgo, rol, tarea, control, tipos) "
+            "como categóricos con diccionarios globales de la ontología."
+        ),
+    )
+
+    ontology_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directorio de catálogos YAML para los diccionarios categóricos. "
+            "Vacío = data/ontology del repositorio."
+        ),
+    )
+
+    # -------------------------------------------------
+    # BaseSettings config
+    # -------------------------------------------------
+    model_config = {
+        "env_prefix": "K9_DATA_",
+        "case_sensitive": False,
+    }
+
+
+_SETTINGS: Optional[DataSettings] = None
+_SETTINGS_LOCK = threading.Lock()
+
+
+def get_data_settings() -> DataSettings:
+    """Configuración compartida por el proceso (entorno leído una sola vez)."""
+    global _SETTINGS
+    with _SETTINGS_LOCK:
+        if _SETTINGS is None:
+            _SETTINGS = DataSettings()
+        return _SETTINGS
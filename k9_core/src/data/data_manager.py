@@ -1,7 +1,318 @@
 # src/data/data_manager.py
 
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.data.analytical_cube import CUBE_SPECS, OBSERVACIONES_UNIFICADAS, AnalyticalCube
+from src.data.arrow_snapshot import ArrowSnapshot
+from src.data.config import DataSettings, get_data_settings
+from src.data.dataset_handle import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, DatasetHandle
+from src.data.dtype_registry import DtypeRegistry, get_dtype_registry
+from src.data.partitioned_store import PARTITION_COLUMN, PartitionedStore
+from src.data.scan_filter import ScanFilter
+from src.data.time_dimension import (
+    DAY_KEY,
+    TIME_DOMAIN_COLUMNS,
+    TIME_SOURCE_COLUMNS,
+    WEEK_KEY,
+    TimeDimension,
+    describe_time_domain,
+    needs_dimension,
+    normalize_time_keys,
+)
+from src.data.week_index import WeekIndex
+from src.time.data_slice import DataSlice
+from src.time.dataset_metadata import DatasetTimeMetadata
+
+
+# =====================================================
+# Cache de datasets (process-wide)
+# =====================================================
+
+# (mtime_ns, size) — huella barata, se revisa en cada acceso
+_StatFingerprint = Tuple[int, int]
+
+
+def _stat_fingerprint(path: Path) -> _StatFingerprint:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _content_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    frame: pd.DataFrame
+    stats: Dict[Path, _StatFingerprint]
+    digests: Dict[Path, str]
+
+
+def _share(value: Any) -> Any:
+    return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+
+
+class DatasetCache:
+    """
+    Cache process-wide y thread-safe de DataFrames parseados.
+
+    - Cada entrada se parsea UNA vez por proceso.
+    - En cada acceso se compara (mtime, size) de los archivos fuente.
+    - Si cambian, se compara el hash de contenido: solo se recarga
+      cuando el contenido realmente cambió (un `touch` no re-parsea).
+    - Expone contadores hit / miss / reload / tiempo de carga.
+
+    Los DataFrames entregados son compartidos: se devuelven como copia
+    superficial y deben tratarse como solo-lectura. También cachea valores
+    derivados inmutables (p.ej. metadatos temporales), que se entregan tal cual.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _CacheEntry] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.load_seconds = 0.0
+
+    # ---------- API pública ----------
+
+    def get(
+        self,
+        key: Hashable,
+        sources: Sequence[Path],
+        loader: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Retorna el DataFrame cacheado bajo `key`, recargándolo con `loader`
+        solo si alguno de los archivos `sources` cambió de contenido.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Un lock por clave: requests concurrentes parsean una sola vez
+        with key_lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry, sources):
+                with self._lock:
+                    self.hits += 1
+                return _share(entry.frame)
+
+            # Huella ANTES de cargar: si un archivo cambia durante `loader()`,
+            # la entrada queda con la huella vieja y el próximo acceso recarga
+            stats = {p: _stat_fingerprint(p) for p in sources}
+            digests = {p: _content_digest(p) for p in sources}
+
+            t0 = time.perf_counter()
+            frame = loader()
+            elapsed = time.perf_counter() - t0
+
+            self._entries[key] = _CacheEntry(frame=frame, stats=stats, digests=digests)
+
+            with self._lock:
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.reloads += 1
+                self.load_seconds += elapsed
+
+            return _share(frame)
+
+    def peek(self, key: Hashable, sources: Sequence[Path]) -> Optional[Any]:
+        """
+        Valor cacheado bajo `key` si sigue vigente; None si no hay entrada o
+        quedó obsoleta. No carga ni cuenta como acceso.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._is_fresh(entry, sources):
+                return None
+            return _share(entry.frame)
+
+    def put(self, key: Hashable, sources: Sequence[Path], value: Any) -> None:
+        """
+        Publica un valor ya calculado (p.ej. un cubo actualizado por deltas en
+        la ingesta) con la huella actual de `sources`. Sin hash de contenido:
+        cualquier cambio posterior de (mtime, size) fuerza recarga.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            stats = {p: _stat_fingerprint(p) for p in sources}
+            self._entries[key] = _CacheEntry(frame=value, stats=stats, digests={})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.reloads
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "load_seconds": round(self.load_seconds, 6),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+            self.hits = self.misses = self.reloads = 0
+            self.load_seconds = 0.0
+
+    # ---------- Helpers internos ----------
+
+    @staticmethod
+    def _is_fresh(entry: _CacheEntry, sources: Sequence[Path]) -> bool:
+        for p in sources:
+            current = _stat_fingerprint(p)
+            if entry.stats.get(p) == current:
+                continue
+
+            # mtime/size cambió → confirmar por contenido
+            if entry.digests.get(p) != _content_digest(p):
+                return False
+            entry.stats[p] = current
+        return True
+
+
+_DATASET_CACHE = DatasetCache()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Cache compartido por todas las instancias de DataManager del proceso."""
+    return _DATASET_CACHE
+
+
+# =====================================================
+# Versión de datos por directorio (process-wide)
+# =====================================================
+
+# Directorio → (mtime_ns del directorio, hash de los datasets fuente)
+_SOURCE_VERSIONS: Dict[Path, Tuple[int, str]] = {}
+_SOURCE_VERSIONS_LOCK = threading.Lock()
+
+
+def _source_files_version(base_path: Path) -> str:
+    root = base_path.resolve()
+    # mtime ANTES de listar: un cambio durante el cálculo invalida la entrada
+    dir_mtime = root.stat().st_mtime_ns
+    with _SOURCE_VERSIONS_LOCK:
+        cached = _SOURCE_VERSIONS.get(root)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    h = hashlib.sha256()
+    for path in sorted(root.glob("*")):
+        if path.suffix not in (".csv", ".parquet") or not path.is_file():
+            continue
+        mtime_ns, size = _stat_fingerprint(path)
+        h.update(f"{path.name}:{mtime_ns}:{size};".encode("utf-8"))
+    version = h.hexdigest()[:16]
+
+    with _SOURCE_VERSIONS_LOCK:
+        _SOURCE_VERSIONS[root] = (dir_mtime, version)
+    return version
+
+
+def invalidate_dataset_version(base_path: str | Path) -> None:
+    """Descarta la versión cacheada de `base_path` (p.ej. tras una ingesta)."""
+    with _SOURCE_VERSIONS_LOCK:
+        _SOURCE_VERSIONS.pop(Path(base_path).resolve(), None)
+
+
+# =====================================================
+# Observaciones unificadas (baseline + STDE 12s)
+# =====================================================
+
+# Dataset fuente → valor de la columna de origen
+OBSERVACIONES_SOURCES: Dict[str, str] = {
+    "stde_observaciones.csv": "baseline",
+    "stde_observaciones_12s.csv": "stde_12s",
+}
+OBSERVACIONES_SOURCE_COLUMN = "fuente"
+
+
+def _null_column(dtype: Any, index: pd.Index) -> pd.Series:
+    # Columna ausente en una fuente: nula con el dtype de la otra
+    # (bool / int no admiten nulos → object / float, como en un concat)
+    if pd.api.types.is_bool_dtype(dtype):
+        dtype = object
+    elif pd.api.types.is_integer_dtype(dtype):
+        dtype = "float64"
+    return pd.Series(index=index, dtype=dtype)
+
+
+def unify_observaciones(parts: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Une las fuentes de observaciones en una sola tabla.
+
+    Esquema unión explícito: columnas de la primera fuente, luego las
+    exclusivas de las siguientes, y al final `fuente` (categórica).
+    Las columnas ausentes en una fuente se agregan nulas con el dtype de
+    la fuente que sí las tiene (los categóricos se conservan).
+    """
+    dtypes: Dict[str, Any] = {}
+    for df in parts.values():
+        for column in df.columns:
+            dtypes.setdefault(column, df[column].dtype)
+    columns = list(dtypes)
+
+    labels = [OBSERVACIONES_SOURCES.get(name, name) for name in parts]
+    source_dtype = pd.CategoricalDtype(categories=labels)
+
+    frames = []
+    for label, df in zip(labels, parts.values()):
+        missing = {
+            c: _null_column(dtypes[c], df.index) for c in columns if c not in df.columns
+        }
+        if missing:
+            df = df.assign(**missing)
+        df = df[columns].assign(
+            **{OBSERVACIONES_SOURCE_COLUMN: pd.Categorical([label] * len(df), dtype=source_dtype)}
+        )
+        frames.append(df)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+# =====================================================
+# Resumen por riesgo de k9_weekly_signals
+# =====================================================
+
+def summarize_weekly_signals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agregados por riesgo en una sola pasada (groupby), indexados por
+    `riesgo_id`: avg_criticidad, avg_rank_pos, top3_weeks, weeks_considered.
+    """
+    grouped = df.groupby("riesgo_id", observed=True, sort=False)
+    return pd.DataFrame(
+        {
+            "avg_criticidad": grouped["criticidad_media"].mean(),
+            "avg_rank_pos": grouped["rank_pos"].mean(),
+            "top3_weeks": grouped["is_top3"].sum().astype("int64"),
+            "weeks_considered": grouped["semana"].nunique().astype("int64"),
+        }
+    )
 
 
 class DataManager:
@@ -11,122 +322,754 @@ class DataManager:
     Responsabilidad única:
     - Cargar datasets sintéticos base desde disco
     - Exponerlos como DataFrames limpios
+
+    Modos de lectura:
+    - Fuente (default): CSV / Parquet bajo `base_path`
+    - Snapshot: Arrow IPC memory-mapped (`snapshot_path` o K9_DATA_SNAPSHOT_DIR),
+      con la etapa de carga ya aplicada al construirlo.
+      Datasets ausentes del manifest se leen desde la fuente.
+
+    Getters por rango semanal:
+    - Con store particionado (`partitioned_path` o K9_DATA_PARTITIONED_DIR)
+      solo se leen las particiones semanales que intersectan el rango.
+    - Sin store: se filtra el dataset completo (cacheado).
+
+    Claves temporales:
+    - Al cargar (una vez por versión del archivo) cada dataset recibe
+      `dia_ord` / `semana_ord` int32 canónicos (ver time_dimension).
+    - Los filtros temporales internos operan sobre esas claves.
+
+    IDs categóricos (K9_DATA_CATEGORICAL_IDS, default activo):
+    - Columnas de área / riesgo / rol / tarea / control / tipos se cargan
+      con el dtype global del DtypeRegistry (mismos códigos en todos los
+      datasets). Los frames siguen comparándose contra strings normalmente.
+
+    Proyección / predicados (`columns=`, `where=ScanFilter(...)`):
+    - Store particionado: se empujan al scanner de pyarrow
+      (solo se decodifican las columnas y row groups necesarios).
+    - CSV / snapshot: se aplican sobre el frame cacheado (ya parseado).
     """
 
-    def __init__(self, base_path: str | Path):
+    def __init__(
+        self,
+        base_path: str | Path,
+        cache: Optional[DatasetCache] = None,
+        snapshot_path: str | Path | None = None,
+        partitioned_path: str | Path | None = None,
+        dtypes: Optional[DtypeRegistry] = None,
+        settings: Optional[DataSettings] = None,
+    ):
         self.base_path = Path(base_path)
+        self._cache = cache if cache is not None else get_dataset_cache()
+
+        # Configuración del proceso (entorno leído una vez), salvo override
+        settings = settings if settings is not None else get_data_settings()
+        if snapshot_path is None:
+            snapshot_path = settings.snapshot_dir
+        self.snapshot: Optional[ArrowSnapshot] = (
+            ArrowSnapshot(snapshot_path) if snapshot_path else None
+        )
+
+        if partitioned_path is None:
+            partitioned_path = settings.partitioned_dir
+        self.partitioned: Optional[PartitionedStore] = (
+            PartitionedStore(partitioned_path) if partitioned_path else None
+        )
+
+        if dtypes is None and settings.categorical_ids:
+            dtypes = get_dtype_registry()
+        self.dtypes: Optional[DtypeRegistry] = dtypes
 
     # ---------- Helpers internos ----------
 
-    def _load_csv(self, filename: str) -> pd.DataFrame:
-        path = self.base_path / filename
+    def _resolve(self, filename: str) -> Path:
+        path = (self.base_path / filename).resolve()
         if not path.exists():
             raise FileNotFoundError(f"Dataset no encontrado: {path}")
-        return pd.read_csv(path)
+        return path
 
-    def _load_parquet(self, filename: str) -> pd.DataFrame:
-        path = self.base_path / filename
+    def _source_path(self, filename: str) -> Path:
+        # Archivo del que se sirve el dataset (snapshot si lo contiene)
+        if self.snapshot is not None:
+            path = self.snapshot.path_for(filename)
+            if path is not None:
+                return path
+        return self._resolve(filename)
+
+    def get_time_dimension(self) -> Optional[TimeDimension]:
+        """
+        Dimensión temporal canónica (dates.csv). None si no existe en base_path.
+        """
+        path = (self.base_path / "dates.csv").resolve()
         if not path.exists():
-            raise FileNotFoundError(f"Dataset no encontrado: {path}")
-        return pd.read_parquet(path)
+            return None
+        dates = self._cache.get(("dates", path), [path], lambda: pd.read_csv(path))
+        return TimeDimension(dates)
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Etapa de carga (una vez por carga): claves temporales int32
+        # y columnas ID categóricas con diccionario global
+        dimension = self.get_time_dimension() if needs_dimension(df.columns) else None
+        return self._apply_dtypes(normalize_time_keys(df, dimension))
+
+    def _read_time_columns(self, path: Path) -> pd.DataFrame:
+        # Solo las columnas temporales: sin materializar el resto del dataset
+        if path.suffix == ".arrow":
+            table = ArrowSnapshot.read_table(path)
+            return table.select([c for c in TIME_DOMAIN_COLUMNS if c in table.column_names]).to_pandas()
+        if path.suffix == ".parquet":
+            names = pq.read_schema(path).names
+            return pd.read_parquet(path, columns=[c for c in TIME_DOMAIN_COLUMNS if c in names])
+        header = pd.read_csv(path, nrows=0).columns
+        return pd.read_csv(path, usecols=[c for c in TIME_DOMAIN_COLUMNS if c in header])
+
+    def _time_domain(self, filename: str) -> Optional[Dict[str, Any]]:
+        if self._is_partitioned(filename):
+            weeks = self.partitioned.weeks(filename)
+            if not weeks:
+                return None
+            return {
+                "min": str(weeks[0]),
+                "max": str(weeks[-1]),
+                "granularity": "week",
+                "total_periods": len(weeks),
+            }
+
+        if self.snapshot is not None:
+            try:
+                return self.snapshot.time_domain(filename)
+            except KeyError:
+                pass
+
+        path = self._source_path(filename)
+        return self._cache.get(
+            ("time", path),
+            [path],
+            lambda: describe_time_domain(self._read_time_columns(path)),
+        )
+
+    def _apply_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.dtypes.apply(df) if self.dtypes is not None else df
+
+    def _load_snapshot(self, filename: str) -> Optional[pd.DataFrame]:
+        if self.snapshot is None:
+            return None
+        path = self.snapshot.path_for(filename)
+        if path is None:
+            return None
+        return self._cache.get(
+            ("arrow", path),
+            [path],
+            lambda: self._normalize_snapshot(ArrowSnapshot.read_frame(path)),
+        )
+
+    def _normalize_snapshot(self, df: pd.DataFrame) -> pd.DataFrame:
+        stored = self.snapshot.normalized
+        if not stored.get("time_keys"):
+            # Snapshot v1: frames crudos
+            return self._normalize(df)
+
+        if stored.get("categorical_ids") and self.dtypes is None:
+            # Lector sin IDs categóricos: valores originales
+            for column in df.columns:
+                if isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype(df[column].cat.categories.dtype)
+            return df
+
+        # Mismo dtype global → sin conversión (solo compara dtypes)
+        return self._apply_dtypes(df)
+
+    def _load_csv(self, filename: str) -> pd.DataFrame:
+        df = self._load_snapshot(filename)
+        if df is not None:
+            return df
+        path = self._resolve(filename)
+        return self._cache.get(
+            ("csv", path), [path], lambda: self._normalize(pd.read_csv(path))
+        )
+
+    def _load_parquet(self, filename: str) -> pd.DataFrame:
+        df = self._load_snapshot(filename)
+        if df is not None:
+            return df
+        path = self._resolve(filename)
+        return self._load_partition(path)
+
+    def _load_partition(self, path: Path) -> pd.DataFrame:
+        return self._cache.get(
+            ("parquet", path), [path], lambda: self._normalize(pd.read_parquet(path))
+        )
+
+    def _scan_partitions(
+        self,
+        paths: Sequence[Path],
+        columns: Optional[Sequence[str]],
+        where: Optional[ScanFilter],
+    ) -> pd.DataFrame:
+        dataset = ds.dataset([str(p) for p in paths], format="parquet")
+        names = dataset.schema.names
+        expr = where.to_expression(names) if where is not None else None
+
+        if columns is None:
+            table = dataset.to_table(filter=expr)
+            return self._normalize(table.to_pandas())
+
+        projected = [c for c in columns if c in names]
+        wants_time_keys = any(c in (DAY_KEY, WEEK_KEY) for c in columns)
+        if wants_time_keys:
+            projected += [
+                c for c in TIME_SOURCE_COLUMNS if c in names and c not in projected
+            ]
+
+        df = dataset.to_table(columns=projected, filter=expr).to_pandas()
+        df = self._normalize(df) if wants_time_keys else self._apply_dtypes(df)
+        return df[[c for c in columns if c in df.columns]]
+
+    @staticmethod
+    def _select(
+        df: pd.DataFrame,
+        columns: Optional[Sequence[str]],
+        where: Optional[ScanFilter],
+    ) -> pd.DataFrame:
+        # Filtro antes de proyectar: el predicado puede usar columnas no pedidas
+        if where is not None:
+            df = df[where.mask(df)].reset_index(drop=True)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def _read(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Punto único de lectura de un dataset completo, con proyección y
+        predicados opcionales.
+        """
+        if columns is None and where is None:
+            if filename.endswith(".parquet"):
+                return self._load_parquet(filename)
+            return self._load_csv(filename)
+
+        if self._is_partitioned(filename):
+            weeks = self.partitioned.weeks(filename)
+            if where is not None:
+                weeks = where.filter_weeks(weeks)
+            return self._load_weeks(filename, weeks, columns, where)
+
+        return self._select(self._read(filename), columns, where)
+
+    def _is_partitioned(self, filename: str) -> bool:
+        return self.partitioned is not None and self.partitioned.has(filename)
+
+    def _weeks_of(self, filename: str) -> List[int]:
+        if self._is_partitioned(filename):
+            return self.partitioned.weeks(filename)
+        df = self._load_csv(filename)
+        return sorted(int(w) for w in df[WEEK_KEY].unique())
+
+    def _load_weeks(
+        self,
+        filename: str,
+        weeks: Sequence[int],
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Filas de `filename` cuyas semanas están en `weeks`.
+        Con store particionado solo se abren las particiones pedidas.
+        """
+        if self._is_partitioned(filename):
+            paths = self.partitioned.partition_paths(filename, weeks)
+            if not paths:
+                # Rango vacío: DataFrame vacío con el schema del dataset
+                any_part = next(iter(self.partitioned.partitions(filename).values()), None)
+                if any_part is None:
+                    return pd.DataFrame(columns=[PARTITION_COLUMN])
+                empty = pq.read_schema(any_part).empty_table().to_pandas()
+                return self._select(empty, columns, None)
+            if columns is None and where is None:
+                return pd.concat(
+                    [self._load_partition(p) for p in paths], ignore_index=True
+                )
+            return self._scan_partitions(paths, columns, where)
+
+        df = self._read(filename)
+        df = df[df[WEEK_KEY].isin(list(weeks))].reset_index(drop=True)
+        return self._select(df, columns, where)
+
+    def _load_week_range(
+        self,
+        filename: str,
+        start_week: int,
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        weeks = [w for w in self._weeks_of(filename) if start_week <= w < end_week]
+        return self._load_weeks(filename, weeks, columns, where)
+
+    @staticmethod
+    def _weeks_for_slice(weeks_all: List[int], data_slice: DataSlice | None) -> List[int]:
+        if data_slice is None or data_slice.is_full():
+            return weeks_all
+        data_slice.validate()
+        if data_slice.end > len(weeks_all):
+            raise ValueError(
+                f"DataManager: DataSlice {data_slice.start}:{data_slice.end} "
+                f"fuera de rango para total_weeks={len(weeks_all)}."
+            )
+        return weeks_all[data_slice.start : data_slice.end]
+
+    # ---------- Metadatos temporales ----------
+
+    def get_time_metadata(self, filename: str) -> Optional[DatasetTimeMetadata]:
+        """
+        Dominio temporal de un dataset (min / max / períodos / granularidad)
+        sin cargar sus filas:
+        - Store particionado: semanas desde el listado de particiones
+        - Snapshot: precalculado en el manifest
+        - CSV / Parquet: solo las columnas temporales, cacheado por
+          versión del archivo (se recalcula únicamente si cambia)
+
+        None si el dataset no tiene columnas temporales.
+        """
+        domain = self._time_domain(filename)
+        if domain is None:
+            return None
+        return DatasetTimeMetadata(
+            min_date=domain["min"],
+            max_date=domain["max"],
+            granularity=domain["granularity"],
+            total_periods=int(domain["total_periods"]),
+        )
+
+    # ---------- Observabilidad ----------
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Contadores del cache de datasets (hits, misses, reloads, load_seconds).
+        """
+        return self._cache.stats()
+
+    def dataset_version(self) -> str:
+        """
+        Versión de los datos servidos: hash de (nombre, mtime, size) de los
+        datasets fuente (+ versión del snapshot activo). Cambia con cada
+        ingesta; los caches aguas abajo pueden usarla como clave.
+
+        El hash de archivos se cachea por mtime del directorio (un solo
+        `stat` por llamada): las escrituras atómicas (os.replace) lo cambian
+        y DailyIngestor invalida la entrada al terminar cada ingesta.
+        Una edición en el lugar requiere `invalidate_dataset_version`.
+        """
+        files = _source_files_version(self.base_path)
+        if self.snapshot is None:
+            return files
+        h = hashlib.sha256(f"snapshot:{self.snapshot.version};".encode("utf-8"))
+        h.update(files.encode("utf-8"))
+        return h.hexdigest()[:16]
+
+    # ---------- Handles (registros a pedido, paginados) ----------
+
+    def get_handle(
+        self,
+        filename: str,
+        week_range: Optional[Tuple[int, int]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> DatasetHandle:
+        """
+        Handle serializable del corte (dataset, semanas, columnas) con su
+        número de filas. El análisis lo transporta en vez de los registros.
+        """
+        df = self._handle_frame(filename, week_range, columns)
+        return DatasetHandle(
+            dataset=filename,
+            rows=int(len(df)),
+            week_range=tuple(week_range) if week_range is not None else None,
+            columns=tuple(columns) if columns is not None else None,
+            version=self.dataset_version(),
+        )
+
+    def read_page(
+        self,
+        handle: DatasetHandle,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Materializa una página de registros del handle.
+        `stale` indica que los datos cambiaron desde que se creó el handle.
+        """
+        if offset < 0 or limit <= 0:
+            raise ValueError("DataManager: offset >= 0 y limit > 0 requeridos.")
+        limit = min(int(limit), MAX_PAGE_SIZE)
+
+        df = self._handle_frame(handle.dataset, handle.week_range, handle.columns)
+        page = df.iloc[offset : offset + limit]
+        total = int(len(df))
+        end = offset + len(page)
+
+        return {
+            "dataset": handle.dataset,
+            "offset": int(offset),
+            "limit": limit,
+            "total": total,
+            "next_offset": end if end < total else None,
+            "stale": handle.version is not None and handle.version != self.dataset_version(),
+            "records": page.astype(object).where(page.notna(), None).to_dict(orient="records"),
+        }
+
+    def _handle_frame(
+        self,
+        filename: str,
+        week_range: Optional[Tuple[int, int]],
+        columns: Optional[Sequence[str]],
+    ) -> pd.DataFrame:
+        where = ScanFilter(week_range=tuple(week_range)) if week_range is not None else None
+        df = self._read(filename, columns, where)
+        return df.drop(columns=[DAY_KEY, WEEK_KEY], errors="ignore")
 
     # ---------- Datasets final ----------
 
-    def get_weekly_signals(self) -> pd.DataFrame:
+    def get_weekly_signals(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         k9_weekly_signals.parquet
         Señales semanales agregadas por riesgo
         """
-        return self._load_parquet("k9_weekly_signals.parquet")
+        return self._read("k9_weekly_signals.parquet", columns, where)
 
-    def get_trayectorias_semanales(self) -> pd.DataFrame:
+    def get_weekly_signals_by_risk(self) -> pd.DataFrame:
+        """
+        Resumen por riesgo de k9_weekly_signals.parquet (una fila por
+        `riesgo_id`). Se agrega una vez por versión del dataset.
+        """
+        path = self._source_path("k9_weekly_signals.parquet")
+        return self._cache.get(
+            ("summary", "weekly_signals", path),
+            [path],
+            lambda: summarize_weekly_signals(self.get_weekly_signals()),
+        )
+
+    def get_trayectorias_semanales(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_trayectorias_semanales.csv
         Evolución temporal de riesgos (fuente principal de tendencias)
         """
-        return self._load_csv("stde_trayectorias_semanales.csv")
+        return self._read("stde_trayectorias_semanales.csv", columns, where)
 
-    def get_observaciones(self) -> pd.DataFrame:
+    def get_observaciones(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_observaciones_12s.csv
         Observaciones OPG / OCC por semana
         """
-        return self._load_csv("stde_observaciones_12s.csv")
+        return self._read("stde_observaciones_12s.csv", columns, where)
     
-    def get_observaciones_all(self) -> pd.DataFrame:
+    def get_observaciones_unificadas(self) -> pd.DataFrame:
+        """
+        Tabla única de observaciones (baseline + STDE 12s) con esquema unión
+        y columna `fuente`. Se materializa una vez por versión de las fuentes
+        (la ingesta la invalida) y es compartida por todos los consumidores.
+        """
+        sources = [self._source_path(f) for f in self._OBSERVACIONES_SOURCES]
+        return self._cache.get(
+            ("unified", "observaciones", *sources),
+            sources,
+            lambda: unify_observaciones({f: self._read(f) for f in self._OBSERVACIONES_SOURCES}),
+        )
+
+    def get_observaciones_week_index(
+        self, count_by: Sequence[str] = ("tipo_observacion",)
+    ) -> WeekIndex:
+        """
+        WeekIndex sobre la tabla unificada de observaciones, con conteos
+        acumulados por `count_by`. Se construye una vez por versión.
+        """
+        sources = [self._source_path(f) for f in self._OBSERVACIONES_SOURCES]
+        return self._cache.get(
+            ("week_index", "observaciones", tuple(count_by), *sources),
+            sources,
+            lambda: WeekIndex.build(self.get_observaciones_unificadas(), count_by),
+        )
+
+    def get_week_index(self, filename: str, count_by: Sequence[str] = ()) -> WeekIndex:
+        """
+        WeekIndex de cualquier dataset con clave semanal (filas ordenadas,
+        offsets por semana, conteos acumulados). Se construye una vez por
+        versión del archivo.
+        """
+        path = self._source_path(filename)
+        return self._cache.get(
+            ("week_index", path, tuple(count_by)),
+            [path],
+            lambda: WeekIndex.build(self._read(filename), count_by),
+        )
+
+    def get_cube(self, entity: str) -> AnalyticalCube:
+        """
+        Cubo semana × riesgo × área × tipo de `entity` (observations /
+        events / audits). Se construye una vez por versión de las fuentes.
+        """
+        if entity not in CUBE_SPECS:
+            raise KeyError(f"Cubo no definido para: {entity}. Disponibles={sorted(CUBE_SPECS)}")
+        spec = CUBE_SPECS[entity]
+
+        if spec.dataset == OBSERVACIONES_UNIFICADAS:
+            load = self.get_observaciones_unificadas
+        else:
+            load = lambda: self._read(spec.dataset)  # noqa: E731
+
+        sources = self._cube_sources(entity)
+        return self._cache.get(
+            ("cube", entity, *sources),
+            sources,
+            lambda: AnalyticalCube.build(spec, load()),
+        )
+
+    def cached_cube(self, entity: str) -> Optional[AnalyticalCube]:
+        """Cubo ya construido y vigente para las fuentes actuales; None si no."""
+        sources = self._cube_sources(entity)
+        return self._cache.peek(("cube", entity, *sources), sources)
+
+    def extend_cube(self, entity: str, cube: AnalyticalCube, rows: pd.DataFrame) -> bool:
+        """
+        Ingesta por deltas: `cube` (vigente antes del append) + `rows` (filas
+        recién agregadas a la fuente, tal como se leen del archivo) queda como
+        cubo vigente para las fuentes actuales. False si las filas no calzan
+        con el cubo: la entrada queda obsoleta y `get_cube` lo reconstruye.
+        """
+        try:
+            extended = cube.extend(CUBE_SPECS[entity], self._normalize(rows.copy()))
+        except ValueError:
+            return False
+        sources = self._cube_sources(entity)
+        self._cache.put(("cube", entity, *sources), sources, extended)
+        return True
+
+    def _cube_sources(self, entity: str) -> List[Path]:
+        if CUBE_SPECS[entity].dataset == OBSERVACIONES_UNIFICADAS:
+            return [self._source_path(f) for f in self._OBSERVACIONES_SOURCES]
+        return [self._source_path(CUBE_SPECS[entity].dataset)]
+
+    def get_observaciones_all(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
-        Unifica observaciones baseline + STDE 12 semanas
+        Observaciones baseline + STDE 12 semanas (tabla unificada)
         """
-        df_base = self._load_csv("stde_observaciones.csv")
-        df_12s = self._load_csv("stde_observaciones_12s.csv")
-        df = pd.concat([df_base, df_12s], ignore_index=True)
+        df = self._select(self.get_observaciones_unificadas(), columns, where)
 
         required_cols = {"semana", "tipo_observacion"}
+        if columns is not None:
+            required_cols &= set(columns)
         missing = required_cols - set(df.columns)
         if missing:
             raise KeyError(f"Observaciones missing columns: {missing}")
 
         return df
 
-    def get_proactivo_semanal(self) -> pd.DataFrame:
+    def get_proactivo_semanal(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_proactivo_semanal_v4_4.csv
         Salida semanal del modelo proactivo
         """
-        return self._load_csv("stde_proactivo_semanal_v4_4.csv")
+        return self._read("stde_proactivo_semanal_v4_4.csv", columns, where)
+
+    def get_observaciones_semana(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        k9_observaciones_semana.csv
+        Agregado materializado: conteo de observaciones por semana y tipo
+        (mantenido por la ingesta diaria)
+        """
+        return self._read("k9_observaciones_semana.csv", columns, where)
     
-    def get_trayectorias_diarias(self) -> pd.DataFrame:
+    def get_trayectorias_diarias(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_trayectorias_diarias.csv
         Trayectorias internas diarias de criticidad por riesgo.
         Uso interno (no narrativa directa).
         """
-        return self._load_csv("stde_trayectorias_diarias.csv")
+        return self._read("stde_trayectorias_diarias.csv", columns, where)
     
-    def get_fdo_diario(self) -> pd.DataFrame:
+    def get_fdo_diario(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_fdo_diario.csv
         Estado diario normalizado (0–1) de factores operacionales.
         Representa presión operacional instantánea.
         """
-        return self._load_csv("stde_fdo_diario.csv")
+        return self._read("stde_fdo_diario.csv", columns, where)
     
-    def get_fdo_diario_12s(self) -> pd.DataFrame:
+    def get_fdo_diario_12s(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_fdo_diario_12s.csv
         Tendencia estratégica acumulada de FDO (índice 1–100).
         Incluye fecha para alineación temporal.
         """
-        return self._load_csv("stde_fdo_diario_12s.csv")
+        return self._read("stde_fdo_diario_12s.csv", columns, where)
 
-    def get_fdo_catalogo(self) -> pd.DataFrame:
+    def get_fdo_catalogo(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_fdo_catalogo.csv
         Catálogo semántico de factores operacionales (nombres, descripciones).
         """
-        return self._load_csv("stde_fdo_catalogo.csv")
+        return self._read("stde_fdo_catalogo.csv", columns, where)
 
-    def get_auditorias(self) -> pd.DataFrame:
+    def get_auditorias(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_auditorias.csv
         Auditorías operativas (planificadas / reactivas).
         Nivel: operacional / factual.
         """
-        return self._load_csv("stde_auditorias.csv")
+        return self._read("stde_auditorias.csv", columns, where)
 
 
-    def get_auditorias_12s(self) -> pd.DataFrame:
+    def get_auditorias_12s(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
         """
         stde_auditorias_12s.csv
         Auditorías agregadas / narrativas a 12 semanas.
         Nivel: cognitivo / longitudinal.
         """
-        return self._load_csv("stde_auditorias_12s.csv")
+        return self._read("stde_auditorias_12s.csv", columns, where)
+
+    def get_eventos(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        stde_eventos.csv
+        Eventos operacionales diarios (hazard / near miss / incidentes menores).
+        """
+        return self._read("stde_eventos.csv", columns, where)
+
+    def get_incidentes_12s(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        stde_incidentes_12s.csv
+        Incidentes a 12 semanas (con / sin lesión).
+        """
+        return self._read("stde_incidentes_12s.csv", columns, where)
+
+    def get_riesgos_evento_lunes_critico(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        stde_riesgos_evento_lunes_critico.csv
+        Criticidad real por riesgo en la semana del escenario "Lunes crítico"
+        (escala 0–100). Fuente de la capa overlay del escenario.
+        """
+        return self._read("stde_riesgos_evento_lunes_critico.csv", columns, where)
+
+    # ---------- Getters por rango semanal ----------
+
+    _OBSERVACIONES_SOURCES = tuple(OBSERVACIONES_SOURCES)
+
+    def get_observaciones_weeks(self) -> List[int]:
+        """
+        Semanas presentes en observaciones (baseline + STDE 12s), ordenadas.
+        Con store particionado no se leen filas.
+        """
+        weeks = set()
+        for filename in self._OBSERVACIONES_SOURCES:
+            weeks.update(self._weeks_of(filename))
+        return sorted(weeks)
+
+    def get_observaciones_for_weeks(
+        self,
+        weeks: Sequence[int],
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Observaciones (baseline + STDE 12s) de las semanas indicadas.
+        Con store particionado se leen solo esas particiones; sin store se
+        filtra la tabla unificada.
+        """
+        if not any(self._is_partitioned(f) for f in self._OBSERVACIONES_SOURCES):
+            df = self.get_observaciones_unificadas()
+            df = df[df[WEEK_KEY].isin(list(weeks))].reset_index(drop=True)
+            return self._select(df, columns, where)
+
+        parts = {
+            f: self._load_weeks(f, weeks, columns, where)
+            for f in self._OBSERVACIONES_SOURCES
+        }
+        df = unify_observaciones(parts)
+        return df if columns is None else self._select(df, columns, None)
+
+    def get_observaciones_for_slice(
+        self,
+        data_slice: DataSlice | None,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Observaciones del DataSlice (índices sobre el eje de semanas).
+        """
+        if data_slice is None or data_slice.is_full():
+            return self.get_observaciones_all(columns, where)
+        weeks = self._weeks_for_slice(self.get_observaciones_weeks(), data_slice)
+        return self.get_observaciones_for_weeks(weeks, columns, where)
 
     def get_observaciones_by_week_range(
         self,
         start_week: int,
-        end_week: int
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
     ) -> pd.DataFrame:
         """
         Retorna observaciones dentro de un rango semanal [start_week, end_week).
@@ -136,10 +1079,56 @@ class DataManager:
         - NO valida semántica
         - NO aplica lógica cognitiva
         """
+        weeks = [
+            w for w in self.get_observaciones_weeks()
+            if start_week <= w < end_week
+        ]
+        return self.get_observaciones_for_weeks(weeks, columns, where)
+
+    def get_eventos_by_week_range(
+        self,
+        start_week: int,
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """Eventos dentro de [start_week, end_week)."""
+        return self._load_week_range(
+            "stde_eventos.csv", start_week, end_week, columns, where
+        )
+
+    def get_auditorias_by_week_range(
+        self,
+        start_week: int,
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """Auditorías operativas dentro de [start_week, end_week)."""
+        return self._load_week_range(
+            "stde_auditorias.csv", start_week, end_week, columns, where
+        )
 
-        df = self.get_observaciones_all()
+    def get_auditorias_12s_by_week_range(
+        self,
+        start_week: int,
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """Auditorías 12s dentro de [start_week, end_week)."""
+        return self._load_week_range(
+            "stde_auditorias_12s.csv", start_week, end_week, columns, where
+        )
 
-        return df[
-            (df["semana"] >= start_week) &
-            (df["semana"] < end_week)
-        ].reset_index(drop=True)
+    def get_incidentes_by_week_range(
+        self,
+        start_week: int,
+        end_week: int,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[ScanFilter] = None,
+    ) -> pd.DataFrame:
+        """Incidentes 12s dentro de [start_week, end_week)."""
+        return self._load_week_range(
+            "stde_incidentes_12s.csv", start_week, end_week, columns, where
+        )
@@ -0,0 +1,59 @@
+# src/data/dataset_handle.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+# Tamaño de página por defecto / máximo al materializar registros
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class DatasetHandle:
+    """
+    Referencia serializable a un corte de dataset, sin filas.
+
+    El análisis transporta el handle (+ agregados); los registros se
+    materializan solo a pedido y paginados (`DataManager.read_page`).
+
+    - `week_range`: [start, end) sobre `semana` (None = todas)
+    - `columns`: proyección (None = todas, sin claves internas)
+    - `rows`: filas del corte al crear el handle
+    - `version`: `dataset_version` al crear el handle
+    """
+
+    dataset: str
+    rows: int
+    week_range: Optional[Tuple[int, int]] = None
+    columns: Optional[Tuple[str, ...]] = None
+    version: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Solo nombres de archivo bajo base_path (sin rutas)
+        if not self.dataset or Path(self.dataset).name != self.dataset:
+            raise ValueError(f"DatasetHandle: dataset inválido '{self.dataset}'")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dataset": self.dataset,
+            "rows": self.rows,
+            "week_range": list(self.week_range) if self.week_range is not None else None,
+            "columns": list(self.columns) if self.columns is not None else None,
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "DatasetHandle":
+        week_range = data.get("week_range")
+        columns = data.get("columns")
+        return cls(
+            dataset=str(data.get("dataset") or ""),
+            rows=int(data.get("rows") or 0),
+            week_range=(int(week_range[0]), int(week_range[1])) if week_range else None,
+            columns=tuple(str(c) for c in columns) if columns else None,
+            version=data.get("version"),
+        )
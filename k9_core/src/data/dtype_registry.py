@@ -0,0 +1,129 @@
+# src/data/dtype_registry.py
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import yaml
+
+from src.data.config import get_data_settings
+
+
+DEFAULT_ONTOLOGY_DIR = Path(__file__).resolve().parents[2] / "data" / "ontology"
+
+# Dominio → catálogo ontológico que define su diccionario global
+CATALOG_DOMAINS: Dict[str, str] = {
+    "area": "13_catalogo_areas_operacionales_v1.yaml",
+    "riesgo": "01_catalogo_riesgos_v8.yaml",
+    "rol": "10_catalogo_roles_v3.yaml",
+    "tarea": "12_catalogo_tareas_v1.yaml",
+    "control": "02_catalogo_controles_v6.yaml",
+    "tipo_observacion": "26_tipos_observaciones_v2.yaml",
+    "tipo_auditoria": "32_tipos_auditoria_v1.yaml",
+    "tipo_incidente": "25_tipos_incidentes_v1.yaml",
+}
+
+# Columna (en cualquier dataset STDE) → dominio
+COLUMN_DOMAINS: Dict[str, str] = {
+    "id_area": "area",
+    "riesgo_id": "riesgo",
+    "id_riesgo": "riesgo",
+    "riesgo_focal": "riesgo",
+    "rol_id": "rol",
+    "id_rol": "rol",
+    "rol_observador_id": "rol",
+    "rol_observado_id": "rol",
+    "rol_auditor_id": "rol",
+    "tarea_id": "tarea",
+    "control_critico_id": "control",
+    "tipo_observacion": "tipo_observacion",
+    "tipo_auditoria": "tipo_auditoria",
+    "tipo_incidente": "tipo_incidente",
+    "tipo_evento": "tipo_incidente",
+}
+
+
+def _catalog_ids(path: Path) -> List[str]:
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or []
+
+    # Orden del catálogo = orden de los códigos (estable entre versiones)
+    ids: List[str] = []
+    for item in data if isinstance(data, list) else []:
+        if isinstance(item, dict) and item.get("id") is not None:
+            value = str(item["id"])
+            if value not in ids:
+                ids.append(value)
+    return ids
+
+
+class DtypeRegistry:
+    """
+    Registro de dtypes para columnas ID de los datasets STDE.
+
+    - Cada dominio (área, riesgo, rol, tarea, control, tipos) tiene UN
+      diccionario global construido desde su catálogo ontológico
+    - Todas las columnas del mismo dominio comparten el mismo
+      `CategoricalDtype` → mismos códigos enteros en todos los datasets
+      (joins y filtros por código, sin comparar strings)
+    - Una columna con valores fuera del catálogo queda como string:
+      el diccionario no se extiende ni se pierden valores
+    """
+
+    def __init__(self, ontology_path: str | Path = DEFAULT_ONTOLOGY_DIR):
+        self.ontology_path = Path(ontology_path)
+        self.dtypes: Dict[str, pd.CategoricalDtype] = {}
+
+        for domain, filename in CATALOG_DOMAINS.items():
+            path = self.ontology_path / filename
+            if not path.exists():
+                continue
+            ids = _catalog_ids(path)
+            if ids:
+                self.dtypes[domain] = pd.CategoricalDtype(categories=ids, ordered=False)
+
+    # ---------- Consulta ----------
+
+    def dtype_for(self, column: str) -> Optional[pd.CategoricalDtype]:
+        domain = COLUMN_DOMAINS.get(column)
+        return self.dtypes.get(domain) if domain else None
+
+    def categories(self, domain: str) -> List[str]:
+        dtype = self.dtypes.get(domain)
+        return list(dtype.categories) if dtype is not None else []
+
+    # ---------- Etapa de carga ----------
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convierte en el lugar las columnas ID conocidas a su categórico global.
+        """
+        for column in df.columns:
+            dtype = self.dtype_for(column)
+            if dtype is None or df[column].dtype == dtype:
+                continue
+
+            values = df[column]
+
+            # Valores fuera del catálogo → la columna se deja intacta
+            if not (values.isna() | values.isin(dtype.categories)).all():
+                continue
+            df[column] = values.astype(dtype)
+        return df
+
+
+_REGISTRY: Optional[DtypeRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_dtype_registry() -> DtypeRegistry:
+    """Registro compartido por el proceso (catálogos leídos una sola vez)."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            ontology_dir = get_data_settings().ontology_dir
+            _REGISTRY = DtypeRegistry(ontology_dir or DEFAULT_ONTOLOGY_DIR)
+        return _REGISTRY
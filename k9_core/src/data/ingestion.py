@@ -0,0 +1,663 @@
+# src/data/ingestion.py
+
+from __future__ import annotations
+
+import io
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.arrow_snapshot import ArrowSnapshot, AppendedRows, source_stat, update_snapshot
+from src.data.atomic_io import atomic_append_csv, atomic_write, directory_lock
+from src.data.config import DataSettings, get_data_settings
+from src.data.data_manager import DataManager, DatasetCache, invalidate_dataset_version
+from src.data.partitioned_store import PARTITIONED_DATASETS, PartitionedStore
+from src.data.time_dimension import (
+    MISSING_ORDINAL,
+    TimeDimension,
+    parse_mixed_dates,
+    to_day_ordinal,
+)
+
+
+# Tipo de fila → dataset fuente (append-only)
+INGEST_TARGETS: Dict[str, str] = {
+    "observaciones": "stde_observaciones.csv",
+    "eventos": "stde_eventos.csv",
+    "auditorias": "stde_auditorias.csv",
+    "fdo": "stde_fdo_diario.csv",
+    "trayectorias": "stde_trayectorias_diarias.csv",
+}
+
+# Identificador por registro: filas ya ingestadas se omiten
+RECORD_IDS: Dict[str, str] = {
+    "observaciones": "id_observacion",
+    "auditorias": "id_auditoria_final",
+}
+
+# Sin id obligatorio: id propio si viene, si no clave natural del registro
+# (la fecha se compara como día, independiente del formato del archivo)
+NATURAL_KEYS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "eventos": ("id_evento", ("fecha", "id_area", "riesgo_id", "tipo_evento")),
+}
+
+# Grano diario: un único registro por fecha
+DAILY_GRAIN = ("fdo", "trayectorias")
+
+# Agregados semanales mantenidos incrementalmente
+WEEKLY_TRAJECTORIES = "stde_trayectorias_semanales.csv"
+WEEKLY_SIGNALS = "k9_weekly_signals.parquet"
+WEEKLY_OBSERVATIONS = "k9_observaciones_semana.csv"
+
+# Tipo de fila → cubo analítico que se actualiza al ingestar
+CUBE_ENTITIES: Dict[str, str] = {
+    "observaciones": "observations",
+    "eventos": "events",
+    "auditorias": "audits",
+}
+
+CALENDAR = "dates.csv"
+PROACTIVO = "stde_proactivo_semanal_v4_4.csv"
+
+# Lockfile en base_path: serializa ingestas entre threads Y procesos
+INGEST_LOCKFILE = ".ingest.lock"
+
+# Filas del archivo que se miran para copiar su codificación de booleanos
+BOOL_SAMPLE_ROWS = 100
+# Codificación por defecto (la de los CSV STDE versionados)
+BOOL_TOKENS = ("TRUE", "FALSE")
+
+
+# =====================================================
+# Helpers de formato
+# =====================================================
+
+def _header(path: Path) -> List[str]:
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _bool_tokens(sample: pd.Series) -> Optional[Tuple[str, str]]:
+    """("TRUE", "FALSE") / ("True", "False") / ... según el archivo; None si no es booleana."""
+    values = sample.dropna()
+    if values.empty or not values.str.lower().isin(["true", "false"]).all():
+        return None
+    token = values.iloc[0]
+    if token.isupper():
+        return ("TRUE", "FALSE")
+    if token.islower():
+        return ("true", "false")
+    return ("True", "False")
+
+
+def _is_bool_column(values: pd.Series) -> bool:
+    present = values.dropna()
+    return not present.empty and all(isinstance(v, (bool, np.bool_)) for v in present)
+
+
+def _encode_bools(values: pd.Series, tokens: Tuple[str, str]) -> pd.Series:
+    true, false = tokens
+
+    def encode(v: Any) -> Any:
+        if isinstance(v, (bool, np.bool_)):
+            return true if v else false
+        if isinstance(v, str) and v.lower() in ("true", "false"):
+            return true if v.lower() == "true" else false
+        return v
+
+    return values.astype(object).map(encode)
+
+
+def _as_read(df: pd.DataFrame) -> pd.DataFrame:
+    # Filas tal como las parsea un lector del CSV (mismo texto que el append)
+    return pd.read_csv(io.StringIO(df.to_csv(index=False, lineterminator="\n")))
+
+
+def _uses_mdy(path: Path) -> bool:
+    # Cada archivo conserva su formato de fecha (ISO o m/d/Y sin ceros)
+    sample = pd.read_csv(path, usecols=["fecha"], nrows=1)
+    return not sample.empty and "/" in str(sample["fecha"].iloc[0])
+
+
+def _format_dates(dates: pd.Series, mdy: bool) -> pd.Series:
+    if not mdy:
+        return dates.dt.strftime("%Y-%m-%d")
+    return (
+        dates.dt.month.astype(str)
+        + "/" + dates.dt.day.astype(str)
+        + "/" + dates.dt.year.astype(str)
+    )
+
+
+def _write_csv(path: Path, df: pd.DataFrame) -> None:
+    atomic_write(path, lambda tmp: df.to_csv(tmp, index=False))
+
+
+def _natural_keys(df: pd.DataFrame, day: np.ndarray, id_col: str, columns: Sequence[str]) -> pd.Series:
+    """Clave por fila: `id:<id>` si hay id, si no `día|col|col...`."""
+    natural = pd.Series(day, index=df.index).astype(str)
+    for col in columns:
+        if col != "fecha":
+            natural = natural + "|" + df[col].astype(str)
+    ids = df[id_col]
+    return ("id:" + ids.astype(str)).where(ids.notna(), natural)
+
+
+def _row_keys(kind: str, df: pd.DataFrame, day: np.ndarray) -> pd.Series:
+    """Clave de deduplicación por fila: id, clave natural o día (grano diario)."""
+    if kind in RECORD_IDS:
+        return df[RECORD_IDS[kind]].astype(str)
+    if kind in NATURAL_KEYS:
+        id_col, columns = NATURAL_KEYS[kind]
+        return _natural_keys(df, day, id_col, columns)
+    return pd.Series(day, index=df.index)
+
+
+@dataclass
+class _KeyIndex:
+    """Claves ya ingestadas de una fuente y filas por semana, a la huella `stat`."""
+    stat: Tuple[int, int]
+    keys: Set[Any]
+    weeks: Counter
+
+
+# Fuente → índice. Se mantiene con cada append de la ingesta y solo se
+# reconstruye (lectura de las columnas clave) si el archivo cambió por fuera
+_KEY_INDEXES: Dict[Path, _KeyIndex] = {}
+
+
+def _sev_k9(score: float) -> str:
+    if score >= 0.8:
+        return "SEV3"
+    if score >= 0.5:
+        return "SEV2"
+    return "SEV1"
+
+
+def build_observation_counts(dm: DataManager) -> pd.DataFrame:
+    """
+    Conteo completo semana × tipo de observación (baseline + 12s).
+    Solo se usa para inicializar el agregado materializado.
+    """
+    df = dm.get_observaciones_all(columns=["semana", "tipo_observacion"])
+    counts = (
+        df.assign(tipo_observacion=df["tipo_observacion"].astype(str))
+        .groupby(["semana", "tipo_observacion"])
+        .size()
+        .rename("n_observaciones")
+        .reset_index()
+    )
+    return counts.sort_values(["semana", "tipo_observacion"]).reset_index(drop=True)
+
+
+def weekly_signal_rows(
+    week: int,
+    risks: Sequence[str],
+    weekly: pd.DataFrame,
+    proactivo: pd.DataFrame,
+    peso: Mapping[str, float],
+) -> List[Dict[str, Any]]:
+    """
+    Filas de k9_weekly_signals para una semana (reglas del generador STDE,
+    celdas 7.3 / 8.4). Sin salida proactiva para la semana → sin filas.
+    """
+    ranking = proactivo[proactivo["semana_id"] == week].sort_values("rank_proactivo")
+    if ranking.empty:
+        return []
+    score_top1 = float(ranking["score_proactivo"].iloc[0])
+
+    rows: List[Dict[str, Any]] = []
+    for risk in risks:
+        col = f"criticidad_{risk}_media"
+        rk = ranking[ranking["riesgo_id"] == risk]
+        if col not in weekly.columns or rk.empty or pd.isna(weekly.at[week, col]):
+            continue
+
+        crit = float(weekly.at[week, col])
+        prev = weekly.at[week - 1, col] if (week - 1) in weekly.index else None
+        tendencia = crit - float(prev) if week > 1 and prev is not None and pd.notna(prev) else 0.0
+
+        rank_pos = int(rk["rank_proactivo"].iloc[0])
+        score = float(rk["score_proactivo"].iloc[0])
+        rows.append({
+            "semana": week,
+            "riesgo_id": risk,
+            "criticidad_media": round(crit, 4),
+            "tendencia": round(tendencia, 4),
+            "rank_pos": rank_pos,
+            "score": round(score, 4),
+            "dist_top1": round(score - score_top1, 4),
+            "sev_k9": _sev_k9(score),
+            "peso_k9": round(float(peso.get(risk, 1.0)), 4),
+            "is_top3": rank_pos <= 3,
+            "riesgo_dominante": False,
+            "es_semana_lunes_critico": False,
+        })
+
+    if rows:
+        top = max(r["criticidad_media"] for r in rows)
+        for r in rows:
+            r["riesgo_dominante"] = r["criticidad_media"] == top
+    return rows
+
+
+# =====================================================
+# Ingesta diaria
+# =====================================================
+
+@dataclass
+class IngestionResult:
+    rows_appended: Dict[str, int]
+    rows_skipped: Dict[str, int]
+    new_days: List[str]
+    aggregates: Dict[str, List[int]]  # agregado → semanas actualizadas
+    dataset_version: str
+    snapshot_version: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class DailyIngestor:
+    """
+    Ingesta incremental de filas diarias sobre los datasets STDE.
+
+    - Agrega filas (append) a observaciones, eventos, auditorías, FDO y
+      trayectorias diarias; `semana` / `id_dia` se derivan del calendario
+    - Días fuera de `dates.csv` extienden el calendario (semanas de lunes)
+    - Mantiene los agregados semanales tocando solo las semanas afectadas:
+        · trayectorias semanales → media incremental (n, suma)
+        · señales semanales      → filas de la semana (+ la siguiente, por tendencia)
+        · observaciones/semana   → suma de conteos
+    - El store particionado (si existe) reescribe solo esas particiones
+    - Retorna la nueva `dataset_version` (clave para caches aguas abajo)
+    - Idempotente: filas ya ingestadas (id, clave natural o día) se omiten;
+      las claves se consultan en un índice en memoria mantenido con cada
+      append (el histórico se lee una vez por proceso, o si la fuente
+      cambió por fuera de la ingesta)
+    - Cubos analíticos ya construidos se actualizan sumando las celdas de
+      las filas nuevas
+    - Booleanos con la misma codificación que las filas existentes
+    - Cada archivo se publica atómicamente (temporal + os.replace) y las
+      ingestas se serializan con un flock sobre `base_path/.ingest.lock`
+      (válido con varios workers; sin fcntl, solo dentro del proceso)
+
+    Con snapshot Arrow configurado, se publica una versión nueva del
+    snapshot al final: los datasets sin cambios se enlazan, los que
+    recibieron filas se extienden y solo los agregados reescritos se
+    convierten de nuevo (los lectores toman CURRENT).
+    """
+
+    def __init__(
+        self,
+        base_path: str | Path,
+        partitioned_path: str | Path | None = None,
+        cache: Optional[DatasetCache] = None,
+        snapshot_path: str | Path | None = None,
+        settings: Optional[DataSettings] = None,
+    ):
+        self.base_path = Path(base_path)
+        settings = settings if settings is not None else get_data_settings()
+
+        # Siempre contra la fuente (no snapshot / particiones)
+        self.dm = DataManager(
+            self.base_path, cache=cache, snapshot_path="", partitioned_path="", settings=settings
+        )
+
+        if partitioned_path is None:
+            partitioned_path = settings.partitioned_dir
+        self.partitioned: Optional[PartitionedStore] = (
+            PartitionedStore(partitioned_path) if partitioned_path else None
+        )
+
+        if snapshot_path is None:
+            snapshot_path = settings.snapshot_dir
+        self.snapshot_root: Optional[Path] = Path(snapshot_path) if snapshot_path else None
+
+    # ---------- API pública ----------
+
+    def ingest(self, batch: Mapping[str, Sequence[Mapping[str, Any]]]) -> IngestionResult:
+        unknown = set(batch) - set(INGEST_TARGETS)
+        if unknown:
+            raise ValueError(f"DailyIngestor: tipos no soportados {sorted(unknown)}")
+
+        with directory_lock(self.base_path, INGEST_LOCKFILE):
+            dimension = self.dm.get_time_dimension()
+            if dimension is None:
+                raise FileNotFoundError(f"Calendario no encontrado: {self.base_path / CALENDAR}")
+
+            frames: Dict[str, pd.DataFrame] = {}
+            days: Dict[str, np.ndarray] = {}
+            indexes: Dict[str, _KeyIndex] = {}
+            skipped: Dict[str, int] = {}
+            for kind, rows in batch.items():
+                if not rows:
+                    continue
+                df, day = self._prepare(kind, rows, dimension)
+                indexes[kind] = self._key_index(kind)
+                df, day, n_skipped = self._drop_existing(kind, df, day, indexes[kind])
+                skipped[kind] = n_skipped
+                if not df.empty:
+                    frames[kind], days[kind] = df, day
+
+            new_days = self._extend_calendar(days.values(), dimension)
+
+            # Estado previo de los agregados y cubos (antes de escribir filas)
+            tray_counts = self._week_counts(indexes.get("trayectorias"), frames.get("trayectorias"))
+            if "observaciones" in frames and not (self.base_path / WEEKLY_OBSERVATIONS).exists():
+                _write_csv(self.base_path / WEEKLY_OBSERVATIONS, build_observation_counts(self.dm))
+            cubes = {
+                kind: self.dm.cached_cube(CUBE_ENTITIES[kind])
+                for kind in frames
+                if kind in CUBE_ENTITIES
+            }
+
+            appended: Dict[str, int] = {}
+            appended_rows: Dict[str, AppendedRows] = {}
+            for kind, df in frames.items():
+                filename = INGEST_TARGETS[kind]
+                path = self.base_path / filename
+                previous_stat = source_stat(path)
+                atomic_append_csv(path, df)
+                self._record_append(kind, indexes[kind], df, days[kind])
+                rows = appended_rows[filename] = AppendedRows(previous_stat, _as_read(df))
+                if kind == "fdo":
+                    appended_rows.update(self._append_fdo_factors(df))
+                if (
+                    self.partitioned is not None
+                    and filename in PARTITIONED_DATASETS
+                    and self.partitioned.has(filename)
+                ):
+                    self.partitioned.append(filename, rows.rows)
+                appended[kind] = int(len(df))
+
+            aggregates: Dict[str, List[int]] = {}
+            tray_weeks: List[int] = []
+            if "trayectorias" in frames:
+                tray_weeks = self._update_weekly_trajectories(frames["trayectorias"], tray_counts)
+                aggregates[WEEKLY_TRAJECTORIES] = tray_weeks
+
+            lc_weeks = self._critical_monday_weeks(frames.get("eventos"))
+            if tray_weeks or lc_weeks:
+                aggregates[WEEKLY_SIGNALS] = self._update_weekly_signals(tray_weeks, lc_weeks)
+
+            if "observaciones" in frames:
+                aggregates[WEEKLY_OBSERVATIONS] = self._update_observation_counts(frames["observaciones"])
+
+            # Cubos ya construidos: + celdas de las filas nuevas (sin releer
+            # el histórico). Los no construidos se arman al primer uso
+            for kind, cube in cubes.items():
+                if cube is not None:
+                    rows = appended_rows[INGEST_TARGETS[kind]].rows
+                    self.dm.extend_cube(CUBE_ENTITIES[kind], cube, rows)
+
+            snapshot_version = None
+            if self.snapshot_root is not None and (appended or new_days):
+                snapshot_version = ArrowSnapshot(
+                    update_snapshot(self.base_path, self.snapshot_root, appended_rows)
+                ).version
+
+            # Versión cacheada por mtime del directorio: se fuerza el recálculo
+            # (mtime de grano grueso o escrituras dentro del mismo tick)
+            invalidate_dataset_version(self.base_path)
+
+            return IngestionResult(
+                rows_appended=appended,
+                rows_skipped=skipped,
+                new_days=new_days,
+                aggregates=aggregates,
+                dataset_version=self.dm.dataset_version(),
+                snapshot_version=snapshot_version,
+            )
+
+    # ---------- Preparación de filas ----------
+
+    def _prepare(
+        self,
+        kind: str,
+        rows: Sequence[Mapping[str, Any]],
+        dimension: TimeDimension,
+    ) -> Tuple[pd.DataFrame, np.ndarray]:
+        path = self.base_path / INGEST_TARGETS[kind]
+        if not path.exists():
+            raise FileNotFoundError(f"Dataset no encontrado: {path}")
+
+        sample = pd.read_csv(path, nrows=BOOL_SAMPLE_ROWS, dtype=str)
+        header = list(sample.columns)
+        df = pd.DataFrame(list(rows))
+
+        extra = set(df.columns) - set(header)
+        if extra:
+            raise ValueError(f"{kind}: columnas desconocidas {sorted(extra)}")
+        if "fecha" not in df.columns or df["fecha"].isna().any():
+            raise ValueError(f"{kind}: 'fecha' es obligatoria en cada fila")
+
+        dates = parse_mixed_dates(df["fecha"])
+        if dates.isna().any():
+            raise ValueError(f"{kind}: fechas no reconocidas {df.loc[dates.isna(), 'fecha'].tolist()}")
+
+        day = to_day_ordinal(dates)
+        if (day < dimension.start_day).any():
+            raise ValueError(f"{kind}: fechas anteriores al inicio del calendario")
+
+        # Semana del calendario; días nuevos continúan semanas de lunes a domingo
+        week = dimension.week_of_day(day)
+        beyond = week == MISSING_ORDINAL
+        week[beyond] = (day[beyond] - dimension.start_day) // 7 + 1
+
+        df["fecha"] = _format_dates(dates, _uses_mdy(path)).to_numpy()
+        if "semana" in header:
+            df["semana"] = week
+        if "id_dia" in header:
+            df["id_dia"] = day - dimension.start_day + 1
+
+        df = df.reindex(columns=header)
+        # Booleanos con la codificación del archivo (no la de pandas)
+        for column in df.columns:
+            tokens = _bool_tokens(sample[column])
+            if tokens is None and _is_bool_column(df[column]):
+                tokens = BOOL_TOKENS
+            if tokens is not None:
+                df[column] = _encode_bools(df[column], tokens)
+        return df, day
+
+    def _key_index(self, kind: str) -> _KeyIndex:
+        path = (self.base_path / INGEST_TARGETS[kind]).resolve()
+        stat = source_stat(path)
+        index = _KEY_INDEXES.get(path)
+        if index is not None and index.stat == stat:
+            return index
+
+        # Primera ingesta del proceso (o fuente reescrita): columnas clave
+        header = _header(path)
+        if kind in RECORD_IDS:
+            columns = [RECORD_IDS[kind]]
+        elif kind in NATURAL_KEYS:
+            id_col, natural = NATURAL_KEYS[kind]
+            columns = [id_col, *natural]
+        else:
+            columns = ["fecha"]
+        if "semana" in header and "semana" not in columns:
+            columns.append("semana")
+
+        current = pd.read_csv(path, usecols=columns, dtype=str)
+        day = (
+            to_day_ordinal(parse_mixed_dates(current["fecha"]))
+            if "fecha" in current.columns
+            else np.full(len(current), MISSING_ORDINAL, np.int32)
+        )
+        weeks: Counter = Counter()
+        if "semana" in current.columns:
+            semana = pd.to_numeric(current["semana"], errors="coerce").dropna().astype("int64")
+            weeks.update({int(w): int(n) for w, n in semana.value_counts().items()})
+
+        index = _KeyIndex(stat=stat, keys=set(_row_keys(kind, current, day)), weeks=weeks)
+        _KEY_INDEXES[path] = index
+        return index
+
+    def _record_append(
+        self, kind: str, index: _KeyIndex, df: pd.DataFrame, day: np.ndarray
+    ) -> None:
+        # El índice sigue al archivo: claves y semanas nuevas + huella posterior al append
+        index.keys.update(_row_keys(kind, df, day))
+        if "semana" in df.columns:
+            index.weeks.update(int(w) for w in df["semana"])
+        index.stat = source_stat((self.base_path / INGEST_TARGETS[kind]).resolve())
+
+    def _drop_existing(
+        self, kind: str, df: pd.DataFrame, day: np.ndarray, index: _KeyIndex
+    ) -> Tuple[pd.DataFrame, np.ndarray, int]:
+        if kind in RECORD_IDS:
+            id_col = RECORD_IDS[kind]
+            if df[id_col].isna().any():
+                raise ValueError(f"{kind}: '{id_col}' es obligatorio en cada fila")
+
+        keys = _row_keys(kind, df, day)
+        seen = np.fromiter((k in index.keys for k in keys), dtype=bool, count=len(keys))
+        mask = ~seen & ~keys.duplicated().to_numpy()
+        return df[mask].reset_index(drop=True), day[mask], int((~mask).sum())
+
+    def _extend_calendar(self, days: Iterable[np.ndarray], dimension: TimeDimension) -> List[str]:
+        all_days = np.unique(np.concatenate(list(days) or [np.array([], np.int32)]))
+        new = all_days[dimension.week_of_day(all_days) == MISSING_ORDINAL]
+        if len(new) == 0:
+            return []
+
+        path = self.base_path / CALENDAR
+        dates = pd.Series(pd.to_datetime(new.astype("int64"), unit="D"))
+        rows = pd.DataFrame({
+            "fecha": _format_dates(dates, _uses_mdy(path)),
+            "semana": (new - dimension.start_day) // 7 + 1,
+        })
+        atomic_append_csv(path, rows.reindex(columns=_header(path)))
+        return dates.dt.strftime("%Y-%m-%d").tolist()
+
+    def _append_fdo_factors(self, df: pd.DataFrame) -> Dict[str, AppendedRows]:
+        # stde_fdo_<factor>.csv son proyecciones de stde_fdo_diario.csv
+        appended: Dict[str, AppendedRows] = {}
+        for col in df.columns:
+            path = self.base_path / f"stde_{col}.csv"
+            if not col.startswith("fdo_") or not path.exists():
+                continue
+            header = _header(path)
+            part = df.reindex(columns=header)
+            if "fecha" in header:
+                dates = parse_mixed_dates(df["fecha"])
+                part["fecha"] = _format_dates(dates, _uses_mdy(path)).to_numpy()
+            previous_stat = source_stat(path)
+            atomic_append_csv(path, part)
+            appended[path.name] = AppendedRows(previous_stat, _as_read(part))
+        return appended
+
+    # ---------- Agregados incrementales ----------
+
+    @staticmethod
+    def _week_counts(index: Optional[_KeyIndex], new: Optional[pd.DataFrame]) -> Dict[int, int]:
+        # Filas existentes por semana tocada, desde el índice (sin leer el archivo)
+        if index is None or new is None:
+            return {}
+        touched = set(int(w) for w in new["semana"])
+        return {w: index.weeks[w] for w in touched if index.weeks[w] > 0}
+
+    def _update_weekly_trajectories(
+        self, new_daily: pd.DataFrame, counts: Mapping[int, int]
+    ) -> List[int]:
+        """
+        media_nueva = (media · n + Σ nuevos) / (n + k), solo en semanas tocadas.
+        """
+        path = self.base_path / WEEKLY_TRAJECTORIES
+        weekly = pd.read_csv(path).set_index("semana")
+        targets = {
+            col: col[: -len("_media")]
+            for col in weekly.columns
+            if col.endswith("_media") and col[: -len("_media")] in new_daily.columns
+        }
+
+        updated: List[int] = []
+        for week, grp in new_daily.groupby("semana"):
+            week = int(week)
+            n, k = counts.get(week, 0), len(grp)
+            for col, src in targets.items():
+                added = float(grp[src].sum())
+                if week in weekly.index and n > 0 and pd.notna(weekly.at[week, col]):
+                    weekly.loc[week, col] = (float(weekly.at[week, col]) * n + added) / (n + k)
+                else:
+                    weekly.loc[week, col] = added / k
+            updated.append(week)
+
+        _write_csv(path, weekly.sort_index().reset_index())
+        return sorted(updated)
+
+    def _critical_monday_weeks(self, events: Optional[pd.DataFrame]) -> Set[int]:
+        if events is None or "es_lunes_critico" not in events.columns:
+            return set()
+        flag = events["es_lunes_critico"].astype(str).str.lower().isin(["true", "1"])
+        return set(int(w) for w in events.loc[flag, "semana"])
+
+    def _update_weekly_signals(self, weeks: Iterable[int], lc_weeks: Set[int]) -> List[int]:
+        """
+        Recalcula las filas de señales de las semanas tocadas y de la semana
+        siguiente (su tendencia depende de la anterior). Misma lógica que el
+        generador STDE (celdas 7.3 / 8.4).
+        """
+        path = self.base_path / WEEKLY_SIGNALS
+        signals = pd.read_parquet(path)
+        weekly = pd.read_csv(self.base_path / WEEKLY_TRAJECTORIES).set_index("semana")
+        proactivo = pd.read_csv(self.base_path / PROACTIVO)
+
+        weeks = set(int(w) for w in weeks)
+        affected = sorted(
+            w for w in weeks | {w + 1 for w in weeks} if w in weekly.index
+        )
+
+        risks = list(dict.fromkeys(signals["riesgo_id"].astype(str)))
+        peso = signals.sort_values("semana").groupby("riesgo_id")["peso_k9"].last().to_dict()
+        lc = set(int(w) for w in signals.loc[signals["es_semana_lunes_critico"], "semana"]) | lc_weeks
+
+        rows: List[Dict[str, Any]] = []
+        for week in affected:
+            rows.extend(weekly_signal_rows(week, risks, weekly, proactivo, peso))
+
+        fresh = pd.DataFrame(rows, columns=list(signals.columns))
+        out = pd.concat(
+            [signals[~signals["semana"].isin(affected)], fresh.astype(signals.dtypes.to_dict())],
+            ignore_index=True,
+        )
+        out["es_semana_lunes_critico"] = out["semana"].isin(lc)
+        out["_risk_order"] = out["riesgo_id"].map({r: i for i, r in enumerate(risks)})
+        out = out.sort_values(["semana", "_risk_order"]).drop(columns="_risk_order")
+        out = out.reset_index(drop=True)
+        atomic_write(path, lambda tmp: out.to_parquet(tmp, index=False))
+
+        return sorted(set(int(w) for w in fresh["semana"]) | (lc_weeks & set(out["semana"])))
+
+    def _update_observation_counts(self, new_obs: pd.DataFrame) -> List[int]:
+        path = self.base_path / WEEKLY_OBSERVATIONS
+        counts = pd.read_csv(path)
+
+        delta = (
+            new_obs.assign(tipo_observacion=new_obs["tipo_observacion"].astype(str))
+            .groupby(["semana", "tipo_observacion"])
+            .size()
+            .rename("delta")
+            .reset_index()
+        )
+        merged = counts.merge(delta, on=["semana", "tipo_observacion"], how="outer")
+        merged["n_observaciones"] = (
+            merged["n_observaciones"].fillna(0) + merged["delta"].fillna(0)
+        ).astype("int64")
+        merged = merged.drop(columns="delta").sort_values(["semana", "tipo_observacion"])
+        _write_csv(path, merged.reset_index(drop=True))
+
+        return sorted(set(int(w) for w in delta["semana"]))
+
+
+def ingest_daily(
+    batch: Mapping[str, Sequence[Mapping[str, Any]]],
+    base_path: str | Path = "data/synthetic",
+) -> Dict[str, Any]:
+    """Punto de entrada funcional (backend / scripts)."""
+    return DailyIngestor(base_path).ingest(batch).to_dict()
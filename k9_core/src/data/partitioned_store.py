@@ -0,0 +1,155 @@
+# src/data/partitioned_store.py
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data.atomic_io import atomic_write
+
+
+PARTITION_COLUMN = "semana"
+PART_FILENAME = "part-0.parquet"
+
+# Datasets con historia creciente (crecen con la operación real)
+PARTITIONED_DATASETS = (
+    "stde_observaciones.csv",
+    "stde_observaciones_12s.csv",
+    "stde_eventos.csv",
+    "stde_auditorias.csv",
+    "stde_auditorias_12s.csv",
+    "stde_incidentes_12s.csv",
+)
+
+
+def _dataset_dirname(filename: str) -> str:
+    return Path(filename).stem
+
+
+class PartitionedStore:
+    """
+    Layout Parquet particionado por semana:
+
+        <root>/<dataset>/semana=<N>/part-0.parquet
+
+    - Cada partición conserva la columna `semana` y el schema completo
+      del dataset (mismo schema en todas las particiones).
+    - La poda de particiones se hace por nombre de directorio:
+      un rango de semanas solo abre los archivos que lo intersectan.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    # ---------- Escritura ----------
+
+    def write(self, filename: str, df: pd.DataFrame) -> List[int]:
+        """
+        (Re)escribe todas las particiones semanales de un dataset.
+        Retorna las semanas escritas.
+        """
+        if PARTITION_COLUMN not in df.columns:
+            raise KeyError(
+                f"PartitionedStore: '{PARTITION_COLUMN}' requerido en {filename}"
+            )
+
+        # Un solo schema para todas las particiones (columnas nulas incluidas)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        weeks = df[PARTITION_COLUMN].astype("int64").to_numpy()
+
+        written: List[int] = []
+        for week in sorted(set(int(w) for w in weeks)):
+            self.write_partition(filename, week, table.filter(pa.array(weeks == week)))
+            written.append(week)
+        return written
+
+    def write_partition(self, filename: str, week: int, table: pa.Table) -> Path:
+        part_dir = self.root / _dataset_dirname(filename) / f"{PARTITION_COLUMN}={int(week)}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        path = part_dir / PART_FILENAME
+        # Lectores concurrentes ven la partición anterior o la nueva, completa
+        atomic_write(path, lambda tmp: pq.write_table(table, tmp))
+        return path
+
+    def append(self, filename: str, df: pd.DataFrame) -> List[int]:
+        """
+        Agrega filas nuevas reescribiendo solo las particiones de sus semanas.
+        Las filas se convierten al schema ya existente del dataset.
+        """
+        if PARTITION_COLUMN not in df.columns:
+            raise KeyError(
+                f"PartitionedStore: '{PARTITION_COLUMN}' requerido en {filename}"
+            )
+
+        parts = self.partitions(filename)
+        if not parts:
+            return self.write(filename, df)
+
+        schema = pq.read_schema(next(iter(parts.values())))
+        new = pa.Table.from_pandas(
+            df.reindex(columns=schema.names), schema=schema, preserve_index=False
+        )
+        weeks = df[PARTITION_COLUMN].astype("int64").to_numpy()
+
+        written: List[int] = []
+        for week in sorted(set(int(w) for w in weeks)):
+            table = new.filter(pa.array(weeks == week))
+            if week in parts:
+                table = pa.concat_tables([pq.read_table(parts[week], schema=schema), table])
+            self.write_partition(filename, week, table)
+            written.append(week)
+        return written
+
+    # ---------- Lectura ----------
+
+    def has(self, filename: str) -> bool:
+        return (self.root / _dataset_dirname(filename)).is_dir()
+
+    def partitions(self, filename: str) -> Dict[int, Path]:
+        """
+        Semana → archivo de la partición (solo listado de directorios, sin leer filas).
+        """
+        base = self.root / _dataset_dirname(filename)
+        out: Dict[int, Path] = {}
+        if not base.is_dir():
+            return out
+
+        prefix = f"{PARTITION_COLUMN}="
+        for entry in base.iterdir():
+            if not entry.is_dir() or not entry.name.startswith(prefix):
+                continue
+            path = entry / PART_FILENAME
+            if path.exists():
+                out[int(entry.name[len(prefix):])] = path
+        return dict(sorted(out.items()))
+
+    def weeks(self, filename: str) -> List[int]:
+        return list(self.partitions(filename).keys())
+
+    def partition_paths(self, filename: str, weeks: Iterable[int]) -> List[Path]:
+        parts = self.partitions(filename)
+        return [parts[w] for w in sorted(set(int(w) for w in weeks)) if w in parts]
+
+
+def build_partitioned_store(
+    source_dir: str | Path,
+    out_root: str | Path,
+    datasets: Sequence[str] = PARTITIONED_DATASETS,
+) -> Dict[str, List[int]]:
+    """
+    Convierte los datasets históricos de `source_dir` al layout particionado.
+    """
+    source_dir = Path(source_dir)
+    store = PartitionedStore(out_root)
+
+    written: Dict[str, List[int]] = {}
+    for filename in datasets:
+        path = source_dir / filename
+        if not path.exists():
+            continue
+        written[filename] = store.write(filename, pd.read_csv(path))
+    return written
@@ -0,0 +1,122 @@
+# src/data/request_context.py
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import pandas as pd
+
+from src.data.data_manager import DataManager
+from src.data.week_index import WeekIndex
+from src.time.data_slice import DataSlice
+
+
+# Base de datos por defecto de los nodos del grafo
+DEFAULT_BASE_PATH = "data/synthetic"
+
+
+class RequestDataContext:
+    """
+    Contexto de datos de UNA ejecución del grafo.
+
+    - Un único DataManager por request
+    - Cada dataset se carga como máximo una vez (lazy)
+    - El DataSlice se aplica una vez; todos los nodos reciben los mismos
+      frames (solo lectura)
+    - Vive en `K9State.data_context` (excluido de la serialización)
+    - Seguro entre ramas paralelas del grafo (una carga por clave)
+    """
+
+    def __init__(self, dm: DataManager, data_slice: Optional[DataSlice] = None):
+        self.dm = dm
+        self.data_slice = data_slice
+        self._frames: Dict[Hashable, Any] = {}
+        self._loads = 0
+        self._hits = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    # ---------- Memo por request ----------
+
+    def frame(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Valor de `key`, cargado con `load` solo la primera vez."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Un lock por clave: ramas paralelas cargan cada frame una sola vez
+        # (una carga puede pedir otros frames: claves distintas)
+        with key_lock:
+            with self._lock:
+                if key in self._frames:
+                    self._hits += 1
+                    return self._frames[key]
+            value = load()
+            with self._lock:
+                self._loads += 1
+                self._frames[key] = value
+            return value
+
+    def bind_slice(self, data_slice: Optional[DataSlice]) -> None:
+        """Fija el DataSlice del request; un cambio descarta los cortes."""
+        with self._lock:
+            if data_slice == self.data_slice:
+                return
+            self.data_slice = data_slice
+            self._frames = {k: v for k, v in self._frames.items() if k[0] != "slice"}
+
+    def stats(self) -> Dict[str, int]:
+        return {"loads": self._loads, "hits": self._hits}
+
+    # ---------- Observaciones (eje semanal) ----------
+
+    def observation_index(self) -> WeekIndex:
+        return self.frame(("full", "observaciones_index"), self.dm.get_observaciones_week_index)
+
+    def window(self) -> Optional[DataSlice]:
+        """DataSlice INDEX del request, o None si es FULL / no resuelto."""
+        if self.data_slice is not None and self.data_slice.is_index_slice():
+            return self.data_slice
+        return None
+
+    def weeks(self) -> List[int]:
+        """Semanas del DataSlice sobre el eje de observaciones."""
+        def load() -> List[int]:
+            index = self.observation_index()
+            i, j = index.week_positions(self.window())
+            return [int(w) for w in index.weeks[i:j]]
+
+        return self.frame(("slice", "weeks"), load)
+
+    def observaciones(self) -> pd.DataFrame:
+        """Tabla unificada de observaciones, cortada por el DataSlice."""
+        return self.frame(
+            ("slice", "observaciones"),
+            lambda: self.observation_index().rows(self.window()),
+        )
+
+    # ---------- Auditorías ----------
+
+    def auditorias(self) -> pd.DataFrame:
+        """Auditorías diarias de las semanas del DataSlice."""
+        def load() -> pd.DataFrame:
+            if self.window() is None:
+                return self.dm.get_auditorias()
+            weeks = self.weeks()
+            return self.dm.get_auditorias_by_week_range(weeks[0], weeks[-1] + 1)
+
+        return self.frame(("slice", "auditorias"), load)
+
+
+def ensure_data_context(state: Any, base_path: str = DEFAULT_BASE_PATH) -> RequestDataContext:
+    """
+    Contexto de datos del request en `state` (lo crea si falta) con el
+    DataSlice vigente del estado.
+    """
+    ctx = getattr(state, "data_context", None)
+    if ctx is None:
+        ctx = RequestDataContext(DataManager(base_path), state.data_slice)
+        state.data_context = ctx
+    else:
+        ctx.bind_slice(state.data_slice)
+    return ctx
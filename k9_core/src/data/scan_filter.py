@@ -0,0 +1,116 @@
+# src/data/scan_filter.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+from src.data.time_dimension import WEEK_KEY
+
+
+_Values = Union[str, Sequence[str], None]
+
+
+def _as_tuple(values: _Values) -> Optional[Tuple[str, ...]]:
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return (values,)
+    return tuple(values)
+
+
+@dataclass(frozen=True)
+class ScanFilter:
+    """
+    Predicados de lectura para los getters de DataManager.
+
+    - Se empujan al scanner de pyarrow (store particionado) como expresión
+    - O se aplican en memoria sobre frames cacheados (misma semántica)
+
+    Semántica:
+    - `week_range` es [start, end) sobre `semana`
+    - Los filtros por valor aceptan un valor o una lista (IN)
+    - Si el dataset NO tiene la columna filtrada, ninguna fila calza
+      (igual que filtrar un concat donde la columna queda nula)
+    - En memoria, el rango semanal usa la clave int32 canónica si existe
+    """
+
+    week_range: Optional[Tuple[int, int]] = None
+    riesgo_id: _Values = None
+    tipo_observacion: _Values = None
+    id_area: _Values = None
+
+    def __post_init__(self) -> None:
+        for name in ("riesgo_id", "tipo_observacion", "id_area"):
+            object.__setattr__(self, name, _as_tuple(getattr(self, name)))
+        if self.week_range is not None:
+            start, end = self.week_range
+            object.__setattr__(self, "week_range", (int(start), int(end)))
+
+    # -----------------------------
+    # Introspección
+    # -----------------------------
+
+    def _value_terms(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        return [
+            (col, values)
+            for col, values in (
+                ("riesgo_id", self.riesgo_id),
+                ("tipo_observacion", self.tipo_observacion),
+                ("id_area", self.id_area),
+            )
+            if values is not None
+        ]
+
+    def columns(self) -> List[str]:
+        cols = [c for c, _ in self._value_terms()]
+        if self.week_range is not None:
+            cols.insert(0, "semana")
+        return cols
+
+    def keeps_week(self, week: int) -> bool:
+        if self.week_range is None:
+            return True
+        start, end = self.week_range
+        return start <= week < end
+
+    def filter_weeks(self, weeks: Iterable[int]) -> List[int]:
+        return [w for w in weeks if self.keeps_week(w)]
+
+    # -----------------------------
+    # Pushdown (pyarrow)
+    # -----------------------------
+
+    def to_expression(self, available: Sequence[str]) -> ds.Expression:
+        if any(c not in available for c in self.columns()):
+            return ds.scalar(False)
+
+        expr = ds.scalar(True)
+        if self.week_range is not None:
+            start, end = self.week_range
+            expr = expr & (ds.field("semana") >= start) & (ds.field("semana") < end)
+        for col, values in self._value_terms():
+            expr = expr & ds.field(col).isin(list(values))
+        return expr
+
+    # -----------------------------
+    # Equivalente en memoria (pandas)
+    # -----------------------------
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        week_col = WEEK_KEY if WEEK_KEY in df.columns else "semana"
+        required = [week_col if c == "semana" else c for c in self.columns()]
+        if any(c not in df.columns for c in required):
+            return pd.Series(False, index=df.index)
+
+        keep = pd.Series(True, index=df.index)
+        if self.week_range is not None:
+            start, end = self.week_range
+            weeks = df[week_col]
+            keep &= (weeks >= start) & (weeks < end)
+        for col, values in self._value_terms():
+            keep &= df[col].isin(values)
+        return keep
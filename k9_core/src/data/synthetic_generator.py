@@ -0,0 +1,668 @@
+# src/data/synthetic_generator.py
+
+from __future__ import annotations
+
+import shutil
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.data.atomic_io import atomic_write
+from src.data.dtype_registry import CATALOG_DOMAINS, DEFAULT_ONTOLOGY_DIR
+from src.data.ingestion import weekly_signal_rows
+from src.data.partitioned_store import PARTITIONED_DATASETS, PartitionedStore
+
+
+DATA_ROOT = Path(__file__).resolve().parents[2] / "data"
+DEFAULT_OMS_PATH = DATA_ROOT / "oms" / "99_oms_stde_v3.yaml"
+DEFAULT_TEMPLATE_DIR = DATA_ROOT / "synthetic"
+
+FDO_COLUMNS = (
+    "fdo_produccion",
+    "fdo_backlog",
+    "fdo_congestion",
+    "fdo_fatiga",
+    "fdo_clima",
+    "fdo_dotacion",
+    "fdo_variabilidad",
+)
+
+# Trayectorias de criticidad (celda 2.1): base + pendiente sobre t ∈ [0, 1]
+TRAJECTORY_PROFILES: Dict[str, tuple] = {
+    "R01": (0.25, 0.25),   # controlado con señales débiles
+    "R02": (0.35, 0.50),   # degradación acumulada fuerte
+}
+R03_BASE = 0.18            # estable con picos aislados
+
+# Ponderación de la trayectoria global (celda 2.2); riesgos extra = 0.25
+PESOS_RIESGO_GLOBAL = {"R01": 0.25, "R02": 0.5, "R03": 0.25}
+PESO_RIESGO_EXTRA = 0.25
+
+# Riesgos sin mapeo operacional: peso uniforme en todas las áreas
+PESO_AREA_EXTRA = 0.1
+
+# Carga diaria OPG por área (celda 4.1)
+OPG_POR_AREA = {"MRA": (2, 4)}
+OPG_DEFAULT = (1, 3)
+
+# OCC planificadas por sitio y semana (celda 4.2), repartidas por ranking
+OCC_POR_SEMANA = 16
+OCC_SHARES = (0.5, 0.3, 0.2)
+
+# AUF planificadas por sitio, mes y riesgo (celda 5.2)
+AUF_PLANIFICADAS_POR_MES = 5
+
+# Datasets producidos por el generador (el resto se copia del template)
+GENERATED_DATASETS = (
+    "dates.csv",
+    "stde_fdo_diario.csv",
+    "stde_trayectorias_diarias.csv",
+    "stde_trayectorias_semanales.csv",
+    "stde_eventos.csv",
+    "stde_observaciones.csv",
+    "stde_auditorias.csv",
+    "stde_proactivo_semanal_v4_4.csv",
+    "k9_observaciones_semana.csv",
+    "k9_weekly_signals.parquet",
+) + tuple(f"stde_{c}.csv" for c in FDO_COLUMNS)
+
+
+# =====================================================
+# Helpers de muestreo vectorizado
+# =====================================================
+
+def _load_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _catalog(path: Path) -> List[Dict[str, Any]]:
+    data = _load_yaml(path) if path.exists() else []
+    return [item for item in data or [] if isinstance(item, dict)]
+
+
+def _mdy(dates: pd.DatetimeIndex) -> np.ndarray:
+    # Formato de los datasets transaccionales (m/d/Y sin ceros)
+    return (
+        dates.month.astype(str) + "/" + dates.day.astype(str) + "/" + dates.year.astype(str)
+    ).to_numpy()
+
+
+def _ids(prefix: str, n: int) -> np.ndarray:
+    return (prefix + pd.Series(np.arange(1, n + 1)).astype(str).str.zfill(6)).to_numpy()
+
+
+def _choice_rows(rng: np.random.Generator, probs: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Una muestra categórica por elemento de `rows`, con la distribución
+    `probs[row]` (una fila de probabilidades por grupo).
+    """
+    cum = np.cumsum(probs, axis=1)
+    u = rng.random(len(rows)) * cum[rows, -1]
+    picked = (u[:, None] >= cum[rows]).sum(axis=1)
+    return np.minimum(picked, probs.shape[1] - 1)
+
+
+class _Pool:
+    """
+    Valores agrupados (roles / tareas por área, controles por riesgo) en un
+    arreglo plano con offsets: una muestra uniforme por fila sin loops.
+    """
+
+    def __init__(self, groups: Sequence[Sequence[str]]):
+        flat = [v for g in groups for v in g]
+        self.values = np.array(flat + [None], dtype=object)
+        self.sizes = np.array([len(g) for g in groups], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(self.sizes)[:-1]]).astype(np.int64)
+
+    def sample(self, rng: np.random.Generator, group: np.ndarray) -> np.ndarray:
+        sizes = self.sizes[group]
+        pick = (rng.random(len(group)) * sizes).astype(np.int64)
+        idx = np.where(sizes > 0, self.offsets[group] + pick, len(self.values) - 1)
+        return self.values[idx]
+
+    def available(self, group: np.ndarray) -> np.ndarray:
+        return self.sizes[group] > 0
+
+
+# =====================================================
+# Resultado
+# =====================================================
+
+@dataclass
+class SyntheticDataset:
+    n_sites: int
+    n_weeks: int
+    risks: List[str]
+    seed: int
+    frames: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def rows(self) -> Dict[str, int]:
+        return {name: len(df) for name, df in self.frames.items()}
+
+    def write(
+        self,
+        out_dir: str | Path,
+        partitioned_dir: str | Path | None = None,
+        template_dir: str | Path | None = DEFAULT_TEMPLATE_DIR,
+    ) -> Dict[str, Any]:
+        """
+        Escribe los datasets en `out_dir` (mismos nombres y formatos que
+        data/synthetic) y, si se indica, los datasets con historia
+        creciente directo al store particionado por semana.
+
+        Los datasets que el generador no produce (*_12s, catálogos,
+        thresholds) se copian desde `template_dir` para que el DataManager
+        pueda cargar el directorio completo.
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Publicación atómica: un directorio en uso cambia de versión
+        # (dataset_version se cachea por mtime del directorio)
+        for name, df in self.frames.items():
+            if name.endswith(".parquet"):
+                atomic_write(out_dir / name, lambda tmp, df=df: df.to_parquet(tmp, index=False))
+            else:
+                atomic_write(out_dir / name, lambda tmp, df=df: df.to_csv(tmp, index=False))
+
+        partitions: Dict[str, List[int]] = {}
+        if partitioned_dir:
+            store = PartitionedStore(partitioned_dir)
+            for name in PARTITIONED_DATASETS:
+                if name in self.frames:
+                    partitions[name] = store.write(name, self.frames[name])
+
+        copied: List[str] = []
+        if template_dir and Path(template_dir).is_dir():
+            for path in sorted(Path(template_dir).iterdir()):
+                if path.is_file() and path.name not in self.frames and not (out_dir / path.name).exists():
+                    shutil.copy2(path, out_dir / path.name)
+                    copied.append(path.name)
+
+        return {
+            "out_dir": str(out_dir),
+            "rows": self.rows(),
+            "partitions": {k: len(v) for k, v in partitions.items()},
+            "copied": copied,
+        }
+
+
+# =====================================================
+# Generador
+# =====================================================
+
+class STDEGenerator:
+    """
+    Generador STDE v3 vectorizado (versión módulo del notebook
+    01_generate_stde_v3).
+
+    - Parámetros del escenario desde la OMS (fecha de inicio, semanas,
+      riesgos modelados, pesos riesgo × área) y catálogos ontológicos
+      (roles / tareas por área, controles por riesgo)
+    - Escala: N sitios × M semanas × K riesgos. FDO y trayectorias son
+      de la operación (grano diario); eventos, observaciones y auditorías
+      se muestrean por sitio (columna `id_sitio`)
+    - Todo el muestreo es NumPy vectorizado con `default_rng(seed)`:
+      misma semilla → mismos datasets
+    - El lunes crítico no se genera: es narrativa del escenario real
+      (overlay del DataEngine), no volumen
+    """
+
+    def __init__(
+        self,
+        oms_path: str | Path = DEFAULT_OMS_PATH,
+        ontology_path: str | Path = DEFAULT_ONTOLOGY_DIR,
+    ):
+        self.oms = _load_yaml(Path(oms_path)) or {}
+        ontology_path = Path(ontology_path)
+
+        escenario = self.oms.get("escenario_operacion", {})
+        self.start = date.fromisoformat(str(escenario.get("fecha_inicio", "2024-11-11")))
+        self.default_weeks = int(escenario.get("numero_semanas", 12))
+
+        self.modeled_risks = [
+            str(r["id_riesgo"]) for r in self.oms.get("riesgos_modelados", []) if "id_riesgo" in r
+        ]
+        self.risk_by_area: Dict[str, Dict[str, float]] = {
+            area: {str(x["riesgo_id"]): float(x["peso_relativo"]) for x in items}
+            for area, items in (
+                self.oms.get("mapeos_operacionales", {}).get("riesgo_por_area", {}) or {}
+            ).items()
+        }
+        self.areas = list(self.risk_by_area)
+
+        roles = _catalog(ontology_path / CATALOG_DOMAINS["rol"])
+        tareas = _catalog(ontology_path / CATALOG_DOMAINS["tarea"])
+        controles = _catalog(ontology_path / CATALOG_DOMAINS["control"])
+
+        self.roles = _Pool([
+            [str(r["id"]) for r in roles if r.get("area_operacional") == a] for a in self.areas
+        ])
+        self.tareas = _Pool([
+            [str(t["id"]) for t in tareas if t.get("area_operacional") == a] for a in self.areas
+        ])
+        self._controles = controles
+
+    # ---------- Configuración ----------
+
+    def resolve_risks(self, risks: int | Sequence[str] | None = None) -> List[str]:
+        """
+        None → riesgos modelados de la OMS; int K → los K primeros
+        (R04+ se sintetizan); lista → tal cual.
+        """
+        if risks is None:
+            return list(self.modeled_risks)
+        if isinstance(risks, int):
+            out = list(self.modeled_risks[:risks])
+            n = len(out)
+            while len(out) < risks:
+                n += 1
+                candidate = f"R{n:02d}"
+                if candidate not in out:
+                    out.append(candidate)
+            return out
+        return [str(r) for r in risks]
+
+    def _area_risk_weights(self, risks: Sequence[str]) -> np.ndarray:
+        weights = np.array(
+            [[self.risk_by_area[a].get(r, PESO_AREA_EXTRA) for r in risks] for a in self.areas]
+        )
+        return weights / weights.sum(axis=1, keepdims=True)
+
+    # ---------- Series diarias de la operación ----------
+
+    @staticmethod
+    def _fdo(rng: np.random.Generator, t: np.ndarray, dow: np.ndarray) -> Dict[str, np.ndarray]:
+        # Celda 1.2: patrones suaves de degradación hacia la última semana
+        n = len(t)
+
+        def noise(sd: float) -> np.ndarray:
+            return rng.normal(0, sd, n)
+
+        fdo = {
+            "fdo_produccion": 0.3 + 0.6 * t + noise(0.05),
+            "fdo_backlog": 0.2 + 0.7 * t + noise(0.05),
+            "fdo_congestion": 0.25 + 0.6 * t + noise(0.05),
+            "fdo_fatiga": 0.2 + 0.6 * t + np.where(np.isin(dow, (3, 4)), 0.1, 0.0) + noise(0.05),
+            "fdo_clima": 0.4 + 0.2 * np.sin(2 * np.pi * t) + noise(0.1),
+            "fdo_dotacion": 0.9 - 0.3 * t + noise(0.05),
+            "fdo_variabilidad": 0.2 + 0.6 * t + noise(0.05),
+        }
+        return {k: np.clip(v, 0.0, 1.0) for k, v in fdo.items()}
+
+    @staticmethod
+    def _trajectories(
+        rng: np.random.Generator, t: np.ndarray, risks: Sequence[str]
+    ) -> np.ndarray:
+        # Celda 2.1; riesgos sin perfil → base y pendiente sorteadas
+        n = len(t)
+        out = np.empty((n, len(risks)))
+        for k, risk in enumerate(risks):
+            if risk == "R03":
+                peak = np.where(rng.random(n) < 0.05, 0.02, 0.0)
+                values = R03_BASE + rng.uniform(-0.03, 0.03, n) + peak
+            else:
+                base, slope = TRAJECTORY_PROFILES.get(risk) or (
+                    rng.uniform(0.15, 0.35), rng.uniform(0.0, 0.3)
+                )
+                values = base + slope * t + rng.normal(0, 0.03, n)
+            out[:, k] = np.clip(values, 0.0, 1.0)
+        return out
+
+    # ---------- Generación ----------
+
+    def generate(
+        self,
+        n_sites: int = 1,
+        n_weeks: Optional[int] = None,
+        risks: int | Sequence[str] | None = None,
+        seed: int = 42,
+    ) -> SyntheticDataset:
+        n_weeks = int(n_weeks or self.default_weeks)
+        risks = self.resolve_risks(risks)
+        if n_sites < 1 or n_weeks < 1 or not risks:
+            raise ValueError("STDEGenerator: n_sites, n_weeks y risks deben ser > 0")
+
+        rng = np.random.default_rng(seed)
+
+        # ---------- Calendario ----------
+        days = pd.date_range(self.start, periods=n_weeks * 7, freq="D")
+        n_days = len(days)
+        week = np.arange(n_days) // 7 + 1
+        t = (week - 1) / max(n_weeks - 1, 1)
+        fecha_mdy = _mdy(days)
+        fecha_iso = days.strftime("%Y-%m-%d").to_numpy()
+
+        fdo = self._fdo(rng, t, days.dayofweek.to_numpy())
+        traj = self._trajectories(rng, t, risks)
+
+        pesos = np.array([PESOS_RIESGO_GLOBAL.get(r, PESO_RIESGO_EXTRA) for r in risks])
+        global_crit = traj @ (pesos / pesos.sum())
+
+        frames: Dict[str, pd.DataFrame] = {}
+        frames["dates.csv"] = pd.DataFrame({"fecha": fecha_mdy, "semana": week})
+
+        daily = {"id_dia": np.arange(1, n_days + 1), "fecha": fecha_iso, "semana": week}
+        frames["stde_fdo_diario.csv"] = pd.DataFrame({**daily, **fdo})
+        for col in FDO_COLUMNS:
+            frames[f"stde_{col}.csv"] = pd.DataFrame({**daily, col: fdo[col]})
+
+        tray = pd.DataFrame(daily)
+        for k, risk in enumerate(risks):
+            tray[f"criticidad_{risk}"] = traj[:, k]
+        tray["criticidad_global"] = global_crit
+        frames["stde_trayectorias_diarias.csv"] = tray
+
+        crit_cols = [f"criticidad_{r}" for r in risks] + ["criticidad_global"]
+        weekly = (
+            tray.groupby("semana", as_index=False)[crit_cols]
+            .mean()
+            .rename(columns={c: f"{c}_media" for c in crit_cols})
+        )
+        frames["stde_trayectorias_semanales.csv"] = weekly
+
+        ctx = _Context(self, rng, risks, n_sites, days, week, fecha_mdy, fdo, traj, weekly)
+        eventos = ctx.eventos()
+        frames["stde_eventos.csv"] = eventos
+        frames["stde_observaciones.csv"] = ctx.observaciones()
+        frames["stde_auditorias.csv"] = ctx.auditorias(eventos)
+
+        proactivo = ctx.proactivo()
+        frames["stde_proactivo_semanal_v4_4.csv"] = proactivo
+        frames["k9_weekly_signals.parquet"] = ctx.weekly_signals(proactivo)
+
+        obs = frames["stde_observaciones.csv"]
+        frames["k9_observaciones_semana.csv"] = (
+            obs.groupby(["semana", "tipo_observacion"])
+            .size()
+            .rename("n_observaciones")
+            .reset_index()
+            .sort_values(["semana", "tipo_observacion"])
+            .reset_index(drop=True)
+        )
+
+        return SyntheticDataset(n_sites, n_weeks, risks, seed, frames)
+
+
+class _Context:
+    """Estado de una corrida de generación (arreglos compartidos por etapa)."""
+
+    def __init__(
+        self,
+        gen: STDEGenerator,
+        rng: np.random.Generator,
+        risks: List[str],
+        n_sites: int,
+        days: pd.DatetimeIndex,
+        week: np.ndarray,
+        fecha: np.ndarray,
+        fdo: Mapping[str, np.ndarray],
+        traj: np.ndarray,
+        weekly: pd.DataFrame,
+    ):
+        self.gen = gen
+        self.rng = rng
+        self.risks = risks
+        self.n_sites = n_sites
+        self.days = days
+        self.week = week
+        self.fecha = fecha
+        self.fdo = fdo
+        self.traj = traj
+        self.weekly = weekly
+
+        self.areas = np.array(gen.areas, dtype=object)
+        self.sites = np.array([f"S{i:03d}" for i in range(1, n_sites + 1)], dtype=object)
+        self.risk_ids = np.array(risks, dtype=object)
+        self.area_risk = gen._area_risk_weights(risks)
+        self.controles = _Pool([
+            [str(c["id"]) for c in gen._controles if c.get("riesgo_asociado") == r] for r in risks
+        ])
+
+    def _grid(self) -> tuple:
+        # Celdas día × sitio × área (orden día-mayor = orden cronológico)
+        n_days, n_sites, n_areas = len(self.days), self.n_sites, len(self.areas)
+        day = np.repeat(np.arange(n_days), n_sites * n_areas)
+        site = np.tile(np.repeat(np.arange(n_sites), n_areas), n_days)
+        area = np.tile(np.arange(n_areas), n_days * n_sites)
+        return day, site, area
+
+    def _staffed(self, area: np.ndarray) -> np.ndarray:
+        return self.gen.roles.available(area) & self.gen.tareas.available(area)
+
+    # ---------- Eventos (celdas 3.1 / 3.2) ----------
+
+    def eventos(self) -> pd.DataFrame:
+        rng = self.rng
+        day, site, area = self._grid()
+
+        risk = _choice_rows(rng, self.area_risk, area)
+        crit = self.traj[day, risk]
+
+        p_pd = np.minimum((0.18 + 0.12 * crit) * (1 + 0.20 * self.fdo["fdo_congestion"][day]), 0.40)
+        p_nm = np.minimum((0.04 + 0.06 * crit) * (1 + 0.10 * self.fdo["fdo_clima"][day]), 0.12)
+        p_im = np.minimum((0.003 + 0.01 * crit) * (1 + 0.05 * self.fdo["fdo_fatiga"][day]), 0.02)
+
+        r = rng.random(len(day))
+        tipo = np.select(
+            [r < p_pd, r < p_pd + p_nm, r < p_pd + p_nm + p_im],
+            ["HAZARD", "NMS", "IMEN"],
+            default="",
+        )
+        keep = (tipo != "") & self._staffed(area)
+        day, site, area, risk, crit, tipo = (
+            x[keep] for x in (day, site, area, risk, crit, tipo)
+        )
+
+        n = len(day)
+        return pd.DataFrame({
+            "id_dia": day + 1,
+            "fecha": self.fecha[day],
+            "semana": self.week[day],
+            "id_area": self.areas[area],
+            "riesgo_id": self.risk_ids[risk],
+            "tipo_evento": tipo,
+            "criticidad": crit,
+            "rol_id": self.gen.roles.sample(rng, area),
+            "tarea_id": self.gen.tareas.sample(rng, area),
+            "id_evento": np.full(n, None, dtype=object),
+            "id_evento_compuesto": np.full(n, None, dtype=object),
+            "es_lunes_critico": np.zeros(n, dtype=bool),
+            "descripcion_evento": np.full(n, None, dtype=object),
+            "evento_principal_ocurrido": np.full(n, None, dtype=object),
+            "id_sitio": self.sites[site],
+        })
+
+    # ---------- Observaciones (celdas 4.1 – 4.3) ----------
+
+    def _opg(self) -> Dict[str, np.ndarray]:
+        rng = self.rng
+        day, site, area = self._grid()
+
+        bounds = np.array([OPG_POR_AREA.get(a, OPG_DEFAULT) for a in self.areas])
+        counts = rng.integers(bounds[area, 0], bounds[area, 1] + 1)
+        counts = np.where(self._staffed(area), counts, 0)
+        day, site, area = (np.repeat(x, counts) for x in (day, site, area))
+
+        p_neg = np.minimum(
+            0.03 + 0.10 * self.fdo["fdo_congestion"] + 0.07 * self.fdo["fdo_fatiga"], 0.20
+        )
+        estado = np.where(rng.random(len(day)) < p_neg[day], "OPG-", "OPG+")
+        rol = self.gen.roles.sample(rng, area)
+
+        n = len(day)
+        return {
+            "day": day,
+            "site": site,
+            "area": area,
+            "rol_observador_id": rol,
+            "rol_observado_id": rol,  # simplificación STDE v3
+            "tarea_id": self.gen.tareas.sample(rng, area),
+            "tipo_observacion": np.full(n, "OPG", dtype=object),
+            "estado": estado.astype(object),
+            "riesgo_id": np.full(n, None, dtype=object),
+            "is_control_critico": np.zeros(n, dtype=bool),
+            "control_critico_id": np.full(n, None, dtype=object),
+        }
+
+    def _occ(self) -> Dict[str, np.ndarray]:
+        rng = self.rng
+        n_weeks = len(self.weekly)
+
+        # Reparto 50/30/20 según el orden semanal de criticidad media
+        shares = OCC_SHARES[: len(self.risks)]
+        counts = [int(round(OCC_POR_SEMANA * s)) for s in shares[:-1]]
+        counts.append(OCC_POR_SEMANA - sum(counts))
+        slots = np.repeat(np.arange(len(shares)), counts)
+
+        means = self.weekly[[f"criticidad_{r}_media" for r in self.risks]].to_numpy()
+        order = np.argsort(-means, axis=1, kind="stable")     # semana × rank → riesgo
+        plan = order[:, slots]                                  # semana × OCC → riesgo
+
+        per_site = plan.size
+        risk = np.tile(plan.ravel(), self.n_sites)
+        week_idx = np.tile(np.repeat(np.arange(n_weeks), len(slots)), self.n_sites)
+        site = np.repeat(np.arange(self.n_sites), per_site)
+        day = week_idx * 7 + rng.integers(0, 7, len(risk))
+
+        area = _choice_rows(rng, self.area_risk.T, risk)
+        keep = self._staffed(area)
+        day, site, area, risk = (x[keep] for x in (day, site, area, risk))
+
+        estado = np.where(rng.random(len(day)) < 0.7, "OCC+", "OCC-")
+        control = self.controles.sample(rng, risk)
+
+        n = len(day)
+        return {
+            "day": day,
+            "site": site,
+            "area": area,
+            "rol_observador_id": self.gen.roles.sample(rng, area),
+            "rol_observado_id": self.gen.roles.sample(rng, area),
+            "tarea_id": self.gen.tareas.sample(rng, area),
+            "tipo_observacion": np.full(n, "OCC", dtype=object),
+            "estado": estado.astype(object),
+            "riesgo_id": self.risk_ids[risk],
+            "is_control_critico": pd.notna(control),
+            "control_critico_id": control,
+        }
+
+    def observaciones(self) -> pd.DataFrame:
+        opg, occ = self._opg(), self._occ()
+        cols = {k: np.concatenate([opg[k], occ[k]]) for k in opg}
+
+        order = np.lexsort((cols["area"], cols["site"], cols["day"]))
+        cols = {k: v[order] for k, v in cols.items()}
+        day, site, area = cols.pop("day"), cols.pop("site"), cols.pop("area")
+
+        return pd.DataFrame({
+            "id_observacion": _ids("OBS_", len(day)),
+            "fecha": self.fecha[day],
+            "semana": self.week[day],
+            "id_area": self.areas[area],
+            **cols,
+            "id_sitio": self.sites[site],
+        })
+
+    # ---------- Auditorías (celdas 5.1 – 5.3) ----------
+
+    def auditorias(self, eventos: pd.DataFrame) -> pd.DataFrame:
+        rng = self.rng
+        n_days = len(self.days)
+        area_index = {a: i for i, a in enumerate(self.areas)}
+        site_index = {s: i for i, s in enumerate(self.sites)}
+
+        # Reactivas: NMS / IMEN → AUF en ≤ 48 h, misma área y riesgo focal
+        reactive = eventos[eventos["tipo_evento"].isin(["NMS", "IMEN"])]
+        r_day = np.minimum(
+            reactive["id_dia"].to_numpy() - 1 + rng.integers(0, 3, len(reactive)), n_days - 1
+        )
+        r_area = reactive["id_area"].map(area_index).to_numpy(dtype=np.int64)
+        r_site = reactive["id_sitio"].map(site_index).to_numpy(dtype=np.int64)
+        r_week = reactive["semana"].to_numpy()
+        r_risk = reactive["riesgo_id"].to_numpy(dtype=object)
+
+        # Planificadas: 5 por riesgo y mes, día y área al azar
+        month = self.days.to_period("M")
+        _, start, length = np.unique(month.asi8, return_index=True, return_counts=True)
+        n_months, n_risks = len(start), len(self.risks)
+        per_site = n_months * n_risks * AUF_PLANIFICADAS_POR_MES
+
+        m = np.tile(np.repeat(np.arange(n_months), n_risks * AUF_PLANIFICADAS_POR_MES), self.n_sites)
+        p_risk = np.tile(
+            np.repeat(np.arange(n_risks), AUF_PLANIFICADAS_POR_MES), n_months * self.n_sites
+        )
+        p_site = np.repeat(np.arange(self.n_sites), per_site)
+        p_day = start[m] + (rng.random(len(m)) * length[m]).astype(np.int64)
+        p_area = rng.integers(0, len(self.areas), len(m))
+
+        n_r, n_p = len(r_day), len(p_day)
+        day = np.concatenate([r_day, p_day])
+        site = np.concatenate([r_site, p_site])
+        area = np.concatenate([r_area, p_area])
+        semana = np.concatenate([r_week, self.week[p_day]])
+        riesgo = np.concatenate([r_risk, self.risk_ids[p_risk]])
+        origen = np.array(["reactiva"] * n_r + ["planificada"] * n_p, dtype=object)
+        rol = self.gen.roles.sample(rng, area)
+
+        order = np.lexsort((area, site, day))
+        return pd.DataFrame({
+            "id_auditoria_final": _ids("AUF_", len(day)),
+            "fecha": self.fecha[day[order]],
+            "semana": semana[order],
+            "id_area": self.areas[area[order]],
+            "riesgo_focal": riesgo[order],
+            "tipo_auditoria": np.full(len(day), "AUF", dtype=object),
+            "origen": origen[order],
+            "rol_auditor_id": rol[order],
+            "id_evento_asociado": np.full(len(day), None, dtype=object),
+            "id_sitio": self.sites[site[order]],
+        })
+
+    # ---------- Agregados semanales ----------
+
+    def proactivo(self) -> pd.DataFrame:
+        """
+        Ranking semanal sintético: orden por criticidad media (el modelo
+        proactivo v4.4 solo existe para el escenario de 12 semanas).
+        """
+        long = self.weekly.melt(
+            id_vars="semana",
+            value_vars=[f"criticidad_{r}_media" for r in self.risks],
+            var_name="riesgo_id",
+            value_name="score_proactivo",
+        )
+        long["riesgo_id"] = long["riesgo_id"].str.slice(len("criticidad_"), -len("_media"))
+        long["score_proactivo"] = long["score_proactivo"].round(4)
+        long = long.rename(columns={"semana": "semana_id"})
+        long = long.sort_values(["semana_id", "score_proactivo"], ascending=[True, False], kind="stable")
+        long["rank_proactivo"] = long.groupby("semana_id").cumcount() + 1
+        return long.reset_index(drop=True)
+
+    def weekly_signals(self, proactivo: pd.DataFrame) -> pd.DataFrame:
+        weekly = self.weekly.set_index("semana")
+        rows: List[Dict[str, Any]] = []
+        for week in weekly.index:
+            rows.extend(weekly_signal_rows(int(week), self.risks, weekly, proactivo, {}))
+        return pd.DataFrame(rows)
+
+
+def generate_stde(
+    out_dir: str | Path,
+    n_sites: int = 1,
+    n_weeks: Optional[int] = None,
+    risks: int | Sequence[str] | None = None,
+    seed: int = 42,
+    partitioned_dir: str | Path | None = None,
+    template_dir: str | Path | None = DEFAULT_TEMPLATE_DIR,
+    oms_path: str | Path = DEFAULT_OMS_PATH,
+) -> Dict[str, Any]:
+    """Punto de entrada funcional (scripts / benchmarks)."""
+    dataset = STDEGenerator(oms_path).generate(n_sites, n_weeks, risks, seed)
+    return dataset.write(out_dir, partitioned_dir, template_dir)
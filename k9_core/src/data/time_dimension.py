@@ -0,0 +1,198 @@
+# src/data/time_dimension.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Claves temporales canónicas (int32) agregadas por el loader
+DAY_KEY = "dia_ord"       # días desde 1970-01-01
+WEEK_KEY = "semana_ord"   # semana STDE (1..N)
+
+# Centinela para fechas / semanas no resolubles
+MISSING_ORDINAL = np.iinfo(np.int32).min
+
+# Columnas de origen, en orden de preferencia
+_WEEK_SOURCES = ("semana", "semana_id", "week")
+TIME_SOURCE_COLUMNS = ("fecha", "id_dia") + _WEEK_SOURCES
+
+# Columnas que definen el dominio temporal de un dataset (metadatos)
+TIME_DOMAIN_COLUMNS = _WEEK_SOURCES + ("fecha",)
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y")
+
+
+def parse_mixed_dates(values: pd.Series) -> pd.Series:
+    """
+    Parseo vectorizado de fechas en formatos mixtos (`2024-11-11`, `11/11/2024`).
+    Una pasada vectorizada por formato; lo no parseable queda NaT.
+    """
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    text = values.astype("string")
+    for fmt in _DATE_FORMATS:
+        pending = parsed.isna()
+        if not pending.any():
+            break
+        parsed[pending] = pd.to_datetime(text[pending], format=fmt, errors="coerce")
+    return parsed
+
+
+def to_day_ordinal(dates: pd.Series) -> np.ndarray:
+    days = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    out = days.astype(np.int64)
+    out[np.isnat(days)] = MISSING_ORDINAL
+    return out.astype(np.int32)
+
+
+def to_int32_key(values: pd.Series) -> np.ndarray:
+    numeric = pd.to_numeric(values, errors="coerce")
+    return numeric.fillna(MISSING_ORDINAL).to_numpy().astype(np.int32)
+
+
+def describe_time_domain(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Dominio temporal de un dataset: min / max / períodos / granularidad.
+
+    - Semanal si tiene columna de semana (`semana` / `semana_id` / `week`)
+    - Diario (fechas ISO) si solo tiene `fecha`
+    - None si no tiene columnas temporales o no tiene filas
+    """
+    week_source = next((c for c in _WEEK_SOURCES if c in df.columns), None)
+    if week_source is not None:
+        values = pd.to_numeric(df[week_source], errors="coerce").dropna().astype("int64")
+        granularity = "week"
+    elif "fecha" in df.columns:
+        values = parse_mixed_dates(df["fecha"]).dropna().dt.strftime("%Y-%m-%d")
+        granularity = "day"
+    else:
+        return None
+
+    if values.empty:
+        return None
+    return {
+        "min": str(values.min()),
+        "max": str(values.max()),
+        "granularity": granularity,
+        "total_periods": int(values.nunique()),
+    }
+
+
+class TimeDimension:
+    """
+    Dimensión temporal canónica construida desde `dates.csv`.
+
+    - Un día por fila: fecha → (dia_ord, semana_ord)
+    - Permite resolver semana desde día (y `id_dia` → día) sin parsear texto
+    - Joins diario ↔ semanal por posición (O(n)), sin merge por strings
+    """
+
+    def __init__(self, dates: pd.DataFrame):
+        if "fecha" not in dates.columns or "semana" not in dates.columns:
+            raise KeyError("TimeDimension: dates requiere columnas 'fecha' y 'semana'.")
+
+        day = to_day_ordinal(parse_mixed_dates(dates["fecha"]))
+        week = to_int32_key(dates["semana"])
+        order = np.argsort(day, kind="stable")
+
+        self.frame = pd.DataFrame({DAY_KEY: day[order], WEEK_KEY: week[order]})
+        self.start_day = int(self.frame[DAY_KEY].iloc[0])
+        self.end_day = int(self.frame[DAY_KEY].iloc[-1])
+
+        # Lookup denso día → semana (el calendario es contiguo)
+        self._week_by_offset = np.full(
+            self.end_day - self.start_day + 1, MISSING_ORDINAL, np.int32
+        )
+        offsets = self.frame[DAY_KEY].to_numpy() - self.start_day
+        self._week_by_offset[offsets] = self.frame[WEEK_KEY].to_numpy()
+
+    @property
+    def weeks(self) -> np.ndarray:
+        return np.unique(self.frame[WEEK_KEY].to_numpy())
+
+    def day_of_id(self, id_dia: pd.Series) -> np.ndarray:
+        """`id_dia` es 1-based sobre el calendario STDE."""
+        ids = to_int32_key(id_dia)
+        out = (self.start_day + ids - 1).astype(np.int32)
+        out[ids == MISSING_ORDINAL] = MISSING_ORDINAL
+        return out
+
+    def week_of_day(self, day_ord: np.ndarray) -> np.ndarray:
+        day_ord = np.asarray(day_ord, dtype=np.int64)
+        offset = day_ord - self.start_day
+        inside = (offset >= 0) & (offset < len(self._week_by_offset))
+        out = np.full(len(day_ord), MISSING_ORDINAL, np.int32)
+        out[inside] = self._week_by_offset[offset[inside]]
+        return out
+
+
+def needs_dimension(columns) -> bool:
+    """True si las claves del frame solo se resuelven vía dates.csv."""
+    has_week = any(c in columns for c in _WEEK_SOURCES)
+    return ("fecha" not in columns and "id_dia" in columns) or (
+        not has_week and ("fecha" in columns or "id_dia" in columns)
+    )
+
+
+def normalize_time_keys(
+    df: pd.DataFrame,
+    dimension: Optional[TimeDimension] = None,
+) -> pd.DataFrame:
+    """
+    Etapa de carga: agrega claves temporales int32 canónicas, una sola vez.
+
+    - DAY_KEY desde `fecha` (formatos mixtos) o, en su defecto, `id_dia`
+    - WEEK_KEY desde `semana` / `semana_id` / `week` o, en su defecto,
+      desde DAY_KEY vía la dimensión temporal
+
+    Las columnas originales no se modifican.
+    """
+    if "fecha" in df.columns:
+        df[DAY_KEY] = to_day_ordinal(parse_mixed_dates(df["fecha"]))
+    elif "id_dia" in df.columns and dimension is not None:
+        df[DAY_KEY] = dimension.day_of_id(df["id_dia"])
+
+    week_source = next((c for c in _WEEK_SOURCES if c in df.columns), None)
+    if week_source is not None:
+        df[WEEK_KEY] = to_int32_key(df[week_source])
+    elif DAY_KEY in df.columns and dimension is not None:
+        df[WEEK_KEY] = dimension.week_of_day(df[DAY_KEY].to_numpy())
+
+    return df
+
+
+def join_daily_weekly(
+    daily: pd.DataFrame,
+    weekly: pd.DataFrame,
+    suffix: str = "_semana",
+) -> pd.DataFrame:
+    """
+    Left join diario → semanal por WEEK_KEY en O(n).
+
+    Las filas semanales se ubican en un arreglo denso indexado por semana;
+    cada fila diaria toma su fila semanal por posición (sin hash de strings).
+    """
+    if weekly.empty:
+        return daily.copy()
+
+    wk = weekly[WEEK_KEY].to_numpy().astype(np.int64)
+    lo = int(wk.min())
+    positions = np.full(int(wk.max()) - lo + 1, -1, np.int64)
+    positions[wk - lo] = np.arange(len(weekly))
+
+    dk = daily[WEEK_KEY].to_numpy().astype(np.int64) - lo
+    inside = (dk >= 0) & (dk < len(positions))
+    idx = np.full(len(daily), -1, np.int64)
+    idx[inside] = positions[dk[inside]]
+
+    matched = idx >= 0
+    right = weekly.drop(columns=[WEEK_KEY]).iloc[np.where(matched, idx, 0)]
+    right = right.reset_index(drop=True)
+    if not matched.all():
+        right = right.where(matched[:, None])
+    right.columns = [
+        f"{c}{suffix}" if c in daily.columns else c for c in right.columns
+    ]
+
+    return pd.concat([daily.reset_index(drop=True), right], axis=1)
@@ -0,0 +1,130 @@
+# src/data/week_index.py
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.time_dimension import WEEK_KEY
+from src.time.data_slice import DataSlice
+
+
+class WeekIndex:
+    """
+    Índice por semana sobre un dataset con clave semanal.
+
+    - Filas ordenadas UNA vez por `semana_ord` (orden estable)
+    - `offsets[k]` = primera fila de la k-ésima semana (vía searchsorted);
+      un DataSlice (índices sobre el eje de semanas) es un rango contiguo
+    - Conteos acumulados por semana de las columnas `count_by`: el total
+      de una ventana es una diferencia de prefijos, sin recorrer filas
+
+    Inmutable: se cachea por versión del dataset y se comparte entre
+    requests. `rows()` entrega vistas que deben tratarse como solo-lectura.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        weeks: np.ndarray,
+        offsets: np.ndarray,
+        prefix_counts: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    ):
+        self.frame = frame
+        self.weeks = weeks
+        self.offsets = offsets
+        self._prefix_counts = prefix_counts
+
+    # ---------- Construcción ----------
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        count_by: Sequence[str] = (),
+        week_column: str = WEEK_KEY,
+    ) -> "WeekIndex":
+        if week_column not in df.columns:
+            raise KeyError(f"WeekIndex: columna semanal requerida: {week_column}")
+
+        keys = df[week_column].to_numpy()
+        if len(keys) > 1 and not (keys[:-1] <= keys[1:]).all():
+            order = np.argsort(keys, kind="stable")
+            df = df.take(order)
+            keys = keys[order]
+        frame = df.reset_index(drop=True)
+
+        weeks = np.unique(keys)
+        offsets = np.append(np.searchsorted(keys, weeks, side="left"), len(keys))
+
+        # Semana de cada fila (posición en `weeks`) → matriz semana × valor
+        week_pos = np.repeat(np.arange(len(weeks)), np.diff(offsets))
+        prefix_counts: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for column in count_by:
+            codes, values = pd.factorize(frame[column], sort=True)
+            present = codes >= 0
+            per_week = np.bincount(
+                week_pos[present] * len(values) + codes[present],
+                minlength=len(weeks) * len(values),
+            ).reshape(len(weeks), len(values))
+            prefix = np.zeros((len(weeks) + 1, len(values)), dtype=np.int64)
+            np.cumsum(per_week, axis=0, out=prefix[1:])
+            prefix_counts[column] = (np.asarray(values, dtype=object), prefix)
+
+        return cls(frame, weeks, offsets, prefix_counts)
+
+    # ---------- Rangos ----------
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def week_positions(self, data_slice: Optional[DataSlice] = None) -> Tuple[int, int]:
+        """Rango [i, j) de posiciones de semana para el DataSlice."""
+        if data_slice is None or data_slice.is_full():
+            return 0, len(self.weeks)
+        data_slice.validate()
+        if data_slice.end > len(self.weeks):
+            raise ValueError(
+                f"WeekIndex: DataSlice {data_slice.start}:{data_slice.end} "
+                f"fuera de rango para total_weeks={len(self.weeks)}."
+            )
+        return data_slice.start, data_slice.end
+
+    def positions_for_weeks(self, start_week: int, end_week: int) -> Tuple[int, int]:
+        """Rango [i, j) de posiciones de semana para [start_week, end_week)."""
+        i = int(np.searchsorted(self.weeks, start_week, side="left"))
+        j = int(np.searchsorted(self.weeks, end_week, side="left"))
+        return i, max(i, j)
+
+    def row_range(self, data_slice: Optional[DataSlice] = None) -> Tuple[int, int]:
+        """Rango contiguo [lo, hi) de filas del DataSlice."""
+        i, j = self.week_positions(data_slice)
+        return int(self.offsets[i]), int(self.offsets[j])
+
+    # ---------- Lecturas ----------
+
+    def rows(
+        self,
+        data_slice: Optional[DataSlice] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        lo, hi = self.row_range(data_slice)
+        df = self.frame.iloc[lo:hi]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def total(self, data_slice: Optional[DataSlice] = None) -> int:
+        lo, hi = self.row_range(data_slice)
+        return hi - lo
+
+    def counts(self, column: str, data_slice: Optional[DataSlice] = None) -> Dict[str, int]:
+        """Conteo por valor de `column` en la ventana (diferencia de prefijos)."""
+        if column not in self._prefix_counts:
+            raise KeyError(f"WeekIndex: sin conteos acumulados para '{column}'")
+        values, prefix = self._prefix_counts[column]
+        i, j = self.week_positions(data_slice)
+        window = prefix[j] - prefix[i]
+        return {str(v): int(n) for v, n in zip(values, window)}
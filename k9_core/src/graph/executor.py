@@ -0,0 +1,88 @@
+# src/graph/executor.py
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from src.graph.main_graph import build_k9_graph, intent_plan, k9_nodes
+from src.graph.memoize import NodeMemoCache
+from src.state.fast_state import copy_containers, to_fast_state, to_k9_state
+from src.state.state import K9State
+
+
+# Paso compilado: (nombre del nodo, callable)
+Step = Tuple[str, Callable[[K9State], K9State]]
+
+
+# =====================================================
+# Ejecutor de planes compilados por intent
+# =====================================================
+
+class K9PlanExecutor:
+    """
+    Alternativa a `graph.invoke` para la ruta determinista.
+
+    - Con `k9_command` explícito la ruta del grafo es estática por intent:
+      se compila una vez (`intent_plan`) en una lista plana de callables
+    - Sin scheduling, canales ni checkpoints de LangGraph: cada paso llama
+      al nodo directamente (mismos nodos / memo que el grafo)
+    - Misma aislación por nodo que el grafo (contenedores de primer nivel
+      propios) → estado final idéntico a `graph.invoke`
+    - Sin comando explícito (router legacy vía context_bundle) → `fallback`
+    - `fast_state`: el estado se convierte a K9FastState en la entrada
+      (`to_fast_state`, única validación) y los nodos no re-validan;
+      la salida vuelve a K9State con `to_k9_state`
+    """
+
+    def __init__(
+        self,
+        memoize: bool = True,
+        memo_cache: Optional[NodeMemoCache] = None,
+        fallback: Any = None,
+        fast_state: bool = False,
+    ) -> None:
+        self.nodes = k9_nodes(memoize, memo_cache)
+        self._fallback = fallback
+        self._memoize = memoize
+        self._memo_cache = memo_cache
+        self._fast_state = fast_state
+        self._plans: Dict[Optional[str], Tuple[Step, ...]] = {}
+        self._lock = threading.Lock()
+
+    # ---------- Planes ----------
+
+    def plan(self, intent: Optional[str]) -> Tuple[Step, ...]:
+        steps = self._plans.get(intent)
+        if steps is None:
+            steps = tuple((name, self.nodes[name]) for name in intent_plan(intent))
+            with self._lock:
+                steps = self._plans.setdefault(intent, steps)
+        return steps
+
+    def fallback(self) -> Any:
+        if self._fallback is None:
+            self._fallback = build_k9_graph(
+                memoize=self._memoize, memo_cache=self._memo_cache, fast_state=self._fast_state
+            )
+        return self._fallback
+
+    # ---------- Ejecución ----------
+
+    def invoke(self, state: Union[K9State, Dict[str, Any]]) -> Union[K9State, Dict[str, Any]]:
+        # Borde de entrada: una validación; el estado del caller no se muta
+        if self._fast_state:
+            state = to_fast_state(state)
+        elif not isinstance(state, K9State):
+            state = K9State.model_validate(state)
+        intent = (state.k9_command or {}).get("intent")
+        if state.k9_command is None or not (intent is None or isinstance(intent, str)):
+            result = self.fallback().invoke(state)
+            return to_k9_state(result) if self._fast_state else result
+
+        if not self._fast_state:
+            state = state.model_copy()
+        for _name, node in self.plan(intent):
+            state = node(copy_containers(state))
+        # Borde de salida
+        return to_k9_state(state) if self._fast_state else state
@@ -1,5 +1,10 @@
+from typing import Callable, Dict, Optional, Tuple
+
 from langgraph.graph import StateGraph, START, END
 
+from src.graph.memoize import NodeMemoCache, memoize_node
+from src.graph.parallel import fan_in, fan_out_branch
+from src.state.fast_state import K9FastState
 from src.state.state import K9State
 
 # --------------------------------------------------------------------------------------------------
@@ -7,8 +12,10 @@ from src.state.state import K9State
 # --------------------------------------------------------------------------------------------------
 from src.nodes.domain_guardrail import domain_guardrail
 from src.nodes.load_context import load_context
+from src.nodes.time_resolution_node import time_resolution_node
 from src.nodes.data_engine_node import data_engine_node
 from src.nodes.occ_enrichment_node import occ_enrichment_node
+from src.nodes.operational_analysis_node import operational_analysis_node
 from src.nodes.analyst_node import analyst_node
 from src.nodes.metrics_node import metrics_node
 from src.nodes.router import router_node
@@ -47,6 +54,18 @@ def route_pre_data_engine(state: K9State):
     return "factual"
 
 
+# ==============================================================================================
+# ROUTER POST-ENRIQUECIMIENTO — EVIDENCIA OPERACIONAL
+# ==============================================================================================
+def route_post_enrichment(state: K9State):
+    cmd = state.k9_command or {}
+
+    if cmd.get("intent") == "OPERATIONAL_QUERY":
+        return "operational"
+
+    return "analyst"
+
+
 # ==============================================================================================
 # ROUTER POST-ANÁLISIS — GOBERNANZA CANÓNICA
 # ==============================================================================================
@@ -75,33 +94,70 @@ def route_post_analysis(state: K9State):
 # ==============================================================================================
 # BUILD GRAPH
 # ==============================================================================================
-def build_k9_graph():
-    graph = StateGraph(K9State)
+# Nodos independientes tras time_resolution (leen solo el DataSlice)
+EVIDENCE_BRANCHES = ("data_engine", "occ_enrichment")
+
+
+def k9_nodes(memoize: bool = True, memo_cache: Optional[NodeMemoCache] = None) -> Dict[str, Callable]:
+    """
+    Tabla nombre → callable de los nodos del grafo K9 (compartida por el
+    grafo LangGraph y el ejecutor de planes compilados).
+    """
+    def node(name, fn):
+        return memoize_node(name, fn, memo_cache) if memoize else fn
+
+    return {
+        "guardrail": domain_guardrail,
+        "context": load_context,
+        "time_resolution": time_resolution_node,
+        "data_engine": node("data_engine", data_engine_node),
+        "occ_enrichment": node("occ_enrichment", occ_enrichment_node),
+        "operational_analysis": node("operational_analysis", operational_analysis_node),
+        "analyst": node("analyst", analyst_node),
+        "metrics": node("metrics", metrics_node),
+        "router": router_node,
+        "semantic_retrieval": semantic_retrieval_node,
+        "proactive_model": proactive_model_node,
+        "bowtie": bowtie_node,
+        "fallback": fallback_node,
+        "ontology_query": OntologyQueryNode(ontology_path="data/ontology"),
+        "narrative": narrative_node,
+    }
+
+
+def build_k9_graph(
+    memoize: bool = True,
+    memo_cache: Optional[NodeMemoCache] = None,
+    parallel: bool = False,
+    fast_state: bool = False,
+):
+    """
+    `memoize`: los nodos deterministas con huella declarada (`@memoizable`)
+    reutilizan su delta de estado entre ejecuciones, intents y sesiones.
+
+    `parallel`: data_engine y occ_enrichment corren como ramas del mismo
+    superstep (thread pool de LangGraph) y se unen en `evidence_join`;
+    con False (por defecto), cadena secuencial data_engine → occ_enrichment.
+    Opt-in: medido con `scripts/bench_graph_parallel.py`, el fan-out no
+    acorta la latencia (0.86–0.97x frente a la cadena) y solo suma
+    overhead de scheduling.
+
+    `fast_state`: los nodos reciben K9FastState (dataclass con slots, mismos
+    campos y reducers) en vez de re-validar K9State en cada nodo. Validación
+    solo en los bordes: K9State de entrada y `to_k9_state` sobre la salida.
+    """
+    graph = StateGraph(K9FastState if fast_state else K9State)
 
     # ----------------------------------
     # Registro de nodos
     # ----------------------------------
-    graph.add_node("guardrail", domain_guardrail)
-    graph.add_node("context", load_context)
-
-    graph.add_node("data_engine", data_engine_node)
-    graph.add_node("occ_enrichment", occ_enrichment_node)
-    graph.add_node("analyst", analyst_node)
-    graph.add_node("metrics", metrics_node)
+    for name, node in k9_nodes(memoize, memo_cache).items():
+        if parallel and name in EVIDENCE_BRANCHES:
+            node = fan_out_branch(name, node)
+        graph.add_node(name, node)
 
-    graph.add_node("router", router_node)
-
-    graph.add_node("semantic_retrieval", semantic_retrieval_node)
-    graph.add_node("proactive_model", proactive_model_node)
-    graph.add_node("bowtie", bowtie_node)
-    graph.add_node("fallback", fallback_node)
-
-    ontology_query_node = OntologyQueryNode(
-        ontology_path="data/ontology"
-    )
-    graph.add_node("ontology_query", ontology_query_node)
-
-    graph.add_node("narrative", narrative_node)
+    if parallel:
+        graph.add_node("evidence_join", fan_in)
 
     # ----------------------------------
     # Flujo principal
@@ -114,12 +170,32 @@ def build_k9_graph():
         route_pre_data_engine,
         {
             "ontology": "ontology_query",
-            "factual": "data_engine",
+            "factual": "time_resolution",
         },
     )
 
-    graph.add_edge("data_engine", "occ_enrichment")
-    graph.add_edge("occ_enrichment", "analyst")
+    # TimeContext → DataSlice antes de leer cualquier dataset
+    if parallel:
+        # Fan-out: ambas ramas en el mismo superstep; fan-in al completar
+        for branch in EVIDENCE_BRANCHES:
+            graph.add_edge("time_resolution", branch)
+        graph.add_edge(list(EVIDENCE_BRANCHES), "evidence_join")
+        enriched = "evidence_join"
+    else:
+        graph.add_edge("time_resolution", "data_engine")
+        graph.add_edge("data_engine", "occ_enrichment")
+        enriched = "occ_enrichment"
+
+    # OPERATIONAL_QUERY → evidencia operacional antes del Analyst
+    graph.add_conditional_edges(
+        enriched,
+        route_post_enrichment,
+        {
+            "operational": "operational_analysis",
+            "analyst": "analyst",
+        },
+    )
+    graph.add_edge("operational_analysis", "analyst")
     graph.add_edge("analyst", "metrics")
     graph.add_edge("metrics", "router")
 
@@ -143,3 +219,24 @@ def build_k9_graph():
     graph.add_edge("narrative", END)
 
     return graph.compile()
+
+
+# ==============================================================================================
+# PLAN ESTÁTICO POR INTENT (ejecutor compilado)
+# ==============================================================================================
+def intent_plan(intent: Optional[str]) -> Tuple[str, ...]:
+    """
+    Secuencia de nodos que `build_k9_graph` (sin fan-out) recorre para un
+    intent, resuelta con los mismos routers. Debe reflejar el flujo de arriba.
+    """
+    probe = K9State(k9_command={"intent": intent})
+
+    plan = ["guardrail", "context"]
+    if route_pre_data_engine(probe) == "ontology":
+        return (*plan, "ontology_query", "narrative")
+
+    plan += ["time_resolution", "data_engine", "occ_enrichment"]
+    if route_post_enrichment(probe) == "operational":
+        plan.append("operational_analysis")
+    plan += ["analyst", "metrics", "router", route_post_analysis(probe), "narrative"]
+    return tuple(plan)
@@ -0,0 +1,235 @@
+# src/graph/memoize.py
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from src.data.request_context import ensure_data_context
+
+
+# Lectura declarada: campo ("data_slice"), subclave ("analysis.engine")
+# o proyección del estado (callable)
+Read = Union[str, Callable[[Any], Any]]
+
+_ABSENT = object()
+
+
+# =====================================================
+# Huella de un nodo
+# =====================================================
+
+@dataclass(frozen=True)
+class NodeFootprint:
+    """
+    Qué lee y qué escribe un nodo determinista.
+
+    - `reads`: campos / subclaves / proyecciones que determinan la salida
+    - `writes`: campos o subclaves ("analysis.metrics") que el nodo escribe
+    - `uses_data`: la salida depende además de la versión de los datasets
+
+    `reasoning` se trata aparte: se cachean las entradas que el nodo añade.
+    """
+
+    reads: Tuple[Read, ...]
+    writes: Tuple[str, ...]
+    uses_data: bool = False
+
+
+def memoizable(
+    *,
+    reads: Sequence[Read],
+    writes: Sequence[str],
+    uses_data: bool = False,
+) -> Callable[[Callable], Callable]:
+    """Declara la huella de un nodo (el nodo no cambia)."""
+    footprint = NodeFootprint(tuple(reads), tuple(writes), uses_data)
+
+    def decorate(node: Callable) -> Callable:
+        node.__k9_footprint__ = footprint
+        return node
+
+    return decorate
+
+
+def footprint_of(node: Callable) -> Optional[NodeFootprint]:
+    return getattr(node, "__k9_footprint__", None)
+
+
+def command_of(state: Any) -> Dict[str, Any]:
+    """Comando canónico (k9_command o espejo legacy en context_bundle)."""
+    return state.k9_command or (state.context_bundle or {}).get("k9_command") or {}
+
+
+# =====================================================
+# Acceso a campos / subclaves
+# =====================================================
+
+def _get(state: Any, path: str) -> Any:
+    field, _, key = path.partition(".")
+    value = getattr(state, field)
+    if not key:
+        return value
+    return value.get(key, _ABSENT) if isinstance(value, dict) else _ABSENT
+
+
+def _set(state: Any, path: str, value: Any) -> None:
+    field, _, key = path.partition(".")
+    if not key:
+        setattr(state, field, value)
+        return
+    parent = getattr(state, field)
+    if parent is None:
+        parent = {}
+        setattr(state, field, parent)
+    parent[key] = value
+
+
+def _copy(value: Any) -> Any:
+    return value if value is _ABSENT else copy.deepcopy(value)
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if value is _ABSENT:
+        return "<absent>"
+    return str(value)
+
+
+def fingerprint(name: str, footprint: NodeFootprint, state: Any) -> Optional[str]:
+    """Hash canónico de las lecturas declaradas (+ versión de datos)."""
+    parts: List[Any] = [name]
+    for read in footprint.reads:
+        parts.append(read(state) if callable(read) else _get(state, read))
+    if footprint.uses_data:
+        ctx = ensure_data_context(state)
+        parts.append(ctx.frame(("full", "dataset_version"), ctx.dm.dataset_version))
+
+    try:
+        raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_canonical)
+    except (TypeError, ValueError):
+        # Lecturas no canónicas (p.ej. claves mixtas) → sin memo
+        return None
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# =====================================================
+# Cache de deltas
+# =====================================================
+
+@dataclass(frozen=True)
+class StateDelta:
+    """Escrituras de un nodo + entradas añadidas a `reasoning`."""
+
+    writes: Tuple[Tuple[str, Any], ...]
+    reasoning: Tuple[str, ...]
+
+
+class NodeMemoCache:
+    """
+    Deltas de estado por (nodo, huella), LRU acotado.
+    Compartido entre ejecuciones, intents y sesiones del proceso.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, StateDelta]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, node: str, key: str) -> Optional[StateDelta]:
+        with self._lock:
+            stats = self._stats.setdefault(node, {"hits": 0, "misses": 0})
+            delta = self._entries.get(key)
+            if delta is None:
+                stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            stats["hits"] += 1
+            return delta
+
+    def put(self, key: str, delta: StateDelta) -> None:
+        with self._lock:
+            self._entries[key] = delta
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "nodes": {k: dict(v) for k, v in self._stats.items()},
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+_NODE_MEMO_CACHE = NodeMemoCache()
+
+
+def get_node_memo_cache() -> NodeMemoCache:
+    return _NODE_MEMO_CACHE
+
+
+# =====================================================
+# Wrapper
+# =====================================================
+
+def memoize_node(
+    name: str,
+    node: Callable,
+    cache: Optional[NodeMemoCache] = None,
+) -> Callable:
+    """
+    Envuelve `node` si declara huella (`@memoizable`); si no, lo retorna tal cual.
+
+    Hit → se reaplica el delta cacheado (copias profundas) sin ejecutar el nodo.
+    Miss → se ejecuta el nodo y se guarda su delta.
+    """
+    footprint = footprint_of(node)
+    if footprint is None:
+        return node
+    cache = cache if cache is not None else get_node_memo_cache()
+
+    def run(state: Any) -> Any:
+        key = fingerprint(name, footprint, state)
+        if key is None:
+            return node(state)
+        delta = cache.get(name, key)
+
+        if delta is not None:
+            for path, value in delta.writes:
+                if value is not _ABSENT:
+                    _set(state, path, _copy(value))
+            state.reasoning.extend(delta.reasoning)
+            return state
+
+        already = len(state.reasoning)
+        state = node(state)
+        cache.put(
+            key,
+            StateDelta(
+                writes=tuple((p, _copy(_get(state, p))) for p in footprint.writes),
+                reasoning=tuple(state.reasoning[already:]),
+            ),
+        )
+        return state
+
+    run.__name__ = getattr(node, "__name__", name)
+    run.__wrapped__ = node
+    return run
@@ -0,0 +1,60 @@
+# src/graph/parallel.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from src.graph.memoize import _ABSENT, _get, footprint_of
+from src.state.fast_state import copy_state
+from src.state.reducers import AnalysisMerge, ReasoningAppend
+
+
+# =====================================================
+# Ramas paralelas (fan-out en el mismo superstep)
+# =====================================================
+
+def fan_out_branch(name: str, node: Callable) -> Callable:
+    """
+    Adapta un nodo con huella declarada (`@memoizable`) para correr como
+    rama paralela.
+
+    - El nodo trabaja sobre una copia aislada del estado (reasoning propio,
+      analysis superficial): las ramas no comparten contenedores mutables
+    - Retorna SOLO su delta: campos de `writes`, subclaves de analysis
+      (AnalysisMerge) y reasoning añadido (ReasoningAppend); los reducers
+      de K9State los combinan al cerrar el superstep
+    - Acepta el nodo ya memoizado (huella en `__wrapped__`)
+    """
+    footprint = footprint_of(node) or footprint_of(getattr(node, "__wrapped__", None))
+    if footprint is None:
+        raise ValueError(f"fan_out_branch: '{name}' no declara huella (@memoizable).")
+
+    def run(state: Any) -> Dict[str, Any]:
+        branch = copy_state(state, reasoning=[], analysis=dict(state.analysis or {}))
+        branch = node(branch)
+
+        delta: Dict[str, Any] = {}
+        merged = AnalysisMerge()
+        for path in footprint.writes:
+            value = _get(branch, path)
+            if value is _ABSENT:
+                continue
+            field, _, key = path.partition(".")
+            if key:
+                merged[key] = value
+            else:
+                delta[field] = value
+
+        if merged:
+            delta["analysis"] = merged
+        delta["reasoning"] = ReasoningAppend(branch.reasoning)
+        return delta
+
+    run.__name__ = getattr(node, "__name__", name)
+    run.__wrapped__ = node
+    return run
+
+
+def fan_in(state: Any) -> Dict[str, Any]:
+    """Punto de unión de las ramas (sin escrituras)."""
+    return {}
@@ -0,0 +1,180 @@
+# src/nodes/aggregate_executor.py
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.data.analytical_cube import CUBE_DIMENSIONS, CUBE_SPECS, COUNT_MEASURE
+from src.data.data_manager import DataManager
+from src.time.data_slice import DataSlice
+
+
+# Operaciones K9 resueltas sobre el cubo analítico
+AGGREGATE_OPERATIONS = {"aggregate", "count", "rank"}
+
+# Agregaciones soportadas por medida
+AGGREGATIONS = ("sum", "mean")
+
+# Claves de `filters` / `group_by` del comando → dimensión del cubo
+DIMENSION_ALIASES: Dict[str, str] = {
+    "week": "week",
+    "semana": "week",
+    "risk": "risk",
+    "risk_id": "risk",
+    "riesgo_id": "risk",
+    "area": "area",
+    "area_id": "area",
+    "id_area": "area",
+    "type": "type",
+    "tipo": "type",
+    "tipo_observacion": "type",
+    "tipo_evento": "type",
+    "tipo_auditoria": "type",
+}
+
+
+class AggregateCommandError(ValueError):
+    """Comando de agregación no resoluble con el cubo (con opciones válidas)."""
+
+    def __init__(self, message: str, supported: Any):
+        super().__init__(message)
+        self.supported = list(supported)
+
+
+def _command_payload(command: Mapping[str, Any]) -> Mapping[str, Any]:
+    # Campos al tope (legacy / dashboard: entity + operation, time en
+    # payload.time) y/o en `payload` (K9_COMMAND del LLM): payload manda
+    payload = command.get("payload")
+    if not isinstance(payload, dict):
+        return command
+    top_level = {k: v for k, v in command.items() if k != "payload"}
+    return {**top_level, **payload}
+
+
+def _dimensions(keys: Any) -> List[str]:
+    if keys is None:
+        return []
+    if isinstance(keys, str):
+        keys = [keys]
+    dims = []
+    for key in keys:
+        dim = DIMENSION_ALIASES.get(str(key).lower())
+        if dim is None:
+            raise AggregateCommandError(
+                f"AggregateExecutor: dimensión desconocida '{key}'. "
+                f"Allowed={list(CUBE_DIMENSIONS)}",
+                supported=DIMENSION_ALIASES,
+            )
+        if dim not in dims:
+            dims.append(dim)
+    return dims
+
+
+def is_aggregate_command(command: Optional[Mapping[str, Any]]) -> bool:
+    """True si el comando es una agregación resoluble con el cubo."""
+    if not command:
+        return False
+    payload = _command_payload(command)
+    return (
+        payload.get("operation") in AGGREGATE_OPERATIONS
+        and payload.get("entity") in CUBE_SPECS
+    )
+
+
+def execute_aggregate(
+    dm: DataManager,
+    command: Mapping[str, Any],
+    data_slice: Optional[DataSlice] = None,
+) -> Dict[str, Any]:
+    """
+    Ejecuta una operación `aggregate` / `count` / `rank` del comando K9
+    sobre el cubo de la entidad (observations / events / audits).
+
+    - `filters`: valores por dimensión (alias: risk_id, area, tipo_*, semana);
+      claves sin dimensión en el cubo NO filtran y se reportan en
+      `unapplied_filters`
+    - `group_by`: dimensiones a conservar (rank → `risk` por defecto)
+    - `measure` / `agg`: medida numérica del cubo y "sum" | "mean"
+    - El DataSlice acota las semanas (posiciones sobre el eje del cubo)
+
+    Retorna hechos estructurados (sin narrativa).
+    AggregateCommandError si group_by / measure / agg no son soportados.
+    """
+    payload = _command_payload(command)
+    entity = payload.get("entity")
+    operation = payload.get("operation")
+    cube = dm.get_cube(entity)
+
+    filters: Dict[str, Any] = {}
+    unapplied: Dict[str, Any] = {}
+    for key, value in (payload.get("filters") or {}).items():
+        dim = DIMENSION_ALIASES.get(str(key).lower())
+        if dim is None:
+            unapplied[str(key)] = value
+        elif value is not None:
+            filters[dim] = value
+
+    group_by = _dimensions(payload.get("group_by"))
+    if operation == "rank" and not group_by:
+        group_by = ["risk"]
+
+    measure = payload.get("measure") or COUNT_MEASURE
+    if measure not in cube.measures:
+        raise AggregateCommandError(
+            f"AggregateExecutor: medida desconocida '{measure}' para {entity}",
+            supported=cube.measures,
+        )
+    agg = payload.get("agg") or ("mean" if measure != COUNT_MEASURE else "sum")
+    allowed = ("sum",) if measure == COUNT_MEASURE else AGGREGATIONS
+    if agg not in allowed:
+        raise AggregateCommandError(
+            f"AggregateExecutor: agregación '{agg}' no soportada para '{measure}'",
+            supported=allowed,
+        )
+
+    result = cube.aggregate(
+        measure=measure,
+        agg=agg,
+        filters=filters,
+        group_by=group_by,
+        data_slice=data_slice,
+    )
+    i, j = cube.week_positions(data_slice)
+
+    out: Dict[str, Any] = {
+        "entity": entity,
+        "operation": operation,
+        "measure": measure,
+        "agg": agg,
+        "filters": filters,
+        "unapplied_filters": unapplied,
+        "group_by": group_by,
+        "weeks": cube.weeks[i:j],
+        "meta": {
+            "semantic_level": "operational",
+            "source": "analytical_cube",
+        },
+    }
+
+    if not group_by:
+        out["value"] = result
+        return out
+
+    if operation == "rank":
+        result = result.sort_values(ascending=False, kind="stable")
+    out["groups"] = cube.to_records(result)
+    return out
+
+
+def aggregate_error(command: Mapping[str, Any], error: Exception) -> Dict[str, Any]:
+    """Resultado de un aggregate no resuelto: el error en vez de los hechos."""
+    payload = _command_payload(command)
+    message = error.args[0] if error.args else str(error)
+    return {
+        "entity": payload.get("entity"),
+        "operation": payload.get("operation"),
+        "error": str(message),
+        "supported": list(getattr(error, "supported", [])),
+        "meta": {
+            "semantic_level": "operational",
+            "source": "analytical_cube",
+        },
+    }
@@ -1,9 +1,18 @@
 # src/nodes/analyst_node.py
 
 from typing import Dict, Any, List, Tuple
+from src.graph.memoize import command_of, memoizable
 from src.state.state import K9State
 
 
+# Intents con razonamiento analítico (misma salida para el mismo engine)
+ANALYST_INTENTS = {
+    "ANALYTICAL_QUERY",
+    "COMPARATIVE_QUERY",
+    "TEMPORAL_RELATION_QUERY",
+}
+
+
 def _compute_k9_ranks_from_weekly_signals(
     weekly_signals: Dict[str, Dict[str, Any]]
 ) -> Dict[str, int]:
@@ -26,6 +35,26 @@ def _compute_k9_ranks_from_weekly_signals(
     return ranks
 
 
+def _analyst_gate(state: K9State):
+    command = command_of(state)
+    if not command:
+        return None
+    intent = command.get("intent")
+    return "ANALYST" if intent in ANALYST_INTENTS else f"skip:{intent}"
+
+
+@memoizable(
+    reads=(_analyst_gate, "analysis.engine", "analysis.operational_analysis"),
+    writes=(
+        "analysis.analysis_mode",
+        "analysis.analysis_basis",
+        "analysis.period",
+        "analysis.risk_trajectories",
+        "analysis.risk_summary",
+        "analysis.operational_evidence",
+        "analysis.proactive_comparison",
+    ),
+)
 def analyst_node(state: K9State) -> K9State:
     """
     AnalystNode — K9 v3.2 (CANONICAL)
@@ -52,11 +81,7 @@ def analyst_node(state: K9State) -> K9State:
 
     intent = command.get("intent")
 
-    if intent not in {
-        "ANALYTICAL_QUERY",
-        "COMPARATIVE_QUERY",
-        "TEMPORAL_RELATION_QUERY",
-    }:
+    if intent not in ANALYST_INTENTS:
         state.reasoning.append(
             f"AnalystNode: skipped (intent={intent})."
         )
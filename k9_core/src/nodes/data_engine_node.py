@@ -1,16 +1,17 @@
 from typing import Dict, List
+
 import pandas as pd
 
-from src.data.data_manager import DataManager
+from src.data.request_context import ensure_data_context
+from src.graph.memoize import memoizable
+from src.nodes.aggregate_executor import aggregate_error, execute_aggregate, is_aggregate_command
+from src.nodes.time_resolution_node import resolve_data_slice
+from src.scenarios import ScenarioEngine, scenario_for_event
 from src.state.state import K9State
 
 # 🔒 Contrato operativo (el único que el core conoce)
 from src.time.data_slice import DataSlice
 
-# 🔒 Resolución temporal determinista
-from src.time.time_resolution import TimeResolutionLayer
-from src.time.dataset_metadata import DatasetTimeMetadata
-
 
 # =====================================================
 # Helpers
@@ -26,108 +27,28 @@ def _trend_direction(values: List[float]) -> str:
     return "flat"
 
 
-def _apply_critical_monday_overlay(df_tray: pd.DataFrame) -> pd.DataFrame:
+def _value_counts(values: pd.Series) -> Dict[str, int]:
     """
-    Apply the synthetic 'Critical Monday' scenario by appending/updating a new week row
-    using `stde_riesgos_evento_lunes_critico.csv`.
-
-    Notes:
-    - Scenario file expresses criticidad on a 0–100 scale; we normalize to 0–1.
-    - We keep other risks unchanged for the injected week unless explicitly provided.
+    Conteo por valor presente (columnas categóricas no reportan
+    categorías del catálogo sin ocurrencias).
     """
-    event_path = Path("data/synthetic/stde_riesgos_evento_lunes_critico.csv")
-    if not event_path.exists():
-        return df_tray
-
-    df_evt = pd.read_csv(event_path)
-    if df_evt.empty:
-        return df_tray
-
-    required = {"semana", "id_riesgo", "criticidad_real_lunes_critico"}
-    if not required.issubset(set(df_evt.columns)):
-        return df_tray
-
-    # Build / update one injected week row at a time (small dataset, deterministic)
-    out = df_tray.copy()
-    risk_cols = [c for c in out.columns if c.startswith("criticidad_") and c.endswith("_media") and c != "criticidad_global_media"]
+    counts = values.value_counts()
+    return {str(k): int(v) for k, v in counts[counts > 0].items()}
 
-    for _, row in df_evt.iterrows():
-        try:
-            week = int(row["semana"])
-        except Exception:
-            continue
-        risk_id = str(row["id_riesgo"]).strip()
-        if not risk_id:
-            continue
-        target_col = f"criticidad_{risk_id}_media"
-        if target_col not in out.columns:
-            continue
-
-        try:
-            criticidad_01 = float(row["criticidad_real_lunes_critico"]) / 100.0
-        except Exception:
-            continue
-
-        if (out["semana"] == week).any():
-            out.loc[out["semana"] == week, target_col] = criticidad_01
-        else:
-            # start from last known week row (keeps other risks stable)
-            base = out.sort_values("semana").iloc[-1].to_dict()
-            base["semana"] = week
-            base[target_col] = criticidad_01
-
-            # recompute global media if present
-            if "criticidad_global_media" in out.columns and risk_cols:
-                base["criticidad_global_media"] = float(
-                    sum(float(base.get(c, 0) or 0) for c in risk_cols) / float(len(risk_cols))
-                )
 
-            out = pd.concat([out, pd.DataFrame([base])], ignore_index=True)
-
-    return out.sort_values("semana").reset_index(drop=True)
-
-
-def _compute_weekly_signals_from_trajectories(df_tray: pd.DataFrame) -> Dict[str, Dict]:
-    """
-    Recompute weekly_signals from `stde_trayectorias_semanales.csv` style data.
-    Used for scenario overlay so injected week participates in dominance ranking.
-    """
-    risk_cols = [c for c in df_tray.columns if c.startswith("criticidad_") and c.endswith("_media") and c != "criticidad_global_media"]
-    risks = [c.replace("criticidad_", "").replace("_media", "") for c in risk_cols]
-
-    # rank per week (1 = highest criticidad)
-    df_sorted = df_tray.sort_values("semana").reset_index(drop=True)
-    ranks_by_risk: Dict[str, List[int]] = {rid: [] for rid in risks}
-
-    for _, row in df_sorted.iterrows():
-        vals = []
-        for rid in risks:
-            col = f"criticidad_{rid}_media"
-            vals.append((rid, float(row.get(col, 0) or 0)))
-        vals.sort(key=lambda x: x[1], reverse=True)
-        for pos, (rid, _) in enumerate(vals, start=1):
-            ranks_by_risk[rid].append(pos)
-
-    signals: Dict[str, Dict] = {}
-    for rid in risks:
-        col = f"criticidad_{rid}_media"
-        values = [float(v) for v in df_sorted[col].tolist()]
-        if not values:
-            continue
-        rp = ranks_by_risk.get(rid, [])
-        signals[rid] = {
-            "avg_criticidad": float(sum(values) / len(values)),
-            "avg_rank_pos": float(sum(rp) / len(rp)) if rp else None,
-            "top3_weeks": int(sum(1 for x in rp if x <= 3)),
-            "weeks_considered": int(len(values)),
-        }
-    return signals
+def _aggregate_request(state: K9State):
+    return state.k9_command if is_aggregate_command(state.k9_command) else None
 
 
 # =====================================================
 # DataEngineNode
 # =====================================================
 
+@memoizable(
+    reads=("data_slice", "time_context", "active_event", _aggregate_request),
+    writes=("analysis.engine", "data_slice"),
+    uses_data=True,
+)
 def data_engine_node(state: K9State) -> K9State:
     """
     DataEngineNode — FASE 2 (infraestructura cerrada)
@@ -137,37 +58,22 @@ def data_engine_node(state: K9State) -> K9State:
     - NO narrativa
     - NO decisiones cognitivas finales
     - Consume DataSlice si existe
+    - Lee vía el contexto de datos del request (frames compartidos)
     """
 
-    dm = DataManager("data/synthetic")
+    ctx = ensure_data_context(state)
+    dm = ctx.dm
     engine_analysis: Dict = {}
 
     # =====================================================
     # 🔑 BLOQUE 0 — Resolución temporal CANÓNICA (ÚNICO PUNTO)
     # =====================================================
 
+    # Normalmente resuelto antes por TimeResolutionNode; aquí solo si se
+    # invoca el nodo directamente con un TimeContext
     if state.data_slice is None and state.time_context is not None:
-        df_meta = dm.get_trayectorias_semanales()
-
-        if "semana" not in df_meta.columns:
-            raise KeyError(
-                "DataEngineNode: 'semana' column required to resolve temporal metadata."
-            )
-
-        total_periods = int(df_meta["semana"].nunique())
-
-        metadata = DatasetTimeMetadata(
-            min_date=str(df_meta["semana"].min()),
-            max_date=str(df_meta["semana"].max()),
-            granularity="week",
-            total_periods=total_periods,
-        )
-
-        resolver = TimeResolutionLayer()
-        state.data_slice = resolver.resolve(
-            time_ctx=state.time_context,
-            metadata=metadata,
-        )
+        state.data_slice = resolve_data_slice(dm, state.time_context)
+        ctx.bind_slice(state.data_slice)
 
         state.reasoning.append(
             f"DataEngineNode: DataSlice resolved from TimeContext → {state.data_slice}"
@@ -177,10 +83,15 @@ def data_engine_node(state: K9State) -> K9State:
     # Bloque 1 — Periodo + Trayectorias semanales
     # =====================================================
 
-    df_tray = dm.get_trayectorias_semanales()
-    if isinstance(state.active_event, dict) and state.active_event.get("type") == "CRITICAL_MONDAY":
-        df_tray = _apply_critical_monday_overlay(df_tray)
-        state.reasoning.append("DataEngineNode: applied CRITICAL_MONDAY overlay to weekly trajectories.")
+    # Escenario activo: overlay materializado una vez por (versión, escenario)
+    scenario = scenario_for_event(state.active_event)
+    scenario_view = ScenarioEngine(dm).materialize(scenario.scenario_id) if scenario else None
+
+    df_tray = scenario_view.frame("stde_trayectorias_semanales.csv") if scenario_view else None
+    if df_tray is None:
+        df_tray = dm.get_trayectorias_semanales()
+    else:
+        state.reasoning.append(f"DataEngineNode: applied {scenario.event_type} overlay to weekly trajectories.")
     weeks = sorted(df_tray["semana"].unique().tolist())
 
     engine_analysis["period"] = {
@@ -229,44 +140,41 @@ def data_engine_node(state: K9State) -> K9State:
     # Bloque 2 — Señales semanales K9
     # =====================================================
 
-    if isinstance(state.active_event, dict) and state.active_event.get("type") == "CRITICAL_MONDAY":
-        engine_analysis["weekly_signals"] = _compute_weekly_signals_from_trajectories(df_tray)
-        state.reasoning.append("DataEngineNode: weekly_signals recomputed from trajectories for CRITICAL_MONDAY.")
+    scenario_signals = scenario_view.signals() if scenario_view else None
+    if scenario_signals is not None:
+        engine_analysis["weekly_signals"] = scenario_signals
+        state.reasoning.append(f"DataEngineNode: weekly_signals recomputed from trajectories for {scenario.event_type}.")
     else:
-        df_signals = dm.get_weekly_signals()
+        # Agregados por riesgo en una pasada (cacheados por versión del dataset)
+        by_risk = dm.get_weekly_signals_by_risk()
         engine_analysis["weekly_signals"] = {}
 
         for riesgo_id in engine_analysis["trajectories"]["weekly"].keys():
-            df_r = df_signals[df_signals["riesgo_id"] == riesgo_id]
-            if df_r.empty:
+            if riesgo_id not in by_risk.index:
                 continue
 
+            row = by_risk.loc[riesgo_id]
             engine_analysis["weekly_signals"][riesgo_id] = {
-                "avg_criticidad": float(df_r["criticidad_media"].mean()),
-                "avg_rank_pos": float(df_r["rank_pos"].mean()),
-                "top3_weeks": int(df_r["is_top3"].sum()),
-                "weeks_considered": int(df_r["semana"].nunique()),
+                "avg_criticidad": float(row["avg_criticidad"]),
+                "avg_rank_pos": float(row["avg_rank_pos"]),
+                "top3_weeks": int(row["top3_weeks"]),
+                "weeks_considered": int(row["weeks_considered"]),
             }
 
     # =====================================================
     # Bloque 3 — Observaciones (OPG / OCC)
     # =====================================================
 
-    df_obs = dm.get_observaciones_all()
-
-    if "semana" not in df_obs.columns:
-        raise KeyError(
-            "DataEngineNode: 'semana' column required for temporal slicing."
-        )
-
-    # 🔒 ORDEN CANÓNICO OBLIGATORIO
-    df_obs = df_obs.sort_values("semana").reset_index(drop=True)
-
     data_slice: DataSlice | None = state.data_slice
 
+    # Filas ordenadas por semana una vez por versión: el DataSlice es un
+    # rango contiguo y los totales por tipo, diferencias de prefijos
+    obs_index = ctx.observation_index()
+    window: DataSlice | None = None
+
     if data_slice and data_slice.is_index_slice():
         # DataSlice indices refer to PERIOD indices (weeks), not dataframe rows
-        weeks_all = sorted(df_obs["semana"].unique().tolist())
+        weeks_all = obs_index.weeks.tolist()
 
         # Guardrails estrictos (sin defaults silenciosos)
         if data_slice.start is None or data_slice.end is None:
@@ -285,12 +193,8 @@ def data_engine_node(state: K9State) -> K9State:
                 f"for total_weeks={len(weeks_all)}."
             )
 
-        weeks_selected = weeks_all[data_slice.start : data_slice.end]
-
-        df_obs = (
-            df_obs[df_obs["semana"].isin(weeks_selected)]
-            .reset_index(drop=True)
-        )
+        weeks_selected = ctx.weeks()
+        window = data_slice
 
         state.reasoning.append(
             "DataEngineNode: observaciones filtradas por semana "
@@ -301,38 +205,70 @@ def data_engine_node(state: K9State) -> K9State:
             "DataEngineNode: observaciones sin restricción (FULL DataSlice)."
         )
 
+    by_type = obs_index.counts("tipo_observacion", window)
 
     engine_analysis["observations"] = {
         "summary": {
-            "total": int(len(df_obs)),
-            "by_type": {
-                t: int(len(df_obs[df_obs["tipo_observacion"] == t]))
-                for t in ["OPG", "OCC"]
-            },
+            "total": obs_index.total(window),
+            "by_type": {t: by_type.get(t, 0) for t in ["OPG", "OCC"]},
         }
     }
 
     # =====================================================
-    # Bloques restantes — SIN CAMBIOS
+    # Bloque 3b — Agregaciones OPERATIONAL / ANALYTICAL (cubo)
     # =====================================================
 
-    df_aud = dm.get_auditorias()
-    df_aud_12s = dm.get_auditorias_12s()
+    if is_aggregate_command(state.k9_command):
+        try:
+            aggregate = execute_aggregate(dm, state.k9_command, window)
+        except (ValueError, KeyError) as exc:
+            # Comando del LLM fuera del cubo: error estructurado, el grafo sigue
+            aggregate = aggregate_error(state.k9_command, exc)
+            state.reasoning.append(
+                f"DataEngineNode: aggregate no resuelto ({aggregate['error']})."
+            )
+        else:
+            state.reasoning.append(
+                "DataEngineNode: aggregate resuelto sobre cubo analítico "
+                f"(entity={aggregate['entity']}, group_by={aggregate['group_by']})."
+            )
+            if aggregate["unapplied_filters"]:
+                state.reasoning.append(
+                    "DataEngineNode: filtros sin dimensión en el cubo, no aplicados "
+                    f"{sorted(aggregate['unapplied_filters'])}."
+                )
+        engine_analysis["aggregate"] = aggregate
+
+    # =====================================================
+    # Bloque 4 — Auditorías
+    # =====================================================
+
+    # Auditorías diarias (operacional): solo las semanas del DataSlice
+    df_aud = ctx.auditorias()
+    df_aud_12s = dm.get_auditorias_12s(columns=["tipo_auditoria"])
+
+    # Registros 12s a pedido (paginados vía handle), no en el payload
+    aud_12s_handle = dm.get_handle("stde_auditorias_12s.csv")
 
     engine_analysis["audits"] = {
         "daily": {
             "count": int(len(df_aud)),
             "by_tipo": (
-                df_aud["tipo_auditoria"].value_counts().to_dict()
+                _value_counts(df_aud["tipo_auditoria"])
                 if "tipo_auditoria" in df_aud.columns else {}
             ),
             "by_origen": (
-                df_aud["origen"].value_counts().to_dict()
+                _value_counts(df_aud["origen"])
                 if "origen" in df_aud.columns else {}
             ),
         },
         "accumulated_12s": {
-            "records": df_aud_12s.to_dict(orient="list"),
+            "count": aud_12s_handle.rows,
+            "by_tipo": (
+                _value_counts(df_aud_12s["tipo_auditoria"])
+                if "tipo_auditoria" in df_aud_12s.columns else {}
+            ),
+            "handle": aud_12s_handle.to_dict(),
         },
         "meta": {
             "semantic_level": "operational+cognitive",
@@ -1,7 +1,12 @@
 from typing import Dict, Any, List
+from src.graph.memoize import memoizable
 from src.state.state import K9State
 
 
+@memoizable(
+    reads=("analysis", "intent", "user_query"),
+    writes=("analysis.metrics",),
+)
 def metrics_node(state: K9State) -> K9State:
     """
     MetricsNode v0.4 (v0.3 PRESERVADA)
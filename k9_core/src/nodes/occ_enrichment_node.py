@@ -1,96 +1,181 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import pandas as pd
 from src.state.state import K9State
-from src.data.data_manager import DataManager
+from src.data.dataset_handle import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.data.request_context import ensure_data_context
+from src.graph.memoize import memoizable
+
+
+# Columnas contractuales FASE 2 (solo presentes en baseline)
+OCC_COLUMNS = [
+    "semana",
+    "tipo_observacion",
+    "riesgo_id",           # columna J
+    "is_control_critico",  # columna K
+    "control_critico_id",  # columna L
+]
+
+# payload.occ_drilldown: True | {"risk_id", "offset", "limit"}
+DRILLDOWN_KEY = "occ_drilldown"
+
+
+# =====================================================
+# Helpers (vectorizados sobre el frame OCC del DataSlice)
+# =====================================================
+
+def _occ_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """OCC con riesgo_id válido; control crítico solo si marcado y con id."""
+    df_occ = df.loc[
+        (df["tipo_observacion"] == "OCC") & df["riesgo_id"].notna(),
+        [c for c in OCC_COLUMNS if c in df.columns],
+    ]
+    critical = df_occ["is_control_critico"].eq(True)
+    return df_occ.assign(
+        is_control_critico=critical,
+        control_critico_id=df_occ["control_critico_id"].where(critical),
+    )
+
+
+def summarize_occ_by_risk(df_occ: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Por riesgo: nº de OCC, OCC con control crítico identificado y
+    controles críticos distintos (agrupaciones, sin recorrer filas).
+    """
+    grouped = df_occ.groupby("riesgo_id", observed=True)
+    occ_count = grouped.size()
+    hits = df_occ["control_critico_id"].notna().groupby(df_occ["riesgo_id"], observed=True).sum()
+    controls = (
+        df_occ.dropna(subset=["control_critico_id"])
+        .groupby("riesgo_id", observed=True)["control_critico_id"]
+        .unique()
+    )
+
+    return {
+        str(risk): {
+            "occ_count": int(n),
+            "critical_control_hits": int(hits.get(risk, 0)),
+            "critical_control_ids": sorted(str(c) for c in controls.get(risk, [])),
+        }
+        for risk, n in occ_count.items()
+        if n > 0
+    }
+
+
+def occ_events_page(
+    df_occ: pd.DataFrame,
+    risk_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Dict[str, Any]:
+    """
+    Drill-down paginado de eventos OCC (opcionalmente de un riesgo).
+    """
+    if offset < 0 or limit <= 0:
+        raise ValueError("OCC Enrichment: offset >= 0 y limit > 0 requeridos.")
+    limit = min(int(limit), MAX_PAGE_SIZE)
+
+    if risk_id is not None:
+        df_occ = df_occ[df_occ["riesgo_id"] == risk_id]
+    page = df_occ.iloc[offset : offset + limit]
+    total = int(len(df_occ))
+    end = offset + len(page)
+
+    control_ids = page["control_critico_id"].astype(object)
+    records = [
+        {
+            "risk_id": str(r),
+            "week": int(w),
+            "is_control_critico": bool(c),
+            "control_critico_id": None if pd.isna(cid) else str(cid),
+        }
+        for r, w, c, cid in zip(
+            page["riesgo_id"], page["semana"], page["is_control_critico"], control_ids
+        )
+    ]
+
+    return {
+        "risk_id": risk_id,
+        "offset": int(offset),
+        "limit": limit,
+        "total": total,
+        "next_offset": end if end < total else None,
+        "records": records,
+    }
+
 
+def _drilldown_request(state: K9State) -> Optional[Dict[str, Any]]:
+    payload = (state.k9_command or {}).get("payload") or {}
+    spec = payload.get(DRILLDOWN_KEY)
+    if not spec:
+        return None
+    return spec if isinstance(spec, dict) else {}
 
+
+# =====================================================
+# OCCEnrichmentNode
+# =====================================================
+
+@memoizable(
+    reads=("data_slice", _drilldown_request),
+    writes=("risk_enrichment",),
+    uses_data=True,
+)
 def occ_enrichment_node(state: K9State) -> K9State:
     """
     OCC Enrichment Node — FASE 2
 
     Rol:
-    - Leer observaciones (baseline + STDE)
+    - Leer observaciones (baseline + STDE) del DataSlice
     - Filtrar solo OCC
-    - Asociar OCC → riesgo → control crítico
+    - Asociar OCC → riesgo → control crítico (agregados por riesgo)
     - Registrar evidencia operacional
+    - Eventos individuales solo como drill-down paginado (opcional)
     - NO recalibrar
     - NO razonar
     """
 
-    # Inicialización correcta del DataManager
-    # Se asume que el base_path ya está definido en el proyecto
-    dm = DataManager(base_path="data/synthetic")
-
+    # Contexto de datos del request: mismas observaciones (ya cortadas por
+    # el DataSlice) que consume el data engine
+    ctx = ensure_data_context(state)
 
     try:
-        df = dm.get_observaciones_all()
+        df = ctx.observaciones()
     except Exception as e:
         state.reasoning.append(
             f"OCC Enrichment Node: error cargando observaciones: {e}"
         )
         return state
 
-    # Columnas contractuales FASE 2 (solo presentes en baseline)
-    REQUIRED_COLUMNS = {
-        "semana",
-        "tipo_observacion",
-        "riesgo_id",           # columna J
-        "is_control_critico",  # columna K
-        "control_critico_id"   # columna L
-    }
-
     # Nos quedamos solo con filas que tengan esas columnas (baseline)
-    missing = REQUIRED_COLUMNS - set(df.columns)
+    missing = set(OCC_COLUMNS) - set(df.columns)
     if missing:
         state.reasoning.append(
             "OCC Enrichment Node: columnas J/K/L no presentes en todas las filas "
             "(esperado para STDE 12s). Se filtrarán automáticamente."
         )
 
-    # Filtrar solo OCC
-    df_occ = df[df["tipo_observacion"] == "OCC"]
-
-    # Mantener solo filas con riesgo_id válido (baseline)
-    df_occ = df_occ[df_occ["riesgo_id"].notna()]
-
-    risk_map: Dict[str, Dict[str, Any]] = {}
-    total_occ = 0
-    occ_with_critical_control = 0
-
-    for _, row in df_occ.iterrows():
-        total_occ += 1
-
-        riesgo_id = row["riesgo_id"]
-        semana = int(row["semana"])
-        is_control_critico = bool(row.get("is_control_critico", False))
-
-        control_id = None
-        if is_control_critico:
-            control_id = row.get("control_critico_id")
-            if pd.notna(control_id):
-                occ_with_critical_control += 1
-
-        if riesgo_id not in risk_map:
-            risk_map[riesgo_id] = {"occ_events": []}
-
-        risk_map[riesgo_id]["occ_events"].append(
-            {
-                "week": semana,
-                "is_control_critico": is_control_critico,
-                "control_critico_id": control_id
-            }
-        )
+    df_occ = _occ_frame(df)
+    risk_map = summarize_occ_by_risk(df_occ)
 
     # Persistencia en el estado (FASE 2)
     state.risk_enrichment = {
         "by_risk": risk_map,
         "summary": {
-            "total_occ": total_occ,
-            "occ_with_critical_control": occ_with_critical_control,
-            "risks_affected": sorted(risk_map.keys())
-        }
+            "total_occ": int(len(df_occ)),
+            "occ_with_critical_control": int(df_occ["control_critico_id"].notna().sum()),
+            "risks_affected": sorted(risk_map.keys()),
+        },
     }
 
+    drilldown = _drilldown_request(state)
+    if drilldown is not None:
+        state.risk_enrichment["occ_events"] = occ_events_page(
+            df_occ,
+            risk_id=drilldown.get("risk_id"),
+            offset=int(drilldown.get("offset", 0)),
+            limit=int(drilldown.get("limit", DEFAULT_PAGE_SIZE)),
+        )
+
     state.reasoning.append(
         "OCC Enrichment Node: OCC enriquecidas con riesgo y control crítico (FASE 2)."
     )
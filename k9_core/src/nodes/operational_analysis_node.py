@@ -1,124 +1,178 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.dataset_handle import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.data.request_context import ensure_data_context
+from src.graph.memoize import command_of, memoizable
 from src.state.state import K9State
 
 
-def _extract_occ_records(state: K9State) -> List[Dict[str, Any]]:
+# Columnas canónicas de la evidencia ← nombres aceptados (en orden de prioridad)
+EVIDENCE_COLUMNS: Dict[str, List[str]] = {
+    "id": ["id", "occ_id", "id_observacion", "id_obs"],
+    "risk_id": ["risk_id", "id_riesgo", "riesgo_id", "risk"],
+    "type": ["type", "tipo", "observation_type", "class", "tipo_observacion"],
+    "control_id": ["control_id", "id_control", "control", "control_critico_id"],
+    "is_critical_control": ["is_critical_control", "control_critico", "is_critical", "is_control_critico"],
+    "audit_id": ["audit_id", "id_auditoria", "auditoria_id"],
+    "week": ["week", "semana"],
+    "area_id": ["area_id", "id_area"],
+}
+
+TRACEABILITY_COLUMNS = {"id": "occ_id", "risk_id": "risk_id", "control_id": "control_id", "audit_id": "audit_id"}
+
+# payload.traceability_page: {"offset", "limit"}
+TRACEABILITY_PAGE_KEY = "traceability_page"
+
+# Auditorías diarias: vínculo riesgo / área / semana
+AUDIT_ID_COLUMN = "id_auditoria_final"
+AUDIT_RISK_COLUMN = "riesgo_focal"
+
+
+# =====================================================
+# Evidencia columnar
+# =====================================================
+
+def _records_from_enrichment(risk_enrichment: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Registros explícitos en risk_enrichment (lista directa o por riesgo).
+    None si no hay registros (→ se usan las observaciones del DataSlice).
+    """
+    if not isinstance(risk_enrichment, dict):
+        return None
+
+    records: List[Dict[str, Any]] = []
+    direct = risk_enrichment.get("occ_records") or risk_enrichment.get("records")
+    if isinstance(direct, list):
+        records.extend(direct)
+
+    by_risk = risk_enrichment.get("by_risk")
+    if isinstance(by_risk, dict):
+        for payload in by_risk.values():
+            if isinstance(payload, dict):
+                lst = payload.get("occ_records") or payload.get("records")
+                if isinstance(lst, list):
+                    records.extend(lst)
+
+    records = [r for r in records if isinstance(r, dict)]
+    return records or None
+
+
+def build_evidence_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normaliza `df` (registros u observaciones) a las columnas canónicas de
+    EVIDENCE_COLUMNS, columna a columna (sin copiar registros).
+    """
+    columns: Dict[str, pd.Series] = {}
+    for name, aliases in EVIDENCE_COLUMNS.items():
+        column = pd.Series(None, index=df.index, dtype=object)
+        for alias in reversed(aliases):
+            if alias in df.columns:
+                values = df[alias].astype(object)
+                column = values.where(values.notna(), column)
+        columns[name] = column
+
+    frame = pd.DataFrame(columns, index=df.index)
+    frame = frame[frame["risk_id"].notna()]
+
+    # Tipo → {"OCC", "OPG"} (sin tipo → OCC)
+    kind = frame["type"].fillna("OCC").astype(str).str.upper()
+    frame["type"] = np.select(
+        [kind.str.contains("OCC"), kind.str.contains("OPG")], ["OCC", "OPG"], kind
+    )
+
+    frame["id"] = frame["id"].fillna("UNKNOWN_OCC")
+    frame["is_critical_control"] = frame["is_critical_control"].fillna(False).astype(bool)
+    return frame.reset_index(drop=True)
+
+
+def join_audits(evidence: pd.DataFrame, audits: pd.DataFrame) -> pd.DataFrame:
+    """
+    OCC → auditoría: primera auditoría del mismo riesgo, área y semana.
+    Un audit_id explícito en la evidencia tiene prioridad.
     """
-    Extrae registros OCC/OPG enriquecidos desde el estado.
+    keys = ["risk_id", "area_id", "week"]
+    needed = {AUDIT_ID_COLUMN, AUDIT_RISK_COLUMN, "id_area", "semana"}
+    if evidence.empty or not needed <= set(audits.columns):
+        return evidence
+
+    lookup = (
+        audits.rename(columns={AUDIT_RISK_COLUMN: "risk_id", "id_area": "area_id", "semana": "week"})
+        .astype({"risk_id": object, "area_id": object, "week": object})
+        .drop_duplicates(subset=keys)[[*keys, AUDIT_ID_COLUMN]]
+    )
+    joined = evidence.merge(lookup, on=keys, how="left")
+    joined["audit_id"] = joined["audit_id"].where(joined["audit_id"].notna(), joined[AUDIT_ID_COLUMN])
+    return joined.drop(columns=[AUDIT_ID_COLUMN])
 
-    Este nodo asume que OCCEnrichmentNode ya corrió y dejó evidencia en:
-      - state.risk_enrichment (preferido)
-    y/o que DataEngine / otros nodos puedan haber expuesto estructuras equivalentes.
 
-    La función es robusta: soporta múltiples formas sin romper.
+def summarize_evidence(evidence: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
     """
-    occ_records: List[Dict[str, Any]] = []
-
-    # 1) Preferido: salida estructurada del OCCEnrichmentNode
-    risk_enrichment = getattr(state, "risk_enrichment", None)
-    if isinstance(risk_enrichment, dict):
-        # Caso A: risk_enrichment trae una lista directa
-        direct = risk_enrichment.get("occ_records") or risk_enrichment.get("records")
-        if isinstance(direct, list):
-            for x in direct:
-                if isinstance(x, dict):
-                    occ_records.append(x)
-
-        # Caso B: risk_enrichment por riesgo
-        by_risk = risk_enrichment.get("by_risk")
-        if isinstance(by_risk, dict):
-            for _, payload in by_risk.items():
-                if not isinstance(payload, dict):
-                    continue
-
-                # Puede venir como lista unificada
-                for key in ("occ_records", "records", "items", "occ", "observations"):
-                    lst = payload.get(key)
-                    if isinstance(lst, list):
-                        for x in lst:
-                            if isinstance(x, dict):
-                                occ_records.append(x)
-
-                # Puede venir separado OCC vs OPG
-                for key in ("occ", "occ_list", "occ_items"):
-                    lst = payload.get(key)
-                    if isinstance(lst, list):
-                        for x in lst:
-                            if isinstance(x, dict):
-                                x = dict(x)
-                                x.setdefault("type", "OCC")
-                                occ_records.append(x)
-
-                for key in ("opg", "opg_list", "opg_items"):
-                    lst = payload.get(key)
-                    if isinstance(lst, list):
-                        for x in lst:
-                            if isinstance(x, dict):
-                                x = dict(x)
-                                x.setdefault("type", "OPG")
-                                occ_records.append(x)
-
-    # 2) Fallback: algunos flujos pueden dejarlo en analysis.engine u otros bloques
-    analysis = state.analysis or {}
-    engine = analysis.get("engine", {})
-    if isinstance(engine, dict):
-        for key in ("occ_enrichment", "occ_records", "observations_enriched"):
-            candidate = engine.get(key)
-            if isinstance(candidate, list):
-                for x in candidate:
-                    if isinstance(x, dict):
-                        occ_records.append(x)
-            elif isinstance(candidate, dict):
-                # Si viene por riesgo
-                by_risk = candidate.get("by_risk")
-                if isinstance(by_risk, dict):
-                    for _, payload in by_risk.items():
-                        if isinstance(payload, dict):
-                            lst = payload.get("records") or payload.get("occ_records")
-                            if isinstance(lst, list):
-                                for x in lst:
-                                    if isinstance(x, dict):
-                                        occ_records.append(x)
-
-    # Normalización mínima: asegurar campos mínimos esperados por el nodo operacional
-    normalized: List[Dict[str, Any]] = []
-    for r in occ_records:
-        if not isinstance(r, dict):
-            continue
-        rr = dict(r)
-
-        # Campos mínimos
-        rr.setdefault("id", rr.get("occ_id") or rr.get("id_observacion") or rr.get("id_obs"))
-        rr.setdefault("risk_id", rr.get("id_riesgo") or rr.get("riesgo_id") or rr.get("risk"))
-        rr.setdefault("type", rr.get("tipo") or rr.get("observation_type") or rr.get("class"))
-
-        # Si aún no hay type, inferir por presencia de "OCC" en texto
-        if rr.get("type") is None:
-            rr["type"] = "OCC"
-
-        # Normalizar type a {"OCC","OPG"} si venía diferente
-        t = str(rr.get("type")).upper()
-        rr["type"] = "OCC" if "OCC" in t else "OPG" if "OPG" in t else t
-
-        # control / criticidad
-        rr.setdefault("control_id", rr.get("id_control") or rr.get("control"))
-        rr.setdefault("is_critical_control", rr.get("control_critico") or rr.get("is_critical") or False)
-        rr.setdefault("audit_id", rr.get("id_auditoria") or rr.get("auditoria_id"))
-
-        # Filtrar registros que no tengan risk_id (no se pueden agrupar)
-        if rr.get("risk_id") is None:
-            continue
-        # Filtrar registros sin id, pero mantener si el resto está OK (para conteos)
-        if rr.get("id") is None:
-            rr["id"] = "UNKNOWN_OCC"
-
-        normalized.append(rr)
-
-    return normalized
+    Por riesgo (orden de aparición): OCC / OPG, controles y controles
+    críticos afectados.
+    """
+    risk = evidence["risk_id"]
+    is_occ = evidence["type"] == "OCC"
+    occ_count = is_occ.groupby(risk, sort=False).sum()
+    opg_count = (~is_occ).groupby(risk, sort=False).sum()
+
+    with_control = evidence[evidence["control_id"].notna() & (evidence["control_id"] != "")]
+    controls = with_control.groupby("risk_id", sort=False)["control_id"].unique()
+    critical = (
+        with_control[with_control["is_critical_control"]]
+        .groupby("risk_id", sort=False)["control_id"]
+        .unique()
+    )
+
+    return {
+        risk_id: {
+            "occ_count": int(occ_count[risk_id]),
+            "opg_count": int(opg_count[risk_id]),
+            "controls_affected": [str(c) for c in controls.get(risk_id, [])],
+            "critical_controls_affected": [str(c) for c in critical.get(risk_id, [])],
+        }
+        for risk_id in occ_count.index
+    }
+
+
+def iter_traceability(evidence: pd.DataFrame, offset: int = 0, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Trazabilidad OCC → riesgo → control → auditoría, emitida a pedido."""
+    window = evidence.iloc[offset : None if limit is None else offset + limit]
+    rows = window[list(TRACEABILITY_COLUMNS)].astype(object)
+    rows = rows.where(rows.notna(), None).rename(columns=TRACEABILITY_COLUMNS)
+    for values in rows.itertuples(index=False, name=None):
+        yield dict(zip(rows.columns, values))
+
 
+def _traceability_request(command: Dict[str, Any]) -> Dict[str, int]:
+    payload = command.get("payload") or {}
+    spec = payload.get(TRACEABILITY_PAGE_KEY) or {}
+    offset = int(spec.get("offset", 0))
+    limit = int(spec.get("limit", DEFAULT_PAGE_SIZE))
+    if offset < 0 or limit <= 0:
+        raise ValueError("OperationalAnalysisNode: offset >= 0 y limit > 0 requeridos.")
+    return {"offset": offset, "limit": min(limit, MAX_PAGE_SIZE)}
 
+
+# =====================================================
+# OperationalAnalysisNode
+# =====================================================
+
+def _operational_request(state: K9State):
+    command = command_of(state)
+    payload = command.get("payload") or {}
+    return [bool(command), command.get("intent"), payload.get(TRACEABILITY_PAGE_KEY)]
+
+
+@memoizable(
+    reads=(_operational_request, "risk_enrichment", "data_slice"),
+    writes=("analysis.operational_analysis",),
+    uses_data=True,
+)
 def operational_analysis_node(state: K9State) -> K9State:
     """
     OperationalAnalysisNode — K9 v3.2
@@ -130,16 +184,20 @@ def operational_analysis_node(state: K9State) -> K9State:
         sin juicios cognitivos, sin umbrales, sin narrativa.
       - Esta evidencia es consumida por Metrics/Adapter/Streamlit/Proactive.
 
+    Fuente (columnar):
+      - Registros explícitos en state.risk_enrichment, o
+      - Observaciones del DataSlice (contexto de datos del request)
+
     Salida:
       state.analysis["operational_analysis"] = {
         "evidence_by_risk": { ... },
-        "traceability": [ ... ],
+        "traceability": [ ... ],   # página (payload.traceability_page)
         "meta": { ... }
       }
     """
 
     context = state.context_bundle or {}
-    command = context.get("k9_command")
+    command = state.k9_command or context.get("k9_command")
 
     if not command:
         state.reasoning.append(
@@ -155,71 +213,43 @@ def operational_analysis_node(state: K9State) -> K9State:
         return state
 
     analysis: Dict[str, Any] = state.analysis or {}
-    occ_records = _extract_occ_records(state)
 
     # --------------------------------------------------
-    # 4) Evidencia operacional detallada por riesgo
+    # 1) Evidencia como frame columnar
     # --------------------------------------------------
-    evidence_by_risk: Dict[str, Dict[str, Any]] = {}
-
-    for occ in occ_records:
-        risk_id = occ["risk_id"]
-
-        if risk_id not in evidence_by_risk:
-            evidence_by_risk[risk_id] = {
-                "occ_count": 0,
-                "opg_count": 0,
-                "occ_records": [],
-                "opg_records": [],
-                "controls_affected": set(),
-                "critical_controls_affected": set(),
-            }
-
-        if occ.get("type") == "OCC":
-            evidence_by_risk[risk_id]["occ_count"] += 1
-            evidence_by_risk[risk_id]["occ_records"].append(occ)
-        else:
-            evidence_by_risk[risk_id]["opg_count"] += 1
-            evidence_by_risk[risk_id]["opg_records"].append(occ)
-
-        control_id = occ.get("control_id")
-        if control_id:
-            evidence_by_risk[risk_id]["controls_affected"].add(control_id)
-            if bool(occ.get("is_critical_control")):
-                evidence_by_risk[risk_id]["critical_controls_affected"].add(control_id)
+    records = _records_from_enrichment(state.risk_enrichment)
+    if records is not None:
+        evidence = build_evidence_frame(pd.DataFrame.from_records(records))
+        source = "risk_enrichment"
+    else:
+        ctx = ensure_data_context(state)
+        evidence = build_evidence_frame(ctx.observaciones())
+        evidence = join_audits(evidence, ctx.auditorias())
+        source = "observaciones (DataSlice)"
 
     # --------------------------------------------------
-    # 5) Normalización de estructuras para consumo externo
+    # 2) Evidencia por riesgo + trazabilidad paginada
     # --------------------------------------------------
-    for risk_id, data in evidence_by_risk.items():
-        data["controls_affected"] = list(data["controls_affected"])
-        data["critical_controls_affected"] = list(data["critical_controls_affected"])
+    evidence_by_risk = summarize_evidence(evidence)
 
-    # --------------------------------------------------
-    # 6) Trazabilidad OCC → control → auditoría
-    # --------------------------------------------------
-    traceability: List[Dict[str, Any]] = []
-    for occ in occ_records:
-        traceability.append(
-            {
-                "occ_id": occ.get("id"),
-                "risk_id": occ.get("risk_id"),
-                "control_id": occ.get("control_id"),
-                "audit_id": occ.get("audit_id"),
-            }
-        )
+    page = _traceability_request(command)
+    traceability = list(iter_traceability(evidence, **page))
+    end = page["offset"] + len(traceability)
 
-    # --------------------------------------------------
-    # 7) Salida final
-    # --------------------------------------------------
     analysis["operational_analysis"] = {
         "evidence_by_risk": evidence_by_risk,
         "traceability": traceability,
         "meta": {
             "source": "OCC enrichment + STDE",
+            "evidence_source": source,
             "semantic_level": "operational",
-            "records_total": int(len(occ_records)),
+            "records_total": int(len(evidence)),
             "risks_total": int(len(evidence_by_risk)),
+            "traceability_page": {
+                **page,
+                "total": int(len(evidence)),
+                "next_offset": end if end < len(evidence) else None,
+            },
         },
     }
 
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from src.state.state import K9State
 
 # 🔒 Contrato temporal canónico
@@ -56,6 +58,88 @@ VALID_TIME_VALUES = {
 }
 
 
+def build_time_context(
+    command: Dict[str, Any],
+    reasoning: List[str],
+    source: str = "RouterNode",
+) -> TimeContext:
+    """
+    Traducción canónica payload.time → TimeContext (única fuente).
+
+    Usada por TimeResolutionNode (antes de leer datos) y por RouterNode;
+    `source` es el nodo que la invoca (prefijo de reasoning y errores).
+    Sin payload.time aplica el default explícito CURRENT_WEEK (INFERRED).
+    """
+    payload = command.get("payload", {}) or {}
+    payload_time = payload.get("time")
+
+    # ---------
+    # DEFAULT EXPLÍCITO
+    # ---------
+    if payload_time is None:
+        time_context = TimeContext(
+            type="RELATIVE",
+            value="CURRENT_WEEK",
+            confidence="INFERRED",
+        )
+
+        reasoning.append(
+            f"{source}: no payload.time provided → "
+            "default TimeContext CURRENT_WEEK (INFERRED)."
+        )
+
+    else:
+        time_type_raw = payload_time.get("type")
+        time_value_raw = payload_time.get("value")
+        confidence = payload_time.get("confidence", "EXPLICIT")
+
+        # Validación básica de tipos
+        if not isinstance(time_type_raw, str) or not isinstance(time_value_raw, str):
+            raise ValueError(
+                f"{source} ERROR: payload.time.type and payload.time.value must be strings."
+            )
+
+        # 🔒 Canonicalización de casing (LLM → core)
+        time_type = time_type_raw.upper()
+        time_value = time_value_raw.upper()
+
+        # 🔒 Normalización semántica mínima
+        # Caso típico del LLM: WINDOW + LAST_*  → RELATIVE
+        if time_type == "WINDOW" and time_value.startswith("LAST_"):
+            reasoning.append(
+                f"{source}: correcting time.type from WINDOW to RELATIVE "
+                f"for value '{time_value}'."
+            )
+            time_type = "RELATIVE"
+
+        # Validación estricta contra vocabulario canónico
+        if time_type not in VALID_TIME_VALUES:
+            raise ValueError(
+                f"{source} ERROR: invalid time.type '{time_type_raw}'. "
+                f"Allowed={sorted(VALID_TIME_VALUES.keys())}"
+            )
+
+        if time_value not in VALID_TIME_VALUES[time_type]:
+            raise ValueError(
+                f"{source} ERROR: invalid time.value '{time_value_raw}' "
+                f"for type '{time_type}'. "
+                f"Allowed={sorted(VALID_TIME_VALUES[time_type])}"
+            )
+
+        time_context = TimeContext(
+            type=time_type,
+            value=time_value,
+            confidence=confidence,
+        )
+
+        reasoning.append(
+            f"{source}: TimeContext created "
+            f"(type={time_type}, value={time_value}, confidence={confidence})."
+        )
+
+    return time_context
+
+
 def router_node(state: K9State) -> K9State:
     """
     Router Node — K9 Canonical (v1.4)
@@ -135,71 +219,13 @@ def router_node(state: K9State) -> K9State:
     # =========================================================
     # 🔑 Traducción payload.time → TimeContext
     # =========================================================
-    payload = command.get("payload", {}) or {}
-    payload_time = payload.get("time")
-
-    # ---------
-    # DEFAULT EXPLÍCITO
-    # ---------
-    if payload_time is None:
-        state.time_context = TimeContext(
-            type="RELATIVE",
-            value="CURRENT_WEEK",
-            confidence="INFERRED",
-        )
-
-        state.reasoning.append(
-            "RouterNode: no payload.time provided → "
-            "default TimeContext CURRENT_WEEK (INFERRED)."
-        )
-
+    # (puede venir resuelto por TimeResolutionNode, antes del data engine)
+    if state.time_context is None:
+        state.time_context = build_time_context(command, state.reasoning)
     else:
-        time_type_raw = payload_time.get("type")
-        time_value_raw = payload_time.get("value")
-        confidence = payload_time.get("confidence", "EXPLICIT")
-
-        # Validación básica de tipos
-        if not isinstance(time_type_raw, str) or not isinstance(time_value_raw, str):
-            raise ValueError(
-                "RouterNode ERROR: payload.time.type and payload.time.value must be strings."
-            )
-
-        # 🔒 Canonicalización de casing (LLM → core)
-        time_type = time_type_raw.upper()
-        time_value = time_value_raw.upper()
-
-        # 🔒 Normalización semántica mínima
-        # Caso típico del LLM: WINDOW + LAST_*  → RELATIVE
-        if time_type == "WINDOW" and time_value.startswith("LAST_"):
-            state.reasoning.append(
-                f"RouterNode: correcting time.type from WINDOW to RELATIVE "
-                f"for value '{time_value}'."
-            )
-            time_type = "RELATIVE"
-
-        # Validación estricta contra vocabulario canónico
-        if time_type not in VALID_TIME_VALUES:
-            raise ValueError(
-                f"RouterNode ERROR: invalid time.type '{time_type_raw}'. "
-                f"Allowed={sorted(VALID_TIME_VALUES.keys())}"
-            )
-
-        if time_value not in VALID_TIME_VALUES[time_type]:
-            raise ValueError(
-                f"RouterNode ERROR: invalid time.value '{time_value_raw}' "
-                f"for type '{time_type}'. "
-                f"Allowed={sorted(VALID_TIME_VALUES[time_type])}"
-            )
-
-        state.time_context = TimeContext(
-            type=time_type,
-            value=time_value,
-            confidence=confidence,
-        )
-
         state.reasoning.append(
-            f"RouterNode: TimeContext created "
-            f"(type={time_type}, value={time_value}, confidence={confidence})."
+            f"RouterNode: TimeContext already resolved upstream "
+            f"(type={state.time_context.type}, value={state.time_context.value})."
         )
 
     # -----------------------------
@@ -0,0 +1,86 @@
+from src.data.data_manager import DataManager
+from src.data.request_context import ensure_data_context
+from src.nodes.router import build_time_context
+from src.state.state import K9State
+
+# 🔒 Contrato operativo (el único que el core conoce)
+from src.time.data_slice import DataSlice
+from src.time.time_context import TimeContext
+
+# 🔒 Resolución temporal determinista
+from src.time.time_resolution import TimeResolutionLayer
+
+
+# Dataset que define el eje canónico de semanas
+TIME_AXIS_DATASET = "stde_trayectorias_semanales.csv"
+
+
+def resolve_data_slice(dm: DataManager, time_ctx: TimeContext) -> DataSlice:
+    """
+    TimeContext → DataSlice usando solo metadatos temporales
+    (cacheados por versión del dataset), sin leer filas.
+    """
+    metadata = dm.get_time_metadata(TIME_AXIS_DATASET)
+
+    if metadata is None or metadata.granularity != "week":
+        raise KeyError(
+            "TimeResolution: 'semana' column required to resolve temporal metadata."
+        )
+
+    return TimeResolutionLayer().resolve(time_ctx=time_ctx, metadata=metadata)
+
+
+def time_resolution_node(state: K9State) -> K9State:
+    """
+    TimeResolutionNode — antes de cualquier lectura de datos
+
+    Rol:
+    - Traducir payload.time → TimeContext (traducción canónica del Router)
+    - Resolver TimeContext → DataSlice (metadatos, sin filas)
+    - Dejar state.data_slice listo para todos los nodos que leen datos
+    - Abrir el contexto de datos del request (state.data_context)
+    - NO leer datasets
+    - NO interpretar semántica
+
+    DataSlice FULL (ventana completa) cuando:
+    - el tiempo es INFERRED (default sin payload.time): no se acota la data
+      por un tiempo que el usuario no pidió
+    - el contexto no es resoluble aquí (WINDOW / ANCHOR)
+    - faltan metadatos semanales del eje temporal
+    """
+
+    context = state.context_bundle or {}
+    command = state.k9_command or context.get("k9_command")
+
+    if not command or command.get("type") == "COMPOSITE_K9_COMMAND":
+        state.reasoning.append(
+            "TimeResolutionNode: no simple K9_COMMAND → sin DataSlice (FULL)."
+        )
+        return state
+
+    if state.time_context is None:
+        state.time_context = build_time_context(
+            command, state.reasoning, source="TimeResolutionNode"
+        )
+
+    ctx = ensure_data_context(state)
+
+    if state.data_slice is None:
+        if not state.time_context.is_explicit():
+            state.data_slice = DataSlice(resolution="FULL")
+            state.reasoning.append(
+                "TimeResolutionNode: TimeContext INFERRED → DataSlice FULL (sin acotar)."
+            )
+        else:
+            try:
+                state.data_slice = resolve_data_slice(ctx.dm, state.time_context)
+            except (NotImplementedError, KeyError) as e:
+                state.data_slice = DataSlice(resolution="FULL")
+                state.reasoning.append(f"TimeResolutionNode: {e} → DataSlice FULL.")
+
+        ctx.bind_slice(state.data_slice)
+        state.reasoning.append(
+            f"TimeResolutionNode: DataSlice resolved from TimeContext → {state.data_slice}"
+        )
+
+    return state
@@ -0,0 +1,30 @@
+# src/scenarios/__init__.py
+
+from .engine import (
+    OverlayLayer,
+    Scenario,
+    ScenarioCache,
+    ScenarioEngine,
+    ScenarioView,
+    get_scenario,
+    get_scenario_cache,
+    register_scenario,
+    scenario_for_event,
+)
+from .critical_monday import CRITICAL_MONDAY, apply_critical_monday_overlay
+from .signals import weekly_signals_from_trajectories
+
+__all__ = [
+    "OverlayLayer",
+    "Scenario",
+    "ScenarioCache",
+    "ScenarioEngine",
+    "ScenarioView",
+    "get_scenario",
+    "get_scenario_cache",
+    "register_scenario",
+    "scenario_for_event",
+    "CRITICAL_MONDAY",
+    "apply_critical_monday_overlay",
+    "weekly_signals_from_trajectories",
+]
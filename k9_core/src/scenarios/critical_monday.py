@@ -0,0 +1,108 @@
+# src/scenarios/critical_monday.py
+
+from typing import Any, Dict
+
+import pandas as pd
+
+from src.data.data_manager import DataManager
+from src.data.time_dimension import WEEK_KEY
+from src.scenarios.engine import (
+    TRAJECTORIES_DATASET,
+    OverlayLayer,
+    Scenario,
+    register_scenario,
+)
+from src.scenarios.signals import risk_media_columns
+
+
+CRITICAL_MONDAY_ID = "critical_monday"
+CRITICAL_MONDAY_EVENT = "CRITICAL_MONDAY"
+
+_REQUIRED_COLUMNS = {"semana", "id_riesgo", "criticidad_real_lunes_critico"}
+
+
+def apply_critical_monday_overlay(df_tray: pd.DataFrame, df_evt: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the synthetic 'Critical Monday' scenario by appending/updating a new week row
+    using `stde_riesgos_evento_lunes_critico.csv`.
+
+    Notes:
+    - Scenario file expresses criticidad on a 0–100 scale; we normalize to 0–1.
+    - We keep other risks unchanged for the injected week unless explicitly provided.
+    - `df_tray` is never modified; injected weeks are appended in a single concat.
+    """
+    if df_evt is None or df_evt.empty or not _REQUIRED_COLUMNS.issubset(set(df_evt.columns)):
+        return df_tray
+
+    out = df_tray.copy()
+    risk_cols = risk_media_columns(out)
+    injected: Dict[int, Dict[str, Any]] = {}
+
+    for row in df_evt.to_dict("records"):
+        try:
+            week = int(row["semana"])
+        except Exception:
+            continue
+        risk_id = str(row["id_riesgo"]).strip()
+        if not risk_id:
+            continue
+        target_col = f"criticidad_{risk_id}_media"
+        if target_col not in out.columns:
+            continue
+
+        try:
+            criticidad_01 = float(row["criticidad_real_lunes_critico"]) / 100.0
+        except Exception:
+            continue
+
+        if (out["semana"] == week).any():
+            out.loc[out["semana"] == week, target_col] = criticidad_01
+        elif week in injected:
+            injected[week][target_col] = criticidad_01
+        else:
+            # start from last known week row (keeps other risks stable)
+            last_injected = max(injected) if injected else None
+            if last_injected is not None and last_injected > out["semana"].max():
+                base = dict(injected[last_injected])
+            else:
+                base = out.sort_values("semana").iloc[-1].to_dict()
+            base["semana"] = week
+            if WEEK_KEY in base:
+                base[WEEK_KEY] = week
+            base[target_col] = criticidad_01
+
+            # recompute global media if present
+            if "criticidad_global_media" in out.columns and risk_cols:
+                base["criticidad_global_media"] = float(
+                    sum(float(base.get(c, 0) or 0) for c in risk_cols) / float(len(risk_cols))
+                )
+            injected[week] = base
+
+    if injected:
+        out = pd.concat([out, pd.DataFrame(list(injected.values()))], ignore_index=True)
+
+    return out.sort_values("semana").reset_index(drop=True)
+
+
+def _overlay_trajectories(dm: DataManager, df_tray: pd.DataFrame) -> pd.DataFrame:
+    try:
+        df_evt = dm.get_riesgos_evento_lunes_critico()
+    except FileNotFoundError:
+        return df_tray
+    return apply_critical_monday_overlay(df_tray, df_evt)
+
+
+CRITICAL_MONDAY = register_scenario(
+    Scenario(
+        scenario_id=CRITICAL_MONDAY_ID,
+        event_type=CRITICAL_MONDAY_EVENT,
+        layers=(
+            OverlayLayer(
+                dataset=TRAJECTORIES_DATASET,
+                load=lambda dm: dm.get_trayectorias_semanales(),
+                apply=_overlay_trajectories,
+            ),
+        ),
+        description="Lunes crítico: criticidad real del evento inyectada en las trayectorias semanales.",
+    )
+)
@@ -0,0 +1,213 @@
+# src/scenarios/engine.py
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from src.data.data_manager import DataManager
+from src.scenarios.signals import weekly_signals_from_trajectories
+
+
+TRAJECTORIES_DATASET = "stde_trayectorias_semanales.csv"
+
+
+# =====================================================
+# Declaración de escenarios
+# =====================================================
+
+@dataclass(frozen=True)
+class OverlayLayer:
+    """
+    Capa copy-on-write sobre un dataset base.
+
+    - `load(dm)` entrega el dataset base (compartido, solo-lectura).
+    - `apply(dm, df)` retorna un DataFrame NUEVO con el overlay aplicado;
+      nunca modifica `df` in-place.
+    """
+
+    dataset: str
+    load: Callable[[DataManager], pd.DataFrame]
+    apply: Callable[[DataManager, pd.DataFrame], pd.DataFrame]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Escenario what-if: capas overlay apiladas sobre los datasets base.
+    Se activa cuando `state.active_event["type"] == event_type`.
+    """
+
+    scenario_id: str
+    event_type: str
+    layers: Tuple[OverlayLayer, ...]
+    description: str = ""
+
+
+_REGISTRY: Dict[str, Scenario] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register_scenario(scenario: Scenario) -> Scenario:
+    """Registra (o reemplaza) un escenario por su `scenario_id`."""
+    with _REGISTRY_LOCK:
+        _REGISTRY[scenario.scenario_id] = scenario
+    return scenario
+
+
+def get_scenario(scenario_id: str) -> Scenario:
+    try:
+        return _REGISTRY[scenario_id]
+    except KeyError:
+        raise KeyError(f"Escenario no registrado: {scenario_id}") from None
+
+
+def scenario_for_event(active_event: Any) -> Optional[Scenario]:
+    """Escenario asociado a `state.active_event` (None si no hay overlay)."""
+    if not isinstance(active_event, dict):
+        return None
+    event_type = active_event.get("type")
+    for scenario in _REGISTRY.values():
+        if scenario.event_type == event_type:
+            return scenario
+    return None
+
+
+# =====================================================
+# Materialización
+# =====================================================
+
+@dataclass(frozen=True)
+class ScenarioView:
+    """
+    Resultado materializado de un escenario para una versión de los datos.
+
+    Compartido entre requests: `frame()` y `signals()` entregan copias
+    (superficial / profunda) para que los consumidores no alteren el cache.
+    """
+
+    scenario_id: str
+    dataset_version: str
+    frames: Mapping[str, pd.DataFrame]
+    weekly_signals: Optional[Mapping[str, Dict[str, Any]]] = None
+
+    def frame(self, dataset: str) -> Optional[pd.DataFrame]:
+        df = self.frames.get(dataset)
+        return df.copy(deep=False) if df is not None else None
+
+    def signals(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        return copy.deepcopy(dict(self.weekly_signals)) if self.weekly_signals is not None else None
+
+
+class ScenarioCache:
+    """
+    Cache process-wide de escenarios materializados, keyed por
+    (origen de datos, scenario_id) y validado contra `dataset_version`.
+    Conserva solo la versión vigente de cada escenario.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, ScenarioView] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+
+    def get(self, key: Hashable, version: str, builder: Callable[[], ScenarioView]) -> ScenarioView:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Un lock por clave: requests concurrentes materializan una sola vez
+        with key_lock:
+            view = self._entries.get(key)
+            if view is not None and view.dataset_version == version:
+                with self._lock:
+                    self.hits += 1
+                return view
+
+            t0 = time.perf_counter()
+            view = builder()
+            elapsed = time.perf_counter() - t0
+            self._entries[key] = view
+
+            with self._lock:
+                self.misses += 1
+                self.build_seconds += elapsed
+            return view
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "build_seconds": round(self.build_seconds, 6),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+            self.hits = self.misses = 0
+            self.build_seconds = 0.0
+
+
+_SCENARIO_CACHE = ScenarioCache()
+
+
+def get_scenario_cache() -> ScenarioCache:
+    """Cache compartido por todas las instancias de ScenarioEngine del proceso."""
+    return _SCENARIO_CACHE
+
+
+class ScenarioEngine:
+    """
+    Materializa escenarios sobre un DataManager.
+
+    Cada escenario se construye UNA vez por (versión de datos, scenario_id):
+    las capas se aplican en orden sobre los datasets base y, si el escenario
+    altera las trayectorias semanales, se recalculan las weekly_signals.
+    """
+
+    def __init__(self, dm: DataManager, cache: Optional[ScenarioCache] = None):
+        self.dm = dm
+        self._cache = cache if cache is not None else get_scenario_cache()
+
+    def materialize(self, scenario_id: str) -> ScenarioView:
+        scenario = get_scenario(scenario_id)
+        version = self.dm.dataset_version()
+        key = (str(self.dm.base_path.resolve()), scenario_id)
+        return self._cache.get(key, version, lambda: self._build(scenario, version))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+    # ---------- Helpers internos ----------
+
+    def _build(self, scenario: Scenario, version: str) -> ScenarioView:
+        frames: Dict[str, pd.DataFrame] = {}
+        for layer in scenario.layers:
+            base = frames.get(layer.dataset)
+            if base is None:
+                base = layer.load(self.dm)
+            frames[layer.dataset] = layer.apply(self.dm, base)
+
+        signals = None
+        if TRAJECTORIES_DATASET in frames:
+            signals = weekly_signals_from_trajectories(frames[TRAJECTORIES_DATASET])
+
+        return ScenarioView(
+            scenario_id=scenario.scenario_id,
+            dataset_version=version,
+            frames=frames,
+            weekly_signals=signals,
+        )
@@ -0,0 +1,54 @@
+# src/scenarios/signals.py
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+def risk_media_columns(df_tray: pd.DataFrame) -> list:
+    """Columnas `criticidad_<riesgo>_media` (sin la media global)."""
+    return [
+        c for c in df_tray.columns
+        if c.startswith("criticidad_") and c.endswith("_media") and c != "criticidad_global_media"
+    ]
+
+
+def weekly_signals_from_trajectories(df_tray: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Recompute weekly_signals from `stde_trayectorias_semanales.csv` style data.
+    Used for scenario overlay so injected week participates in dominance ranking.
+
+    Vectorized over the week × risk criticidad matrix: one stable argsort per
+    row gives the ranks (ties keep column order); averages and top-3 counts
+    are column reductions.
+    """
+    risk_cols = risk_media_columns(df_tray)
+    risks = [c.replace("criticidad_", "").replace("_media", "") for c in risk_cols]
+
+    df_sorted = df_tray.sort_values("semana").reset_index(drop=True)
+    n_weeks = len(df_sorted)
+    if not risks or n_weeks == 0:
+        return {}
+
+    crit = df_sorted[risk_cols].to_numpy(dtype=np.float64)
+
+    # rank per week (1 = highest criticidad)
+    order = np.argsort(-crit, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(risks) + 1), axis=1)
+
+    # cumsum adds sequentially (same floats as Python sum(), no pairwise summation)
+    avg_crit = np.cumsum(crit, axis=0)[-1] / n_weeks
+    avg_rank = ranks.sum(axis=0) / n_weeks
+    top3 = (ranks <= 3).sum(axis=0)
+
+    return {
+        rid: {
+            "avg_criticidad": float(avg_crit[i]),
+            "avg_rank_pos": float(avg_rank[i]),
+            "top3_weeks": int(top3[i]),
+            "weeks_considered": int(n_weeks),
+        }
+        for i, rid in enumerate(risks)
+    }
@@ -0,0 +1,98 @@
+# src/state/fast_state.py
+
+import dataclasses
+import typing
+from typing import Any, Dict, Union
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from src.state.state import K9State
+
+
+# =====================================================
+# Estado rápido del grafo (sin validación por nodo)
+# =====================================================
+#
+# Con K9State como esquema, LangGraph reconstruye y valida el modelo
+# pydantic en la entrada de CADA nodo. K9FastState es un dataclass con
+# slots generado desde K9State (mismos campos, defaults y reducers):
+# los nodos lo usan igual (acceso por atributo) y la validación queda
+# solo en los bordes del grafo (K9State de entrada / salida).
+
+
+def _field(name: str, info: Any) -> tuple:
+    if info.default_factory is not None:
+        spec = dataclasses.field(default_factory=info.default_factory)
+    elif info.default is not PydanticUndefined:
+        spec = dataclasses.field(default=info.default)
+    else:
+        spec = dataclasses.field()
+    # Anotación original: conserva Annotated[..., reducer]
+    return name, K9State.__annotations__[name], spec
+
+
+def _is_container(annotation: Any) -> bool:
+    """List[...] / Dict[...] (también dentro de Optional)."""
+    if typing.get_origin(annotation) in (list, dict):
+        return True
+    return any(typing.get_origin(arg) in (list, dict) for arg in typing.get_args(annotation))
+
+
+def copy_containers(state: Any) -> Any:
+    """
+    Misma aislación que la validación pydantic en la entrada de cada nodo:
+    contenedores de primer nivel propios (copia superficial).
+    """
+    for name in _CONTAINERS:
+        value = getattr(state, name)
+        if value is not None:
+            setattr(state, name, value.copy())
+    return state
+
+
+def _post_init(self) -> None:
+    copy_containers(self)
+
+
+K9FastState = dataclasses.make_dataclass(
+    "K9FastState",
+    [_field(name, info) for name, info in K9State.model_fields.items()],
+    namespace={"__post_init__": _post_init, "__module__": __name__},
+    slots=True,
+)
+K9FastState.__doc__ = "K9State sin validación por nodo (uso interno del grafo)."
+
+_FIELDS = tuple(K9State.model_fields)
+_CONTAINERS = tuple(
+    name for name, info in K9State.model_fields.items() if _is_container(info.annotation)
+)
+
+
+# =====================================================
+# Bordes del grafo
+# =====================================================
+
+def to_fast_state(state: Union[K9State, Dict[str, Any]]) -> Any:
+    """Entrada: valida una vez (K9State) y pasa a estado rápido (copia propia)."""
+    if isinstance(state, K9FastState):
+        return dataclasses.replace(state)
+    if not isinstance(state, K9State):
+        state = K9State.model_validate(state)
+    return K9FastState(**{name: getattr(state, name) for name in _FIELDS})
+
+
+def copy_state(state: Any, **update: Any) -> Any:
+    """Copia superficial del estado (K9State o K9FastState) con `update`."""
+    if isinstance(state, BaseModel):
+        return state.model_copy(update=update)
+    return dataclasses.replace(state, **update)
+
+
+def to_k9_state(state: Any) -> K9State:
+    """Salida: valida el estado final (dict de canales o K9FastState)."""
+    if isinstance(state, K9State):
+        return state
+    if not isinstance(state, dict):
+        state = {name: getattr(state, name) for name in _FIELDS}
+    return K9State(**state)
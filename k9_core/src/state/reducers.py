@@ -0,0 +1,33 @@
+# src/state/reducers.py
+
+from typing import Any, Dict, List, Optional
+
+
+# =====================================================
+# Reducers de canales K9State (LangGraph)
+# =====================================================
+#
+# Los nodos secuenciales retornan el estado completo → el valor se
+# reemplaza (semántica LastValue de siempre).
+# Las ramas paralelas retornan SOLO su delta, marcado con estos tipos,
+# y varias ramas pueden escribir el mismo canal en un superstep.
+
+
+class ReasoningAppend(list):
+    """Entradas de reasoning añadidas por una rama (se concatenan)."""
+
+
+class AnalysisMerge(dict):
+    """Claves de analysis escritas por una rama (se fusionan)."""
+
+
+def reduce_reasoning(left: Optional[List[str]], right: Any) -> List[str]:
+    if isinstance(right, ReasoningAppend):
+        return [*(left or []), *right]
+    return right
+
+
+def reduce_analysis(left: Optional[Dict[str, Any]], right: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(right, AnalysisMerge):
+        return {**(left or {}), **right}
+    return right
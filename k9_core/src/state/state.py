@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional, Dict, Any, List
 
 # Infraestructura LLM (NO cognición)
 from src.llm.session_context import LLMSessionContext
@@ -8,8 +8,16 @@ from src.llm.session_context import LLMSessionContext
 from src.time.time_context import TimeContext
 from src.time.data_slice import DataSlice
 
+# Datos compartidos por los nodos de una ejecución (infraestructura)
+from src.data.request_context import RequestDataContext
+
+# Reducers de canal (ramas paralelas del grafo)
+from src.state.reducers import reduce_analysis, reduce_reasoning
+
 
 class K9State(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # ==================================================
     # INPUTS (infraestructura, no cognición)
     # ==================================================
@@ -23,7 +31,7 @@ class K9State(BaseModel):
     # ==================================================
     # TRAZABILIDAD DE EJECUCIÓN
     # ==================================================
-    reasoning: List[str] = Field(default_factory=list)
+    reasoning: Annotated[List[str], reduce_reasoning] = Field(default_factory=list)
 
     # ==================================================
     # FLAGS DE EJECUCIÓN
@@ -45,6 +53,11 @@ class K9State(BaseModel):
     # Corte físico de datos derivado del TimeContext
     data_slice: Optional[DataSlice] = None
 
+    # Frames cargados una vez por request (NO se serializa)
+    data_context: Optional[RequestDataContext] = Field(
+        default=None, exclude=True, repr=False
+    )
+
     # ==================================================
     # DECISIÓN OPERACIONAL (CORE)
     # ==================================================
@@ -61,7 +74,7 @@ class K9State(BaseModel):
     # ==================================================
     # ANÁLISIS COGNITIVO
     # ==================================================
-    analysis: Optional[Dict[str, Any]] = None
+    analysis: Annotated[Optional[Dict[str, Any]], reduce_analysis] = None
 
     # Enriquecimiento operacional (OCC, controles, etc.)
     risk_enrichment: Optional[Dict[str, Any]] = None
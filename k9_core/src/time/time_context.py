@@ -10,7 +10,7 @@ class TimeContext(BaseModel):
 
     Rol:
     - Representar explícitamente la intención temporal del usuario
-    - Ser creado SOLO por el Router
+    - Ser creado SOLO por la traducción canónica del Router (build_time_context)
     - NO resolver fechas
     - NO cortar datasets
     - NO conocer el calendario ni la STDE
@@ -37,8 +37,13 @@ def test_data_engine_f02_011_exposes_audits_analysis():
     assert isinstance(daily["by_tipo"], dict)
     assert isinstance(daily["by_origen"], dict)
 
+    # Agregados + handle; los registros no viajan en el análisis
     acc = audits["accumulated_12s"]
-    assert isinstance(acc["records"], dict)
+    assert "records" not in acc
+    assert isinstance(acc["count"], int)
+    assert isinstance(acc["by_tipo"], dict)
+    assert acc["handle"]["dataset"] == "stde_auditorias_12s.csv"
+    assert acc["handle"]["rows"] == acc["count"]
 
     meta = audits["meta"]
     assert "semantic_level" in meta
@@ -0,0 +1,71 @@
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+
+
+def test_f02_006_dataset_cache_parses_once_and_reloads_on_content_change(tmp_path):
+    """
+    F02_006
+
+    Reglas:
+    - Un dataset se parsea una sola vez por proceso (instancias distintas comparten cache)
+    - Un cambio de mtime SIN cambio de contenido no provoca recarga
+    - Un cambio de contenido sí provoca recarga
+    - La huella se toma antes de cargar: un cambio durante la carga recarga
+    """
+
+    csv_path = tmp_path / "stde_observaciones_12s.csv"
+    pd.DataFrame({"semana": [1, 2], "tipo_observacion": ["OPG", "OCC"]}).to_csv(
+        csv_path, index=False
+    )
+
+    cache = DatasetCache()
+
+    df_a = DataManager(tmp_path, cache=cache).get_observaciones()
+    df_b = DataManager(tmp_path, cache=cache).get_observaciones()
+
+    assert df_a.equals(df_b)
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["reloads"] == 0
+
+    # touch: mismo contenido, mtime distinto
+    st = csv_path.stat()
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    DataManager(tmp_path, cache=cache).get_observaciones()
+    assert cache.stats()["reloads"] == 0
+
+    # cambio real de contenido
+    pd.DataFrame({"semana": [1, 2, 3], "tipo_observacion": ["OPG", "OCC", "OCC"]}).to_csv(
+        csv_path, index=False
+    )
+    df_c = DataManager(tmp_path, cache=cache).get_observaciones()
+
+    assert len(df_c) == 3
+    assert cache.stats()["reloads"] == 1
+    assert cache.stats()["load_seconds"] >= 0.0
+
+    # Archivo reescrito mientras `loader()` parsea: la entrada no debe quedar
+    # asociada al contenido nuevo
+    def loader_racing_writer():
+        frame = pd.read_csv(csv_path)
+        pd.DataFrame({"semana": [1, 2, 3, 4], "tipo_observacion": ["OPG"] * 4}).to_csv(
+            csv_path, index=False
+        )
+        return frame
+
+    raced = cache.get("raced", [csv_path], loader_racing_writer)
+    assert len(raced) == 3
+    reloaded = cache.get("raced", [csv_path], lambda: pd.read_csv(csv_path))
+    assert len(reloaded) == 4
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.arrow_snapshot import ArrowSnapshot, build_snapshot
+from src.data import data_manager
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.dtype_registry import DtypeRegistry, get_dtype_registry
+
+
+def test_f02_007_snapshot_mode_matches_source_datasets(tmp_path):
+    """
+    F02_007
+
+    Reglas:
+    - El snapshot Arrow IPC es versionado y tiene manifest
+    - DataManager en modo snapshot entrega los mismos DataFrames que la fuente
+    - Reconstruir sin cambios en la fuente conserva la versión
+    - Los frames se guardan normalizados: la lectura no repite la etapa de carga
+    - Snapshot y lector con distinta config de IDs categóricos siguen calzando
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    snapshot_dir = build_snapshot(source, tmp_path)
+    snapshot = ArrowSnapshot(tmp_path)
+
+    assert snapshot.root == snapshot_dir.resolve()
+    assert "stde_observaciones_12s.csv" in snapshot.manifest["datasets"]
+    assert "k9_weekly_signals.parquet" in snapshot.manifest["datasets"]
+
+    dm_src = DataManager(source, cache=DatasetCache(), snapshot_path="")
+    dm_snap = DataManager(source, cache=DatasetCache(), snapshot_path=tmp_path)
+
+    assert dm_src.snapshot is None
+    assert dm_snap.snapshot is not None
+
+    pd.testing.assert_frame_equal(
+        dm_snap.get_observaciones_all(), dm_src.get_observaciones_all()
+    )
+    pd.testing.assert_frame_equal(
+        dm_snap.get_weekly_signals(), dm_src.get_weekly_signals()
+    )
+
+    assert build_snapshot(source, tmp_path) == snapshot_dir
+
+    # Etapa de carga ya aplicada: leer no parsea fechas ni convierte IDs
+    assert snapshot.normalized == {"time_keys": True, "categorical_ids": True}
+
+    registry = get_dtype_registry()
+    apply = DtypeRegistry.apply
+
+    def already_categorical(self, df):
+        for column in df.columns:
+            dtype = self.dtype_for(column)
+            assert dtype is None or df[column].dtype == dtype, column
+        return apply(self, df)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("claves temporales recalculadas al leer el snapshot")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(data_manager, "normalize_time_keys", fail)
+        mp.setattr(DtypeRegistry, "apply", already_categorical)
+        dm_fresh = DataManager(source, cache=DatasetCache(), snapshot_path=tmp_path, dtypes=registry)
+        pd.testing.assert_frame_equal(
+            dm_fresh.get_observaciones_all(), dm_src.get_observaciones_all()
+        )
+
+    # Config de IDs categóricos distinta entre construcción y lectura
+    plain_root = tmp_path / "plain"
+    plain_dir = build_snapshot(source, plain_root, categorical_ids=False)
+    assert plain_dir.name != snapshot_dir.name
+    pd.testing.assert_frame_equal(
+        DataManager(source, cache=DatasetCache(), snapshot_path=plain_root).get_observaciones_all(),
+        dm_src.get_observaciones_all(),
+    )
+
+    dm_src_plain = DataManager(source, cache=DatasetCache(), snapshot_path="")
+    dm_src_plain.dtypes = None
+    dm_snap_plain = DataManager(source, cache=DatasetCache(), snapshot_path=tmp_path)
+    dm_snap_plain.dtypes = None
+    pd.testing.assert_frame_equal(
+        dm_snap_plain.get_observaciones_all(), dm_src_plain.get_observaciones_all()
+    )
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.partitioned_store import build_partitioned_store
+from src.time.data_slice import DataSlice
+
+
+def test_f02_008_range_getters_read_only_overlapping_partitions(tmp_path):
+    """
+    F02_008
+
+    Reglas:
+    - El store particionado produce los mismos datos que el CSV por rango semanal
+    - Un rango / DataSlice solo abre las particiones que lo intersectan
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    build_partitioned_store(source, tmp_path)
+
+    dm_src = DataManager(source, cache=DatasetCache(), partitioned_path="")
+    cache = DatasetCache()
+    dm_part = DataManager(source, cache=cache, partitioned_path=tmp_path)
+
+    assert dm_part.get_observaciones_weeks() == dm_src.get_observaciones_weeks()
+
+    df_part = dm_part.get_observaciones_by_week_range(3, 5)
+    df_src = dm_src.get_observaciones_by_week_range(3, 5)
+
+    assert set(df_part["semana"].unique()) == {3, 4}
+    key = ["id_observacion", "semana"]
+    pd.testing.assert_frame_equal(
+        df_part.sort_values(key).reset_index(drop=True),
+        df_src.sort_values(key).reset_index(drop=True),
+    )
+
+    # 2 fuentes × 2 semanas = 4 particiones abiertas
+    assert cache.stats()["misses"] == 4
+
+    df_evt = dm_part.get_eventos_by_week_range(12, 13)
+    assert not df_evt.empty
+    assert set(df_evt["semana"].unique()) == {12}
+
+    # DataSlice INDEX: última semana
+    total = len(dm_part.get_observaciones_weeks())
+    df_last = dm_part.get_observaciones_for_slice(
+        DataSlice(resolution="INDEX", start=total - 1, end=total)
+    )
+    assert set(df_last["semana"].unique()) == {dm_part.get_observaciones_weeks()[-1]}
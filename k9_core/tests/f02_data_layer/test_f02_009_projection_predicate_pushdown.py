@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.partitioned_store import build_partitioned_store
+from src.data.scan_filter import ScanFilter
+
+
+def test_f02_009_pushdown_matches_in_memory_filtering(tmp_path):
+    """
+    F02_009
+
+    Reglas:
+    - `columns=` proyecta solo las columnas pedidas
+    - `where=ScanFilter(...)` filtra por semana / riesgo / tipo / área
+    - Pushdown (store particionado) y filtrado en memoria (CSV) coinciden
+    - Un dataset sin la columna filtrada no aporta filas
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    build_partitioned_store(source, tmp_path)
+
+    dm_src = DataManager(source, cache=DatasetCache(), partitioned_path="")
+    dm_part = DataManager(source, cache=DatasetCache(), partitioned_path=tmp_path)
+
+    columns = ["semana", "id_area", "riesgo_id", "control_critico_id"]
+    where = ScanFilter(week_range=(2, 9), riesgo_id=["R01", "R02"], tipo_observacion="OCC")
+
+    df_part = dm_part.get_observaciones_all(columns=columns, where=where)
+    df_src = dm_src.get_observaciones_all(columns=columns, where=where)
+
+    assert list(df_part.columns) == columns
+    assert not df_part.empty
+    assert df_part["semana"].between(2, 8).all()
+    assert set(df_part["riesgo_id"].unique()) <= {"R01", "R02"}
+
+    key = ["semana", "id_area", "riesgo_id", "control_critico_id"]
+    pd.testing.assert_frame_equal(
+        df_part.sort_values(key).reset_index(drop=True),
+        df_src.sort_values(key).reset_index(drop=True),
+    )
+
+    # stde_observaciones_12s no tiene riesgo_id → no aporta filas
+    assert dm_part.get_observaciones(where=ScanFilter(riesgo_id="R01")).empty
+
+    df_evt = dm_part.get_eventos(
+        columns=["semana", "criticidad"], where=ScanFilter(id_area="CHP")
+    )
+    assert list(df_evt.columns) == ["semana", "criticidad"]
+    assert len(df_evt) == int((dm_src.get_eventos()["id_area"] == "CHP").sum())
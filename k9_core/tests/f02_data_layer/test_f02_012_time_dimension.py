@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.partitioned_store import build_partitioned_store
+from src.data.time_dimension import DAY_KEY, WEEK_KEY, join_daily_weekly
+
+
+def test_f02_012_canonical_time_keys_at_load(tmp_path):
+    """
+    F02_012
+
+    Reglas:
+    - Fechas ISO (`2024-11-11`) y m/d/Y (`11/11/2024`) producen el mismo `dia_ord`
+    - `dia_ord` / `semana_ord` son int32 y se agregan una vez al cargar
+    - La dimensión temporal (dates.csv) resuelve semana desde día
+    - El join diario ↔ semanal por `semana_ord` equivale a un merge
+    - El store particionado entrega las mismas claves al proyectarlas
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    dm = DataManager(source, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+
+    iso = dm.get_fdo_diario()        # 2024-11-11
+    mdy = dm.get_fdo_diario_12s()    # 11/11/2024
+
+    for df in (iso, mdy):
+        assert df[DAY_KEY].dtype == np.int32
+        assert df[WEEK_KEY].dtype == np.int32
+        assert (df[WEEK_KEY] == df["semana"]).all()
+
+    first_iso = iso.sort_values(DAY_KEY)[DAY_KEY].iloc[0]
+    first_mdy = mdy.sort_values(DAY_KEY)[DAY_KEY].iloc[0]
+    assert first_iso == first_mdy == (pd.Timestamp("2024-11-11") - pd.Timestamp("1970-01-01")).days
+
+    dim = dm.get_time_dimension()
+    assert dim is not None
+    assert (dim.week_of_day(iso[DAY_KEY].to_numpy()) == iso["semana"].to_numpy()).all()
+
+    weekly = dm.get_trayectorias_semanales()
+    joined = join_daily_weekly(iso, weekly)
+    expected = iso.merge(
+        weekly.drop(columns=["semana"]), on=WEEK_KEY, how="left", suffixes=("", "_semana")
+    )
+    assert len(joined) == len(iso)
+    pd.testing.assert_frame_equal(
+        joined[expected.columns].reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    build_partitioned_store(source, tmp_path)
+    dm_part = DataManager(source, cache=DatasetCache(), snapshot_path="", partitioned_path=tmp_path)
+    obs_part = dm_part.get_observaciones(columns=["id_observacion", DAY_KEY, WEEK_KEY])
+    obs_src = dm.get_observaciones(columns=["id_observacion", DAY_KEY, WEEK_KEY])
+
+    assert list(obs_part.columns) == ["id_observacion", DAY_KEY, WEEK_KEY]
+    pd.testing.assert_frame_equal(
+        obs_part.sort_values("id_observacion").reset_index(drop=True),
+        obs_src.sort_values("id_observacion").reset_index(drop=True),
+    )
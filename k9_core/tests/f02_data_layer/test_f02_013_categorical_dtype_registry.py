@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.dtype_registry import DtypeRegistry
+
+
+def test_f02_013_id_columns_share_global_categorical_dictionaries():
+    """
+    F02_013
+
+    Reglas:
+    - Las columnas ID se cargan como categóricos con diccionario ontológico
+    - Columnas del mismo dominio comparten dtype y códigos entre datasets
+    - Los valores no cambian respecto del CSV
+    - Columnas con valores fuera del catálogo quedan como string
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    registry = DtypeRegistry(REPO_ROOT / "data" / "ontology")
+    dm = DataManager(
+        source, cache=DatasetCache(), snapshot_path="", partitioned_path="", dtypes=registry
+    )
+
+    obs = dm.get_observaciones_all()
+    evt = dm.get_eventos()
+    aud = dm.get_auditorias()
+
+    # Mismo dominio → mismo dtype (tarea, rol, área)
+    assert isinstance(obs["tarea_id"].dtype, pd.CategoricalDtype)
+    assert obs["tarea_id"].dtype == evt["tarea_id"].dtype
+    assert obs["rol_observador_id"].dtype == evt["rol_id"].dtype == aud["rol_auditor_id"].dtype
+    assert obs["id_area"].dtype == evt["id_area"].dtype == aud["id_area"].dtype
+
+    # Join por códigos enteros == join por strings
+    codes_obs = dict(zip(obs["tarea_id"].astype(str), obs["tarea_id"].cat.codes))
+    codes_evt = dict(zip(evt["tarea_id"].astype(str), evt["tarea_id"].cat.codes))
+    shared = set(codes_obs) & set(codes_evt) - {"nan"}
+    assert shared
+    assert all(codes_obs[t] == codes_evt[t] for t in shared)
+
+    # Valores intactos
+    raw = pd.read_csv(source / "stde_eventos.csv")
+    pd.testing.assert_series_equal(
+        evt["rol_id"].astype(object).where(evt["rol_id"].notna(), None),
+        raw["rol_id"].astype(object).where(raw["rol_id"].notna(), None),
+    )
+
+    # R04..R10 no están en el catálogo de riesgos → string
+    proactivo = dm.get_proactivo_semanal()
+    assert not isinstance(proactivo["riesgo_id"].dtype, pd.CategoricalDtype)
+    assert set(proactivo["riesgo_id"]) == set(
+        pd.read_csv(source / "stde_proactivo_semanal_v4_4.csv")["riesgo_id"]
+    )
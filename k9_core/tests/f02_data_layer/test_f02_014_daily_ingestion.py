@@ -0,0 +1,101 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.ingestion import DailyIngestor, build_observation_counts
+from src.data.partitioned_store import PartitionedStore, build_partitioned_store
+
+
+def test_f02_014_daily_ingestion_updates_weekly_aggregates_incrementally(tmp_path):
+    """
+    F02_014
+
+    Reglas:
+    - La ingesta agrega filas diarias y deriva semana / id_dia del calendario
+    - Días nuevos extienden dates.csv
+    - Agregados semanales actualizados == recálculo completo
+    - Solo se reescriben las particiones de las semanas tocadas
+    - Re-ingestar las mismas filas no duplica
+    - dataset_version cambia con la ingesta
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    build_partitioned_store(base, tmp_path / "partitioned")
+
+    cache = DatasetCache()
+    dm = DataManager(base, cache=cache, snapshot_path="", partitioned_path="")
+    version_before = dm.dataset_version()
+
+    ingestor = DailyIngestor(
+        base, partitioned_path=tmp_path / "partitioned", cache=cache, snapshot_path=""
+    )
+    batch = {
+        "trayectorias": [
+            # 2025-02-03 ya existe en el calendario (semana 13); 02-04 es nuevo
+            {"fecha": "2025-02-03", "criticidad_R01": 0.5, "criticidad_R02": 0.6,
+             "criticidad_R03": 0.2, "criticidad_global": 0.4},
+            {"fecha": "2025-02-04", "criticidad_R01": 0.7, "criticidad_R02": 0.4,
+             "criticidad_R03": 0.3, "criticidad_global": 0.45},
+            # Día existente → se omite
+            {"fecha": "2024-11-11", "criticidad_R01": 0.9, "criticidad_R02": 0.9,
+             "criticidad_R03": 0.9, "criticidad_global": 0.9},
+        ],
+        "observaciones": [
+            {"id_observacion": "OBS_900001", "fecha": "2/3/2025", "id_area": "CHP",
+             "tipo_observacion": "OCC", "riesgo_id": "R02", "is_control_critico": True,
+             "control_critico_id": "R02CC01"},
+            {"id_observacion": "OBS_900002", "fecha": "2025-02-04", "id_area": "MRA",
+             "tipo_observacion": "OPG", "is_control_critico": False},
+        ],
+    }
+    result = ingestor.ingest(batch).to_dict()
+
+    assert result["rows_appended"] == {"trayectorias": 2, "observaciones": 2}
+    assert result["rows_skipped"]["trayectorias"] == 1
+    assert result["new_days"] == ["2025-02-04"]
+    assert result["dataset_version"] != version_before
+    assert result["dataset_version"] == dm.dataset_version()
+
+    dates = pd.read_csv(base / "dates.csv")
+    assert dates.iloc[-1].tolist() == ["2/4/2025", 13]
+
+    daily = dm.get_trayectorias_diarias()
+    assert daily.tail(2)["semana"].tolist() == [13, 13]
+    assert daily.tail(2)["id_dia"].tolist() == [85, 86]
+
+    # Media incremental == recálculo completo (semana 13 nueva)
+    weekly = dm.get_trayectorias_semanales().set_index("semana")
+    expected = daily.groupby("semana")["criticidad_R01"].mean()
+    assert abs(weekly.loc[13, "criticidad_R01_media"] - expected.loc[13]) < 1e-12
+    assert result["aggregates"]["stde_trayectorias_semanales.csv"] == [13]
+
+    # Sin salida proactiva para la semana 13 → señales sin cambios
+    assert result["aggregates"]["k9_weekly_signals.parquet"] == []
+
+    # Conteos por semana/tipo == recálculo completo
+    counts = dm.get_observaciones_semana(columns=["semana", "tipo_observacion", "n_observaciones"])
+    pd.testing.assert_frame_equal(
+        counts.astype({"tipo_observacion": str}),
+        build_observation_counts(dm),
+        check_dtype=False,
+    )
+
+    # Particiones: solo la semana 13 recibió las observaciones
+    store = PartitionedStore(tmp_path / "partitioned")
+    week13 = pd.read_parquet(store.partitions("stde_observaciones.csv")[13])
+    assert {"OBS_900001", "OBS_900002"} <= set(week13["id_observacion"])
+
+    # Idempotencia
+    again = ingestor.ingest(batch).to_dict()
+    assert again["rows_appended"] == {}
+    assert again["rows_skipped"] == {"trayectorias": 3, "observaciones": 2}
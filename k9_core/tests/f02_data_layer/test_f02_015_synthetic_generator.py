@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.scan_filter import ScanFilter
+from src.data.synthetic_generator import STDEGenerator
+
+
+def test_f02_015_generator_is_seedable_scalable_and_loadable(tmp_path):
+    """
+    F02_015
+
+    Reglas:
+    - Misma semilla → mismos datasets; otra semilla → otros
+    - El volumen transaccional escala con el número de sitios
+    - K riesgos → K trayectorias y K filas semanales de señales
+    - La salida se carga con el DataManager (CSV y store particionado)
+    """
+
+    gen = STDEGenerator()
+
+    a = gen.generate(n_sites=2, n_weeks=3, risks=4, seed=7)
+    b = gen.generate(n_sites=2, n_weeks=3, risks=4, seed=7)
+    c = gen.generate(n_sites=2, n_weeks=3, risks=4, seed=8)
+
+    for name, df in a.frames.items():
+        pd.testing.assert_frame_equal(df, b.frames[name])
+    assert not a.frames["stde_observaciones.csv"].equals(c.frames["stde_observaciones.csv"])
+
+    # Escala: 4 sitios ≈ 2× el volumen de 2 sitios
+    big = gen.generate(n_sites=4, n_weeks=3, risks=4, seed=7)
+    ratio = len(big.frames["stde_observaciones.csv"]) / len(a.frames["stde_observaciones.csv"])
+    assert 1.8 < ratio < 2.2
+    assert set(big.frames["stde_eventos.csv"]["id_sitio"]) == {"S001", "S002", "S003", "S004"}
+
+    # Grano diario de la operación: 3 semanas × 7 días, K riesgos
+    assert a.risks == ["R01", "R02", "R03", "R04"]
+    tray = a.frames["stde_trayectorias_diarias.csv"]
+    assert len(tray) == 21
+    assert {f"criticidad_{r}" for r in a.risks} <= set(tray.columns)
+    assert len(a.frames["k9_weekly_signals.parquet"]) == 3 * 4
+
+    obs = a.frames["stde_observaciones.csv"]
+    assert obs["id_observacion"].is_unique
+    assert set(obs["tipo_observacion"]) == {"OPG", "OCC"}
+    assert obs.loc[obs["tipo_observacion"] == "OCC", "riesgo_id"].notna().all()
+
+    # Escritura + carga con el DataManager
+    summary = a.write(tmp_path / "synthetic", tmp_path / "partitioned")
+    assert summary["partitions"]["stde_observaciones.csv"] == 3
+
+    dm = DataManager(
+        tmp_path / "synthetic",
+        cache=DatasetCache(),
+        snapshot_path="",
+        partitioned_path=tmp_path / "partitioned",
+    )
+    assert len(dm.get_observaciones()) > 0  # *_12s copiado del template
+    assert len(dm.get_observaciones_all()) == len(obs) + len(dm.get_observaciones())
+    assert dm.get_time_dimension().weeks.tolist() == [1, 2, 3]
+
+    week2 = dm.get_eventos(columns=["semana", "id_sitio"], where=ScanFilter(week_range=(2, 3)))
+    expected = a.frames["stde_eventos.csv"]
+    assert len(week2) == int((expected["semana"] == 2).sum())
+    assert set(week2["semana"]) == {2}
@@ -0,0 +1,78 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.arrow_snapshot import ArrowSnapshot, build_snapshot
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.partitioned_store import build_partitioned_store
+
+
+WEEKLY = "stde_trayectorias_semanales.csv"
+
+
+def _no_row_reads(path):
+    raise AssertionError(f"lectura de filas inesperada: {path}")
+
+
+def test_f02_016_time_metadata_without_row_data(tmp_path, monkeypatch):
+    """
+    F02_016
+
+    Reglas:
+    - Metadatos temporales == cálculo sobre el dataset completo
+    - CSV: se calculan una vez por versión del archivo
+    - Snapshot: se sirven desde el manifest (sin abrir el archivo Arrow)
+    - Store particionado: semanas desde el listado de particiones
+    - Dataset sin columnas temporales → None
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+
+    raw = pd.read_csv(base / WEEKLY)
+    cache = DatasetCache()
+    dm = DataManager(base, cache=cache, snapshot_path="", partitioned_path="")
+
+    meta = dm.get_time_metadata(WEEKLY)
+    assert meta.min_date == str(raw["semana"].min())
+    assert meta.max_date == str(raw["semana"].max())
+    assert meta.granularity == "week"
+    assert meta.total_periods == raw["semana"].nunique()
+
+    # Una sola carga por versión
+    assert dm.get_time_metadata(WEEKLY) == meta
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+    # Catálogo sin columnas temporales
+    assert dm.get_time_metadata("stde_fdo_catalogo.csv") is None
+
+    # Nueva versión del archivo → recálculo
+    raw[raw["semana"] <= 6].to_csv(base / WEEKLY, index=False)
+    assert dm.get_time_metadata(WEEKLY).total_periods == 6
+
+    # Snapshot: el manifest basta
+    snap = build_snapshot(base, tmp_path / "snapshots")
+    monkeypatch.setattr(ArrowSnapshot, "read_table", staticmethod(_no_row_reads))
+    dm_snap = DataManager(base, cache=DatasetCache(), snapshot_path=snap, partitioned_path="")
+    assert dm_snap.get_time_metadata(WEEKLY).max_date == "6"
+    monkeypatch.undo()
+
+    # Store particionado: listado de directorios
+    build_partitioned_store(base, tmp_path / "partitioned")
+    obs = pd.read_csv(base / "stde_observaciones.csv")
+    dm_part = DataManager(
+        base, cache=DatasetCache(), snapshot_path="", partitioned_path=tmp_path / "partitioned"
+    )
+    part = dm_part.get_time_metadata("stde_observaciones.csv")
+    assert part.total_periods == obs["semana"].nunique()
+    assert part.max_date == str(obs["semana"].max())
+    assert dm_part.cache_stats()["misses"] == 0
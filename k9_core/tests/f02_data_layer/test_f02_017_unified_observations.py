@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import (
+    OBSERVACIONES_SOURCE_COLUMN,
+    DataManager,
+    DatasetCache,
+)
+from src.data.partitioned_store import build_partitioned_store
+from src.data.scan_filter import ScanFilter
+
+
+def test_f02_017_observations_unified_once_with_source_column(tmp_path):
+    """
+    F02_017
+
+    Reglas:
+    - Baseline + 12s se materializan UNA vez en una tabla unificada
+    - Esquema unión explícito + columna `fuente`
+    - Categóricos se conservan en columnas ausentes de una fuente
+    - Lecturas por semana (con y sin store particionado) == tabla unificada
+    """
+
+    source = REPO_ROOT / "data" / "synthetic"
+    base = pd.read_csv(source / "stde_observaciones.csv")
+    s12 = pd.read_csv(source / "stde_observaciones_12s.csv")
+
+    cache = DatasetCache()
+    dm = DataManager(source, cache=cache, snapshot_path="", partitioned_path="")
+
+    unified = dm.get_observaciones_unificadas()
+    assert len(unified) == len(base) + len(s12)
+    assert unified[OBSERVACIONES_SOURCE_COLUMN].value_counts().to_dict() == {
+        "baseline": len(base),
+        "stde_12s": len(s12),
+    }
+
+    # Esquema: baseline, luego exclusivas de 12s, luego fuente
+    expected = list(base.columns) + [c for c in s12.columns if c not in base.columns]
+    assert [c for c in unified.columns if c in expected] == expected
+    assert unified.columns[-1] == OBSERVACIONES_SOURCE_COLUMN
+    assert isinstance(unified["riesgo_id"].dtype, pd.CategoricalDtype)
+    assert isinstance(unified["id_rol"].dtype, pd.CategoricalDtype)
+
+    # Consumidores (data engine / OCC) comparten la misma tabla
+    misses = cache.stats()["misses"]
+    dm.get_observaciones_all(columns=["semana", "tipo_observacion"])
+    occ = dm.get_observaciones_all(
+        columns=["semana", "riesgo_id"], where=ScanFilter(tipo_observacion="OCC")
+    )
+    assert cache.stats()["misses"] == misses
+    assert len(occ) == int((base["tipo_observacion"] == "OCC").sum() + (s12["tipo_observacion"] == "OCC").sum())
+
+    # Semanas: tabla unificada vs store particionado
+    build_partitioned_store(source, tmp_path / "partitioned")
+    dm_part = DataManager(
+        source, cache=DatasetCache(), snapshot_path="", partitioned_path=tmp_path / "partitioned"
+    )
+    cols = ["id_observacion", "semana", "tipo_observacion", OBSERVACIONES_SOURCE_COLUMN]
+    in_memory = dm.get_observaciones_for_weeks([3, 4], columns=cols)
+    pruned = dm_part.get_observaciones_for_weeks([3, 4], columns=cols)
+    key = ["id_observacion", OBSERVACIONES_SOURCE_COLUMN]
+    pd.testing.assert_frame_equal(
+        in_memory.astype(str).sort_values(key).reset_index(drop=True),
+        pruned.astype(str).sort_values(key).reset_index(drop=True),
+    )
+    assert set(in_memory["semana"]) == {3, 4}
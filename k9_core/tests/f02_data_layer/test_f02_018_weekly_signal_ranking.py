@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.scenarios.signals import weekly_signals_from_trajectories
+
+
+def test_f02_018_vectorized_weekly_ranking():
+    """
+    F02_018
+
+    Reglas:
+    - Rank por semana: 1 = mayor criticidad
+    - Empates conservan el orden de columnas (orden estable)
+    - Promedios, rank medio y semanas top-3 en una pasada
+    - El orden de filas de entrada no afecta (se ordena por semana)
+    """
+
+    df = pd.DataFrame({
+        "semana": [2, 1, 3],
+        "criticidad_R01_media": [0.5, 0.2, 0.9],
+        "criticidad_R02_media": [0.5, 0.8, 0.1],
+        "criticidad_R03_media": [0.1, 0.3, 0.2],
+        "criticidad_R04_media": [0.4, 0.1, 0.3],
+        "criticidad_global_media": [0.4, 0.4, 0.4],
+    })
+
+    signals = weekly_signals_from_trajectories(df)
+
+    # semana 1: R02 > R03 > R01 > R04
+    # semana 2: R01 = R02 (empate → R01 primero) > R04 > R03
+    # semana 3: R01 > R04 > R03 > R02
+    assert signals["R01"]["avg_rank_pos"] == (3 + 1 + 1) / 3
+    assert signals["R02"]["avg_rank_pos"] == (1 + 2 + 4) / 3
+    assert signals["R03"]["top3_weeks"] == 2
+    assert signals["R04"]["top3_weeks"] == 2
+    assert signals["R01"]["avg_criticidad"] == (0.2 + 0.5 + 0.9) / 3
+    assert set(signals) == {"R01", "R02", "R03", "R04"}
+    assert all(s["weeks_considered"] == 3 for s in signals.values())
+
+    assert weekly_signals_from_trajectories(df.iloc[0:0]) == {}
@@ -0,0 +1,86 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.atomic_io import atomic_write
+from src.data.data_manager import DataManager, DatasetCache
+from src.scenarios import (
+    ScenarioCache,
+    ScenarioEngine,
+    apply_critical_monday_overlay,
+    scenario_for_event,
+    weekly_signals_from_trajectories,
+)
+
+
+WEEKLY = "stde_trayectorias_semanales.csv"
+
+
+def test_f02_019_scenario_materialized_once_per_version(tmp_path):
+    """
+    F02_019
+
+    Reglas:
+    - CRITICAL_MONDAY se declara como overlay sobre las trayectorias semanales
+    - El overlay no modifica el dataset base (copy-on-write)
+    - Trayectorias + weekly_signals se materializan UNA vez por (versión, escenario)
+    - Nueva versión de los datos → nueva materialización
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+
+    dm = DataManager(base, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+    raw = dm.get_trayectorias_semanales()
+    evt = pd.read_csv(base / "stde_riesgos_evento_lunes_critico.csv")
+
+    scenario = scenario_for_event({"type": "CRITICAL_MONDAY"})
+    assert scenario is not None and scenario.scenario_id == "critical_monday"
+    assert scenario_for_event(None) is None
+
+    cache = ScenarioCache()
+    engine = ScenarioEngine(dm, cache=cache)
+    view = engine.materialize("critical_monday")
+
+    tray = view.frame(WEEKLY)
+    week = int(evt["semana"].iloc[0])
+    assert week not in set(raw["semana"])
+    assert len(tray) == len(raw) + 1
+    injected = tray[tray["semana"] == week].iloc[0]
+    assert injected["criticidad_R01_media"] == evt["criticidad_real_lunes_critico"].iloc[0] / 100.0
+    assert view.signals() == weekly_signals_from_trajectories(tray)
+
+    # Base intacta
+    pd.testing.assert_frame_equal(dm.get_trayectorias_semanales(), raw)
+
+    # Consumidores no alteran la vista compartida
+    view.signals()["R01"]["avg_criticidad"] = -1.0
+    shared = view.frame(WEEKLY)
+    shared.loc[0, "criticidad_R01_media"] = -1.0
+    assert ScenarioEngine(dm, cache=cache).materialize("critical_monday") is view
+    assert view.signals() == weekly_signals_from_trajectories(tray)
+    assert view.frame(WEEKLY)["criticidad_R01_media"].min() >= 0
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+    # Overlay sobre semana existente: actualiza en sitio, sin agregar filas
+    last = int(raw["semana"].max())
+    updated = apply_critical_monday_overlay(raw, evt.assign(semana=last))
+    assert len(updated) == len(raw)
+    assert updated.loc[updated["semana"] == last, "criticidad_R01_media"].item() == 0.96
+
+    # Nueva versión del dataset → se materializa de nuevo
+    trimmed = pd.read_csv(base / WEEKLY).iloc[:-1]
+    atomic_write(base / WEEKLY, lambda tmp: trimmed.to_csv(tmp, index=False))
+    view2 = engine.materialize("critical_monday")
+    assert view2 is not view
+    assert len(view2.frame(WEEKLY)) == len(raw)
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.synthetic_generator import STDEGenerator
+
+
+def _per_risk(df: pd.DataFrame) -> dict:
+    # Referencia: filtro booleano por riesgo (implementación previa)
+    out = {}
+    for rid in df["riesgo_id"].astype(str).unique():
+        df_r = df[df["riesgo_id"] == rid]
+        out[rid] = {
+            "avg_criticidad": float(df_r["criticidad_media"].mean()),
+            "avg_rank_pos": float(df_r["rank_pos"].mean()),
+            "top3_weeks": int(df_r["is_top3"].sum()),
+            "weeks_considered": int(df_r["semana"].nunique()),
+        }
+    return out
+
+
+def _as_dict(summary: pd.DataFrame) -> dict:
+    return {
+        str(rid): {
+            "avg_criticidad": float(row["avg_criticidad"]),
+            "avg_rank_pos": float(row["avg_rank_pos"]),
+            "top3_weeks": int(row["top3_weeks"]),
+            "weeks_considered": int(row["weeks_considered"]),
+        }
+        for rid, row in summary.iterrows()
+    }
+
+
+def test_f02_020_weekly_signals_grouped_once_per_version(tmp_path):
+    """
+    F02_020
+
+    Reglas:
+    - Agregados por riesgo en una sola agregación == filtro por riesgo
+    - Se calculan una vez por versión de k9_weekly_signals.parquet
+    - Escala a K riesgos (dataset sintético)
+    """
+
+    cache = DatasetCache()
+    dm = DataManager(REPO_ROOT / "data" / "synthetic", cache=cache, snapshot_path="", partitioned_path="")
+
+    summary = dm.get_weekly_signals_by_risk()
+    assert _as_dict(summary) == _per_risk(dm.get_weekly_signals())
+
+    misses = cache.stats()["misses"]
+    dm.get_weekly_signals_by_risk()
+    assert cache.stats()["misses"] == misses
+
+    # K riesgos
+    dataset = STDEGenerator().generate(n_weeks=6, risks=25, seed=3)
+    dataset.write(tmp_path / "synthetic")
+    dm_big = DataManager(tmp_path / "synthetic", cache=DatasetCache(), snapshot_path="", partitioned_path="")
+    big = _as_dict(dm_big.get_weekly_signals_by_risk())
+    expected = _per_risk(dm_big.get_weekly_signals())
+    assert big.keys() == expected.keys() and len(big) == 25
+    for rid, values in expected.items():
+        assert big[rid] == pytest.approx(values)
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.time_dimension import WEEK_KEY
+from src.data.week_index import WeekIndex
+from src.time.data_slice import DataSlice
+
+
+def test_f02_021_week_index_ranges_and_prefix_counts():
+    """
+    F02_021
+
+    Reglas:
+    - Filas ordenadas por semana (orden estable); offsets por semana
+    - DataSlice → rango contiguo de filas == filtro isin sobre semanas
+    - Conteos por tipo en la ventana == conteo por escaneo
+    - Se construye una vez por versión del dataset
+    """
+
+    cache = DatasetCache()
+    dm = DataManager(REPO_ROOT / "data" / "synthetic", cache=cache, snapshot_path="", partitioned_path="")
+
+    obs = dm.get_observaciones_unificadas()
+    index = dm.get_observaciones_week_index()
+    assert index.weeks.tolist() == dm.get_observaciones_weeks()
+    assert len(index) == len(obs)
+
+    for start, end in [(0, 1), (2, 7), (0, len(index.weeks))]:
+        data_slice = DataSlice(resolution="INDEX", start=start, end=end)
+        weeks = index.weeks[start:end]
+        expected = obs[obs[WEEK_KEY].isin(weeks)]
+
+        rows = index.rows(data_slice)
+        assert rows[WEEK_KEY].is_monotonic_increasing
+        assert sorted(rows["id_observacion"].astype(str)) == sorted(expected["id_observacion"].astype(str))
+        assert index.total(data_slice) == len(expected)
+
+        counts = index.counts("tipo_observacion", data_slice)
+        assert counts == {str(k): int(v) for k, v in expected["tipo_observacion"].value_counts().items() if v}
+
+    # FULL == dataset completo
+    assert index.total(DataSlice()) == len(obs)
+    assert index.positions_for_weeks(3, 5) == (2, 4)
+
+    misses = cache.stats()["misses"]
+    dm.get_observaciones_week_index()
+    assert cache.stats()["misses"] == misses
+
+    # Semanas desordenadas y valores nulos en la columna contada
+    df = pd.DataFrame({WEEK_KEY: [3, 1, 3, 2, 1], "tipo": ["A", "B", None, "A", "A"]})
+    idx = WeekIndex.build(df, count_by=["tipo"])
+    assert idx.weeks.tolist() == [1, 2, 3]
+    assert idx.offsets.tolist() == [0, 2, 3, 5]
+    assert idx.rows(DataSlice(resolution="INDEX", start=0, end=1))["tipo"].tolist() == ["B", "A"]
+    assert idx.counts("tipo", DataSlice(resolution="INDEX", start=1, end=3)) == {"A": 2, "B": 0}
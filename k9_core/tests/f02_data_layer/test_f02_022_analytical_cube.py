@@ -0,0 +1,118 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.analytical_cube import MISSING_MEMBER
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.ingestion import DailyIngestor
+from src.nodes.aggregate_executor import execute_aggregate, is_aggregate_command
+from src.time.data_slice import DataSlice
+
+
+def test_f02_022_cube_slices_and_rollups_match_raw_frames(tmp_path):
+    """
+    F02_022
+
+    Reglas:
+    - Conteos / medias del cubo == groupby sobre los frames crudos
+    - Filtros por dimensión + DataSlice sobre semanas + rollups arbitrarios
+    - Valores nulos de una dimensión → miembro N/A
+    - El cubo se construye una vez por versión; la ingesta lo reconstruye
+    - Executor `aggregate` / `count` / `rank` sobre comandos K9
+    - Comando del dashboard (entity / operation al tope) == forma LLM
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    cache = DatasetCache()
+    dm = DataManager(base, cache=cache, snapshot_path="", partitioned_path="")
+
+    obs = dm.get_observaciones_unificadas()
+    cube = dm.get_cube("observations")
+
+    # "¿Cuántas OCC en CHP en las últimas 4 semanas?"
+    last4 = DataSlice(resolution="INDEX", start=len(cube.weeks) - 4, end=len(cube.weeks))
+    weeks = cube.weeks[-4:]
+    expected = obs[
+        (obs["id_area"] == "CHP") & (obs["tipo_observacion"] == "OCC") & obs["semana"].isin(weeks)
+    ]
+    assert cube.aggregate(filters={"area": "CHP", "type": "OCC"}, data_slice=last4) == len(expected)
+
+    # Rollup por riesgo × tipo (nulos → N/A)
+    by_risk_type = cube.aggregate(group_by=["risk", "type"])
+    raw = (
+        obs.assign(riesgo_id=obs["riesgo_id"].astype(object).fillna(MISSING_MEMBER))
+        .groupby(["riesgo_id", "tipo_observacion"], observed=True)
+        .size()
+    )
+    assert {(str(r), str(t)): int(n) for (r, t), n in by_risk_type.items()} == {
+        (str(r), str(t)): int(n) for (r, t), n in raw[raw > 0].items()
+    }
+    assert cube.aggregate() == len(obs)
+
+    # Medida numérica: media de criticidad por área (eventos)
+    events = dm.get_eventos()
+    mean_by_area = dm.get_cube("events").aggregate("criticidad", "mean", group_by=["area"])
+    expected_mean = events.groupby("id_area", observed=True)["criticidad"].mean()
+    for area, value in expected_mean.items():
+        assert mean_by_area[str(area)] == pytest.approx(value)
+
+    # Una construcción por versión
+    misses = cache.stats()["misses"]
+    dm.get_cube("observations")
+    assert cache.stats()["misses"] == misses
+
+    # Executor: rank de riesgos por número de OCC
+    command = {
+        "type": "K9_COMMAND",
+        "intent": "ANALYTICAL_QUERY",
+        "payload": {
+            "intent": "ANALYTICAL_QUERY",
+            "entity": "observations",
+            "operation": "rank",
+            "filters": {"tipo_observacion": "OCC"},
+            "output": "analysis",
+        },
+    }
+    ranked = execute_aggregate(dm, command)
+    values = [g["value"] for g in ranked["groups"]]
+    assert ranked["group_by"] == ["risk"]
+    assert values == sorted(values, reverse=True)
+    assert sum(values) == int((obs["tipo_observacion"] == "OCC").sum())
+
+    # Forma del dashboard (backend): entity / operation al tope, time en payload
+    dashboard = {
+        "type": "K9_COMMAND",
+        "intent": "ANALYTICAL_QUERY",
+        "entity": "observations",
+        "operation": "rank",
+        "payload": {
+            "filters": {"tipo_observacion": "OCC"},
+            "time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"},
+        },
+    }
+    assert is_aggregate_command(dashboard)
+    assert execute_aggregate(dm, dashboard) == ranked
+    assert not is_aggregate_command({**dashboard, "entity": "risks"})
+
+    # Ingesta → cubo de la nueva versión ya construido
+    DailyIngestor(base, cache=cache, snapshot_path="", partitioned_path="").ingest(
+        {
+            "observaciones": [
+                {"id_observacion": "OBS_900001", "fecha": "2025-01-27", "id_area": "CHP",
+                 "tipo_observacion": "OCC", "riesgo_id": "R02"},
+            ]
+        }
+    )
+    misses = cache.stats()["misses"] + cache.stats()["reloads"]
+    rebuilt = dm.get_cube("observations")
+    assert cache.stats()["misses"] + cache.stats()["reloads"] == misses
+    assert rebuilt.aggregate() == len(obs) + 1
@@ -0,0 +1,72 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.atomic_io import atomic_write
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.dataset_handle import DatasetHandle
+
+
+AUD_12S = "stde_auditorias_12s.csv"
+
+
+def test_f02_023_handles_materialize_records_lazily_with_paging(tmp_path):
+    """
+    F02_023
+
+    Reglas:
+    - El handle es serializable y no contiene filas
+    - Las páginas concatenadas == dataset completo (sin claves internas)
+    - Corte por semanas / columnas respetado
+    - Handle obsoleto tras cambiar los datos → stale
+    - Nombres de dataset con rutas se rechazan
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    dm = DataManager(base, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+    raw = pd.read_csv(base / AUD_12S)
+
+    handle = dm.get_handle(AUD_12S)
+    payload = json.dumps(handle.to_dict())
+    assert "hallazgos_clave" not in payload
+    assert DatasetHandle.from_dict(json.loads(payload)) == handle
+    assert handle.rows == len(raw)
+
+    records, offset = [], 0
+    while offset is not None:
+        page = dm.read_page(handle, offset=offset, limit=10)
+        assert len(page["records"]) <= 10
+        assert page["total"] == len(raw)
+        records.extend(page["records"])
+        offset = page["next_offset"]
+    assert [r["id_auditoria"] for r in records] == raw["id_auditoria"].tolist()
+    assert list(records[0]) == list(raw.columns)
+    json.dumps(records)
+
+    # Corte semanal + proyección
+    weekly = dm.get_handle(AUD_12S, week_range=(3, 5), columns=["id_auditoria", "semana"])
+    page = dm.read_page(weekly, limit=500)
+    assert weekly.rows == int(raw["semana"].between(3, 4).sum()) == page["total"]
+    assert {r["semana"] for r in page["records"]} == {3, 4}
+    assert set(page["records"][0]) == {"id_auditoria", "semana"}
+
+    # Datos nuevos → handle obsoleto
+    assert not page["stale"]
+    atomic_write(base / AUD_12S, lambda tmp: raw.iloc[:-1].to_csv(tmp, index=False))
+    assert dm.read_page(handle)["stale"]
+
+    with pytest.raises(ValueError):
+        DatasetHandle(dataset="../secret.csv", rows=0)
+    with pytest.raises(ValueError):
+        dm.read_page(handle, offset=-1)
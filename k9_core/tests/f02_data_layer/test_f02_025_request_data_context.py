@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.request_context import RequestDataContext
+from src.graph.main_graph import build_k9_graph
+from src.state.state import K9State
+from src.time.data_slice import DataSlice
+
+
+def test_f02_025_request_context_loads_once_and_is_not_serialized():
+    """
+    F02_025
+
+    Reglas:
+    - Un RequestDataContext por ejecución, compartido por todos los nodos
+    - Cada frame se carga una sola vez; los nodos reciben el mismo objeto
+    - El DataSlice se aplica una vez (frames ya cortados)
+    - Cambiar el DataSlice descarta solo los cortes
+    - data_context no forma parte de la serialización del estado
+    """
+
+    command = {
+        "type": "K9_COMMAND",
+        "intent": "OPERATIONAL_QUERY",
+        "entity": "observations",
+        "operation": "count",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    result = build_k9_graph().invoke(
+        K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command})
+    )
+    state = K9State(**result)
+    ctx = state.data_context
+
+    assert isinstance(ctx, RequestDataContext)
+    assert ctx.data_slice == state.data_slice
+    loads = ctx.stats()["loads"]
+    assert ctx.stats()["hits"] > 0
+
+    # Mismo frame para todos los consumidores, ya cortado
+    obs = ctx.observaciones()
+    assert obs is ctx.observaciones()
+    assert ctx.stats()["loads"] == loads
+    assert set(obs["semana"].unique()) == set(ctx.weeks())
+    assert len(obs) == state.analysis["engine"]["observations"]["summary"]["total"]
+    occ = state.risk_enrichment["summary"]["total_occ"]
+    assert occ == int(((obs["tipo_observacion"] == "OCC") & obs["riesgo_id"].notna()).sum())
+
+    # Nuevo DataSlice → se recortan de nuevo solo los frames del corte
+    index = ctx.observation_index()
+    ctx.bind_slice(DataSlice(resolution="FULL"))
+    assert ctx.observation_index() is index
+    assert len(ctx.observaciones()) == len(index)
+
+    dumped = state.model_dump()
+    assert "data_context" not in dumped
+    assert "data_context" not in state.model_dump_json()
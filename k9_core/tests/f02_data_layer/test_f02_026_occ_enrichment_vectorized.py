@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager
+from src.nodes.occ_enrichment_node import occ_enrichment_node, occ_events_page
+from src.state.state import K9State
+from src.time.data_slice import DataSlice
+
+
+def _expected_by_risk(df: pd.DataFrame):
+    occ = df[(df["tipo_observacion"] == "OCC") & df["riesgo_id"].notna()]
+    expected = {}
+    for risk, rows in occ.groupby("riesgo_id", observed=True):
+        critical = rows[rows["is_control_critico"].eq(True) & rows["control_critico_id"].notna()]
+        expected[str(risk)] = {
+            "occ_count": len(rows),
+            "critical_control_hits": len(critical),
+            "critical_control_ids": sorted(critical["control_critico_id"].astype(str).unique()),
+        }
+    return expected
+
+
+def test_f02_026_occ_enrichment_groups_by_risk_and_pages_events():
+    """
+    F02_026
+
+    Reglas:
+    - Conteos OCC / control crítico / controles distintos por riesgo ==
+      cálculo fila a fila sobre el DataSlice
+    - Sin eventos individuales en el payload salvo drill-down explícito
+    - Drill-down paginado: páginas concatenadas == todos los eventos del riesgo
+    """
+
+    dm = DataManager(REPO_ROOT / "data" / "synthetic")
+    obs = dm.get_observaciones_unificadas()
+    weeks = dm.get_observaciones_weeks()
+    data_slice = DataSlice(resolution="INDEX", start=2, end=6)
+
+    state = occ_enrichment_node(K9State(user_query="q", data_slice=data_slice))
+    enrichment = state.risk_enrichment
+
+    sliced = obs[obs["semana"].isin(weeks[2:6])]
+    expected = _expected_by_risk(sliced)
+    assert enrichment["by_risk"] == expected
+    assert enrichment["summary"]["total_occ"] == sum(r["occ_count"] for r in expected.values())
+    assert enrichment["summary"]["occ_with_critical_control"] == sum(
+        r["critical_control_hits"] for r in expected.values()
+    )
+    assert "occ_events" not in enrichment
+
+    # Drill-down explícito de un riesgo, paginado
+    command = {"type": "K9_COMMAND", "payload": {"occ_drilldown": {"risk_id": "R01", "limit": 7}}}
+    state = occ_enrichment_node(
+        K9State(user_query="q", data_slice=data_slice, k9_command=command)
+    )
+    page = state.risk_enrichment["occ_events"]
+    assert len(page["records"]) == 7
+    assert page["total"] == expected["R01"]["occ_count"]
+
+    ctx = state.data_context
+    df_occ = ctx.observaciones()
+    df_occ = df_occ[(df_occ["tipo_observacion"] == "OCC") & df_occ["riesgo_id"].notna()]
+    records, offset = [], 0
+    while offset is not None:
+        page = occ_events_page(
+            df_occ.assign(is_control_critico=df_occ["is_control_critico"].eq(True)),
+            risk_id="R01", offset=offset, limit=7,
+        )
+        records.extend(page["records"])
+        offset = page["next_offset"]
+    assert len(records) == expected["R01"]["occ_count"]
+    assert {r["risk_id"] for r in records} == {"R01"}
+    assert {r["week"] for r in records} <= set(weeks[2:6])
+
+    with pytest.raises(ValueError):
+        occ_events_page(df_occ, offset=-1)
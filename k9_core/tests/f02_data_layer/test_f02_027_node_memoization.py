@@ -0,0 +1,85 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.atomic_io import atomic_write
+from src.graph.main_graph import build_k9_graph
+from src.graph.memoize import NodeMemoCache, memoize_node
+from src.nodes.data_engine_node import data_engine_node
+from src.state.state import K9State
+from src.time.data_slice import DataSlice
+
+
+def _run(graph, intent):
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    result = graph.invoke(
+        K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command})
+    )
+    return K9State(**result)
+
+
+def _dump(state):
+    return json.dumps(state.model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def test_f02_027_memoized_nodes_replay_identical_deltas(tmp_path, monkeypatch):
+    """
+    F02_027
+
+    Reglas:
+    - Grafo memoizado == grafo sin memo (estado completo, incl. reasoning)
+    - data_engine / occ_enrichment se reutilizan entre intents distintos
+    - Mutar un resultado no corrompe el delta cacheado
+    - Nueva versión de datos → miss
+    """
+
+    cache = NodeMemoCache()
+    plain = build_k9_graph(memoize=False)
+    memo = build_k9_graph(memo_cache=cache)
+
+    for intent in ["ANALYTICAL_QUERY", "COMPARATIVE_QUERY", "OPERATIONAL_QUERY", "ANALYTICAL_QUERY"]:
+        assert _dump(_run(memo, intent)) == _dump(_run(plain, intent))
+
+    nodes = cache.stats()["nodes"]
+    assert nodes["data_engine"] == {"hits": 3, "misses": 1}
+    assert nodes["occ_enrichment"] == {"hits": 3, "misses": 1}
+    assert nodes["analyst"]["hits"] >= 2
+
+    # Resultado mutado por el consumidor → el siguiente hit no lo ve
+    state = _run(memo, "ANALYTICAL_QUERY")
+    state.analysis["engine"]["observations"]["summary"]["total"] = -1
+    state.analysis["risk_summary"]["dominant_risk"] = "X"
+    again = _run(memo, "ANALYTICAL_QUERY")
+    assert again.analysis["engine"]["observations"]["summary"]["total"] >= 0
+    assert again.analysis["risk_summary"]["dominant_risk"] != "X"
+
+    # Datos nuevos (misma ruta relativa) → nueva huella
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", tmp_path / "data" / "synthetic")
+    monkeypatch.chdir(tmp_path)
+    node = memoize_node("data_engine", data_engine_node, NodeMemoCache())
+
+    def run_node():
+        return node(K9State(user_query="q", data_slice=DataSlice(resolution="FULL")))
+
+    before = run_node().analysis["engine"]["audits"]["daily"]["count"]
+    assert run_node().analysis["engine"]["audits"]["daily"]["count"] == before
+
+    path = Path("data/synthetic/stde_auditorias.csv")
+    audits = pd.read_csv(path)
+    atomic_write(path, lambda tmp: audits.iloc[:-1].to_csv(tmp, index=False))
+    assert run_node().analysis["engine"]["audits"]["daily"]["count"] == before - 1
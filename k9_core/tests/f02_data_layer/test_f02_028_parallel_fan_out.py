@@ -0,0 +1,92 @@
+import json
+import sys
+import threading
+from pathlib import Path
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.request_context import RequestDataContext
+from src.graph.main_graph import build_k9_graph
+from src.graph.memoize import NodeMemoCache
+from src.state.reducers import AnalysisMerge, ReasoningAppend, reduce_analysis, reduce_reasoning
+from src.state.state import K9State
+
+
+def _run(graph, intent):
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    result = graph.invoke(
+        K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command})
+    )
+    return json.dumps(K9State(**result).model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def test_f02_028_parallel_branches_match_sequential_chain():
+    """
+    F02_028
+
+    Reglas:
+    - data_engine y occ_enrichment: ramas del mismo superstep tras time_resolution
+    - Fan-in en evidence_join antes del Analyst / evidencia operacional
+    - Opt-in: por defecto la cadena secuencial (el fan-out no mejoró latencia)
+    - Estado final idéntico a la cadena secuencial (incl. orden de reasoning)
+    - Reducers: delta marcado → append / merge; estado completo → reemplazo
+    - Contexto de datos: una sola carga por clave entre hilos
+    """
+
+    parallel = build_k9_graph(memoize=False, parallel=True)
+    edges = {(e.source, e.target) for e in parallel.get_graph().edges}
+    assert ("time_resolution", "data_engine") in edges
+    assert ("time_resolution", "occ_enrichment") in edges
+    assert ("data_engine", "evidence_join") in edges
+    assert ("occ_enrichment", "evidence_join") in edges
+    assert ("data_engine", "occ_enrichment") not in edges
+
+    sequential = build_k9_graph(memoize=False, parallel=False)
+    default_edges = {(e.source, e.target) for e in build_k9_graph(memoize=False).get_graph().edges}
+    assert ("data_engine", "occ_enrichment") in default_edges
+    assert not any("evidence_join" in edge for edge in default_edges)
+    memoized = build_k9_graph(memo_cache=NodeMemoCache(), parallel=True)
+    for intent in ["ANALYTICAL_QUERY", "OPERATIONAL_QUERY", "COMPARATIVE_QUERY", "ANALYTICAL_QUERY"]:
+        expected = _run(sequential, intent)
+        assert _run(parallel, intent) == expected
+        assert _run(memoized, intent) == expected
+
+    # Reducers
+    assert reduce_reasoning(["a"], ReasoningAppend(["b"])) == ["a", "b"]
+    assert reduce_reasoning(["a"], ["b"]) == ["b"]
+    assert reduce_analysis({"x": 1}, AnalysisMerge(y=2)) == {"x": 1, "y": 2}
+    assert reduce_analysis({"x": 1}, {"y": 2}) == {"y": 2}
+    assert reduce_analysis(None, AnalysisMerge(y=2)) == {"y": 2}
+
+    # Carga concurrente de la misma clave → un solo load
+    ctx = RequestDataContext(dm=None)
+    calls = []
+    start = threading.Barrier(8)
+
+    def load():
+        calls.append(1)
+        return object()
+
+    def worker(out):
+        start.wait()
+        out.append(ctx.frame(("full", "k"), load))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+    assert ctx.stats() == {"loads": 1, "hits": 7}
@@ -0,0 +1,82 @@
+import dataclasses
+import json
+import sys
+import typing
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.graph.main_graph import build_k9_graph
+from src.graph.memoize import NodeMemoCache
+from src.state.fast_state import K9FastState, copy_state, to_fast_state, to_k9_state
+from src.state.state import K9State
+
+
+def _state(intent):
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    return K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command})
+
+
+def _dump(result):
+    return json.dumps(to_k9_state(result).model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def test_f02_029_fast_state_mode_matches_pydantic_graph():
+    """
+    F02_029
+
+    Reglas:
+    - K9FastState: mismos campos, defaults y reducers que K9State (slots)
+    - Cada nodo recibe contenedores propios (como la validación pydantic)
+    - Validación solo en los bordes: entrada K9State, salida to_k9_state
+    - Grafo fast_state == grafo pydantic (estado final completo)
+    """
+
+    fields = {f.name: f for f in dataclasses.fields(K9FastState)}
+    assert list(fields) == list(K9State.model_fields)
+    assert not hasattr(K9FastState(), "__dict__")
+    hints = typing.get_type_hints(K9FastState, include_extras=True)
+    assert hints["reasoning"] == typing.get_type_hints(K9State, include_extras=True)["reasoning"]
+    assert K9FastState().reasoning == [] and K9FastState().demo_mode is False
+
+    # Aislación de contenedores de primer nivel
+    analysis = {"engine": {"total": 1}}
+    fast = K9FastState(analysis=analysis, reasoning=["a"])
+    fast.analysis["metrics"] = {}
+    assert "metrics" not in analysis
+    assert fast.analysis["engine"] is analysis["engine"]
+
+    branch = copy_state(fast, reasoning=[])
+    assert branch.reasoning == [] and fast.reasoning == ["a"]
+
+    # Bordes
+    assert isinstance(to_fast_state({"user_query": "q"}), K9FastState)
+    own = to_fast_state(fast)
+    assert own is not fast and own.reasoning == ["a"] and own.reasoning is not fast.reasoning
+    with pytest.raises(ValidationError):
+        to_fast_state({"reasoning": "no-es-lista"})
+    with pytest.raises(ValidationError):
+        to_k9_state({"analysis": ["no-es-dict"]})
+
+    pydantic_graph = build_k9_graph(memoize=False)
+    fast_graph = build_k9_graph(memoize=False, fast_state=True)
+    fast_parallel = build_k9_graph(memo_cache=NodeMemoCache(), parallel=True, fast_state=True)
+    for intent in ["ANALYTICAL_QUERY", "OPERATIONAL_QUERY", "COMPARATIVE_QUERY", "ONTOLOGY_QUERY"]:
+        expected = _dump(pydantic_graph.invoke(_state(intent)))
+        state = _state(intent)
+        assert _dump(fast_graph.invoke(state)) == expected
+        assert state.reasoning == [] and state.analysis is None
+        assert _dump(fast_parallel.invoke(_state(intent))) == expected
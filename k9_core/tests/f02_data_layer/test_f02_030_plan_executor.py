@@ -0,0 +1,105 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.graph.executor import K9PlanExecutor
+from src.graph.main_graph import build_k9_graph
+from src.graph.memoize import NodeMemoCache
+from src.nodes.router import VALID_INTENTS
+from src.state.fast_state import K9FastState, to_k9_state
+from src.state.state import K9State
+
+
+def _state(intent, **extra):
+    command = {
+        "type": "K9_COMMAND",
+        "intent": intent,
+        "entity": "risks",
+        "operation": "rank",
+        "payload": {"time": {"type": "RELATIVE", "value": "LAST_4_WEEKS"}},
+    }
+    return K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command}, **extra)
+
+
+def _dump(result):
+    return json.dumps(to_k9_state(result).model_dump(mode="json"), sort_keys=True, default=str)
+
+
+def _visited(graph, state):
+    return tuple(
+        step["payload"]["name"]
+        for step in graph.stream(state, stream_mode="debug")
+        if step["type"] == "task"
+    )
+
+
+def test_f02_030_compiled_plans_match_graph_invoke():
+    """
+    F02_030
+
+    Reglas:
+    - Plan por intent == nodos que recorre el grafo (sin fan-out)
+    - Estado final idéntico a graph.invoke para todos los intents válidos
+    - El estado del caller no se muta
+    - Sin k9_command explícito → fallback al grafo; intent inválido → mismo error
+    - fast_state: nodos reciben K9FastState; K9State solo en entrada / salida
+    """
+
+    graph = build_k9_graph(memoize=False, parallel=False)
+    executor = K9PlanExecutor(memoize=False, fallback=graph)
+
+    for intent in sorted(VALID_INTENTS):
+        names = tuple(name for name, _ in executor.plan(intent))
+        assert names == _visited(graph, _state(intent)), intent
+
+        for extra in ({}, {"demo_mode": True}):
+            state = _state(intent, **extra)
+            result = executor.invoke(state)
+            assert isinstance(result, K9State)
+            assert _dump(result) == _dump(graph.invoke(_state(intent, **extra))), intent
+            assert state.reasoning == [] and state.analysis is None
+
+    assert executor.plan("ANALYTICAL_QUERY") is executor.plan("ANALYTICAL_QUERY")
+    assert [n for n, _ in executor.plan("ONTOLOGY_QUERY")] == [
+        "guardrail", "context", "ontology_query", "narrative",
+    ]
+
+    # Memo compartida entre ejecuciones: mismas salidas que el grafo memoizado
+    memo_graph = build_k9_graph(memo_cache=NodeMemoCache(), parallel=False)
+    memo_executor = K9PlanExecutor(memo_cache=NodeMemoCache())
+    for intent in ["OPERATIONAL_QUERY", "ANALYTICAL_QUERY", "OPERATIONAL_QUERY"]:
+        assert _dump(memo_executor.invoke(_state(intent))) == _dump(memo_graph.invoke(_state(intent)))
+
+    # Comando legacy solo en context_bundle → ruta del grafo
+    legacy = K9State(user_query="q", context_bundle={"k9_command": _state("ANALYTICAL_QUERY").k9_command})
+    assert _dump(executor.invoke(legacy)) == _dump(graph.invoke(legacy))
+
+    with pytest.raises(ValueError, match="invalid intent"):
+        executor.invoke(_state("NOT_AN_INTENT"))
+
+    # Estado rápido en los bordes del ejecutor
+    fast = K9PlanExecutor(memoize=False, fast_state=True)
+    received = set()
+    fast.nodes = {
+        name: (lambda node: lambda state: received.add(type(state)) or node(state))(node)
+        for name, node in fast.nodes.items()
+    }
+    for intent in sorted(VALID_INTENTS):
+        state = _state(intent)
+        result = fast.invoke(state)
+        assert isinstance(result, K9State)
+        assert _dump(result) == _dump(graph.invoke(_state(intent))), intent
+        assert state.reasoning == [] and state.analysis is None
+    assert received == {K9FastState}
+
+    fallback = fast.invoke(legacy)
+    assert isinstance(fallback, K9State)
+    assert _dump(fallback) == _dump(graph.invoke(legacy))
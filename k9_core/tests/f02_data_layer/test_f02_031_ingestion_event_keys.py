@@ -0,0 +1,106 @@
+import shutil
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.atomic_io import atomic_write, directory_lock
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.ingestion import INGEST_LOCKFILE, DailyIngestor
+
+
+def test_f02_031_events_are_deduplicated_and_files_replaced_atomically(tmp_path):
+    """
+    F02_031
+
+    Reglas:
+    - Eventos: id_evento si viene; si no (fecha, id_area, riesgo_id, tipo_evento)
+    - Re-ingestar el mismo batch no cambia conteos de filas ni agregados
+    - Escrituras atómicas: un fallo deja el archivo original intacto, sin temporales
+    - Ingestas serializadas por flock sobre base_path (entre procesos)
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    ingestor = DailyIngestor(base, partitioned_path="", cache=DatasetCache(), snapshot_path="")
+
+    existing = pd.read_csv(base / "stde_eventos.csv").iloc[0]
+    batch = {
+        "eventos": [
+            {"fecha": "2025-02-03", "id_area": "CHP", "riesgo_id": "R01",
+             "tipo_evento": "HAZARD", "criticidad": 0.4},
+            # Misma clave natural dentro del batch → una sola fila
+            {"fecha": "2/3/2025", "id_area": "CHP", "riesgo_id": "R01",
+             "tipo_evento": "HAZARD", "criticidad": 0.5},
+            # Con id propio: misma fecha/área/riesgo/tipo pero otro evento
+            {"fecha": "2025-02-03", "id_area": "CHP", "riesgo_id": "R01",
+             "tipo_evento": "HAZARD", "criticidad": 0.6, "id_evento": "EV_900001"},
+            # Ya presente en el dataset (misma clave natural)
+            {"fecha": existing["fecha"], "id_area": existing["id_area"],
+             "riesgo_id": existing["riesgo_id"], "tipo_evento": existing["tipo_evento"],
+             "criticidad": 0.1},
+        ],
+        "observaciones": [
+            {"id_observacion": "OBS_900010", "fecha": "2025-02-03", "id_area": "MRA",
+             "tipo_observacion": "OPG", "is_control_critico": False},
+        ],
+    }
+
+    first = ingestor.ingest(batch).to_dict()
+    assert first["rows_appended"] == {"eventos": 2, "observaciones": 1}
+    assert first["rows_skipped"]["eventos"] == 2
+
+    def snapshot():
+        return {
+            p.name: len(pd.read_csv(p)) if p.suffix == ".csv" else len(pd.read_parquet(p))
+            for p in sorted(base.glob("*.csv")) + sorted(base.glob("*.parquet"))
+        }
+
+    counts = snapshot()
+    again = ingestor.ingest(batch).to_dict()
+    assert again["rows_appended"] == {}
+    assert again["rows_skipped"] == {"eventos": 4, "observaciones": 1}
+    assert snapshot() == counts
+    assert again["dataset_version"] == first["dataset_version"]
+
+    dm = DataManager(base, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+    assert dm.get_cube("events").aggregate() == counts["stde_eventos.csv"]
+
+    assert (base / INGEST_LOCKFILE).exists()
+    assert not list(base.glob(".*.tmp"))
+
+    # Fallo a mitad de escritura → original intacto
+    target = base / "dates.csv"
+    before = target.read_bytes()
+
+    def broken(tmp):
+        tmp.write_text("semana\n1", encoding="utf-8")
+        raise RuntimeError("crash")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(target, broken)
+    assert target.read_bytes() == before
+    assert not list(base.glob(".*.tmp"))
+
+    # Otro proceso no obtiene el lock mientras lo tenemos
+    probe = textwrap.dedent(f"""
+        import fcntl, sys
+        with open({str(base / INGEST_LOCKFILE)!r}, "a") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                sys.exit(3)
+    """)
+    pytest.importorskip("fcntl")
+    with directory_lock(base, INGEST_LOCKFILE):
+        assert subprocess.run([sys.executable, "-c", probe]).returncode == 3
+    assert subprocess.run([sys.executable, "-c", probe]).returncode == 0
@@ -0,0 +1,68 @@
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data import data_manager
+from src.data.atomic_io import atomic_write
+from src.data.config import DataSettings, get_data_settings
+from src.data.data_manager import DataManager, DatasetCache, invalidate_dataset_version
+
+
+def test_f02_032_settings_once_and_dataset_version_cached_by_directory(tmp_path, monkeypatch):
+    """
+    F02_032
+
+    Reglas:
+    - DataSettings se lee una vez por proceso; DataManager acepta un override
+    - dataset_version no re-lista ni re-stat-ea los datasets si el directorio no cambió
+    - Un archivo publicado (os.replace) cambia la versión sin invalidación explícita
+    - Escrituras en el lugar: invalidate_dataset_version fuerza el recálculo
+    """
+
+    assert get_data_settings() is get_data_settings()
+    plain = DataManager(
+        tmp_path, cache=DatasetCache(), settings=DataSettings(categorical_ids=False)
+    )
+    assert plain.dtypes is None and plain.snapshot is None and plain.partitioned is None
+
+    csv_path = tmp_path / "stde_observaciones.csv"
+    pd.DataFrame({"semana": [1, 2]}).to_csv(csv_path, index=False)
+    dm = DataManager(tmp_path, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+
+    stats = []
+    fingerprint = data_manager._stat_fingerprint
+    monkeypatch.setattr(
+        data_manager, "_stat_fingerprint", lambda p: stats.append(p) or fingerprint(p)
+    )
+
+    version = dm.dataset_version()
+    assert len(stats) == 1
+    assert DataManager(tmp_path, cache=DatasetCache()).dataset_version() == version
+    assert dm.dataset_version() == version
+    assert len(stats) == 1
+
+    # Publicación atómica (rename) → cambia el mtime del directorio
+    atomic_write(
+        tmp_path / "stde_eventos.csv",
+        lambda tmp: pd.DataFrame({"semana": [1]}).to_csv(tmp, index=False),
+    )
+    published = dm.dataset_version()
+    assert published != version
+    assert len(stats) == 3
+
+    # Escritura en el lugar (mtime del directorio intacto) + invalidación
+    dir_stat = tmp_path.stat()
+    pd.DataFrame({"semana": [1, 2, 3]}).to_csv(csv_path, index=False)
+    os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert dm.dataset_version() == published
+
+    invalidate_dataset_version(tmp_path)
+    assert dm.dataset_version() != published
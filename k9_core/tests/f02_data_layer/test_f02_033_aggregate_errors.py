@@ -0,0 +1,88 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.data_manager import DataManager, DatasetCache
+from src.graph.main_graph import build_k9_graph
+from src.nodes.aggregate_executor import (
+    DIMENSION_ALIASES,
+    AggregateCommandError,
+    execute_aggregate,
+)
+from src.state.fast_state import to_k9_state
+from src.state.state import K9State
+
+
+def _command(**payload):
+    return {
+        "type": "K9_COMMAND",
+        "intent": "ANALYTICAL_QUERY",
+        "entity": "observations",
+        "operation": "count",
+        "payload": payload,
+    }
+
+
+def _run(graph, command):
+    state = K9State(user_query="q", k9_command=command, context_bundle={"k9_command": command})
+    return to_k9_state(graph.invoke(state))
+
+
+def test_f02_033_invalid_aggregates_are_reported_not_raised(tmp_path):
+    """
+    F02_033
+
+    Reglas:
+    - group_by / measure / agg fuera del cubo → AggregateCommandError con opciones válidas
+    - En el grafo: `aggregate` = {"error", "supported"} + reasoning; el resto sigue
+    - Filtros sin dimensión en el cubo no filtran en silencio: `unapplied_filters`
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    dm = DataManager(base, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+
+    with pytest.raises(AggregateCommandError) as unknown_dim:
+        execute_aggregate(dm, _command(group_by=["control"]))
+    assert unknown_dim.value.supported == list(DIMENSION_ALIASES)
+
+    with pytest.raises(AggregateCommandError) as unknown_measure:
+        execute_aggregate(dm, {**_command(measure="duracion"), "entity": "events"})
+    assert unknown_measure.value.supported == ["count", "criticidad"]
+
+    with pytest.raises(AggregateCommandError) as bad_agg:
+        execute_aggregate(dm, _command(agg="mean"))
+    assert bad_agg.value.supported == ["sum"]
+
+    # Filtro sin dimensión: total sin filtrar, pero declarado
+    total = execute_aggregate(dm, _command())
+    partial = execute_aggregate(dm, _command(filters={"turno": "noche", "area": "CHP"}))
+    assert total["unapplied_filters"] == {}
+    assert partial["unapplied_filters"] == {"turno": "noche"}
+    assert partial["filters"] == {"area": "CHP"}
+    assert partial["value"] == execute_aggregate(dm, _command(filters={"area": "CHP"}))["value"]
+
+    # Grafo completo: el error queda en el análisis, la respuesta se construye igual
+    graph = build_k9_graph(memoize=False, parallel=False)
+    failed = _run(graph, _command(group_by=["control"]))
+    aggregate = failed.analysis["engine"]["aggregate"]
+    assert "dimensión desconocida 'control'" in aggregate["error"]
+    assert aggregate["supported"] == list(DIMENSION_ALIASES)
+    assert "groups" not in aggregate and "value" not in aggregate
+    assert any("aggregate no resuelto" in r for r in failed.reasoning)
+    assert failed.reasoning[-1].startswith("NarrativeNode")
+
+    measure = _run(graph, _command(measure="duracion"))
+    assert measure.analysis["engine"]["aggregate"]["supported"] == ["count"]
+
+    unapplied = _run(graph, _command(filters={"turno": "noche"}))
+    assert unapplied.analysis["engine"]["aggregate"]["unapplied_filters"] == {"turno": "noche"}
+    assert any("no aplicados ['turno']" in r for r in unapplied.reasoning)
@@ -0,0 +1,163 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# --------------------------------------------------
+# ROOT CORRECTO DEL REPO
+# --------------------------------------------------
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data.analytical_cube import AnalyticalCube
+from src.data.arrow_snapshot import ArrowSnapshot, build_snapshot
+from src.data.data_manager import DataManager, DatasetCache
+from src.data.ingestion import DailyIngestor
+
+CUBES = ("observations", "events", "audits")
+
+
+def _batch(day: str, n: int):
+    return {
+        "observaciones": [
+            {"id_observacion": f"OBS_95000{n}", "fecha": day, "id_area": "CHP",
+             "tipo_observacion": "OCC", "riesgo_id": "R02", "is_control_critico": True,
+             "control_critico_id": "R02CC01"},
+            {"id_observacion": f"OBS_95100{n}", "fecha": day, "id_area": "MRA",
+             "tipo_observacion": "OPG", "is_control_critico": False},
+        ],
+        "eventos": [
+            {"fecha": day, "id_area": "TME", "riesgo_id": "R03",
+             "tipo_evento": "HAZARD", "criticidad": 0.3 + n / 10},
+        ],
+        "auditorias": [
+            {"id_auditoria_final": f"AUF_95000{n}", "fecha": day, "id_area": "CHP",
+             "riesgo_focal": "R01", "tipo_auditoria": "AUF", "origen": "planificada"},
+        ],
+        "trayectorias": [
+            {"fecha": day, "criticidad_R01": 0.5, "criticidad_R02": 0.6,
+             "criticidad_R03": 0.2, "criticidad_global": 0.4},
+        ],
+        "fdo": [
+            {"fecha": day, "fdo_produccion": 0.5, "fdo_backlog": 0.4, "fdo_congestion": 0.3,
+             "fdo_fatiga": 0.2, "fdo_clima": 0.1, "fdo_dotacion": 0.6, "fdo_variabilidad": 0.7},
+        ],
+    }
+
+
+def _assert_same_cube(actual: AnalyticalCube, expected: AnalyticalCube):
+    for dim, members in expected.members.items():
+        assert actual.members[dim].tolist() == members.tolist(), dim
+    np.testing.assert_array_equal(actual.counts, expected.counts)
+    for measure in expected.measures[1:]:
+        np.testing.assert_allclose(actual._sums[measure], expected._sums[measure])
+        np.testing.assert_array_equal(actual._non_null[measure], expected._non_null[measure])
+
+
+def test_f02_034_ingestion_updates_indexes_cubes_and_snapshot_incrementally(tmp_path, monkeypatch):
+    """
+    F02_034
+
+    Reglas:
+    - Deduplicación contra un índice de claves mantenido: sin releer el histórico
+    - Cubos ya construidos se extienden con las filas nuevas == reconstrucción completa
+    - Snapshot: datasets sin cambios enlazados, los extendidos == conversión completa
+    - Booleanos escritos con la codificación de las filas existentes (TRUE / FALSE)
+    """
+
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    snapshots = tmp_path / "snapshots"
+    build_snapshot(base, snapshots)
+
+    cache = DatasetCache()
+    dm = DataManager(base, cache=cache, snapshot_path="", partitioned_path="")
+    for entity in CUBES:
+        dm.get_cube(entity)
+
+    ingestor = DailyIngestor(base, partitioned_path="", cache=cache, snapshot_path=snapshots)
+    ingestor.ingest(_batch("2025-02-03", 1))
+    previous = ArrowSnapshot(snapshots)
+
+    # Segunda ingesta: ni lecturas completas de las fuentes, ni cubos desde cero
+    reads = []
+    read_csv = pd.read_csv
+
+    def spy(path, *args, **kwargs):
+        if isinstance(path, (str, Path)) and "nrows" not in kwargs:
+            reads.append(Path(path).name)
+        return read_csv(path, *args, **kwargs)
+
+    def rebuild(*_args, **_kwargs):
+        raise AssertionError("cubo reconstruido desde cero")
+
+    with monkeypatch.context() as mp:
+        mp.setattr(pd, "read_csv", spy)
+        mp.setattr(AnalyticalCube, "build", rebuild)
+        result = ingestor.ingest(_batch("2025-02-04", 2)).to_dict()
+
+    assert result["rows_appended"] == {
+        "observaciones": 2, "eventos": 1, "auditorias": 1, "trayectorias": 1, "fdo": 1,
+    }
+    history = {
+        "stde_observaciones.csv", "stde_observaciones_12s.csv", "stde_eventos.csv",
+        "stde_auditorias.csv", "stde_trayectorias_diarias.csv", "stde_fdo_diario.csv",
+    }
+    assert not history & set(reads)
+
+    # Cubos por deltas == reconstrucción sobre las fuentes actuales
+    fresh = DataManager(base, cache=DatasetCache(), snapshot_path="", partitioned_path="")
+    for entity in CUBES:
+        _assert_same_cube(dm.get_cube(entity), fresh.get_cube(entity))
+    assert cache.stats()["reloads"] == 0
+
+    # Snapshot incremental == snapshot completo (versión, frames, dominios)
+    current = ArrowSnapshot(snapshots)
+    assert current.version == result["snapshot_version"]
+    full = ArrowSnapshot(build_snapshot(base, tmp_path / "full"))
+    assert current.version == full.version
+    assert set(current.manifest["datasets"]) == set(full.manifest["datasets"])
+    for name, entry in full.manifest["datasets"].items():
+        pd.testing.assert_frame_equal(
+            ArrowSnapshot.read_frame(current.path_for(name)),
+            ArrowSnapshot.read_frame(full.path_for(name)),
+        )
+        assert current.time_domain(name) == entry["time"], name
+
+    # Fuentes sin cambios: mismo archivo Arrow (hard link), sin reconvertir
+    unchanged = current.path_for("stde_observaciones_12s.csv")
+    assert os.stat(unchanged).st_ino == os.stat(previous.path_for("stde_observaciones_12s.csv")).st_ino
+
+    # Booleanos con la codificación del archivo
+    raw = pd.read_csv(base / "stde_observaciones.csv", dtype=str)
+    assert set(raw["is_control_critico"].dropna()) == {"TRUE", "FALSE"}
+    assert raw["is_control_critico"].tail(4).tolist() == ["TRUE", "FALSE", "TRUE", "FALSE"]
+    assert pd.read_csv(base / "stde_observaciones.csv")["is_control_critico"].dtype == bool
+
+    # Fuente reescrita por fuera de la ingesta: el índice se reconstruye
+    again = ingestor.ingest(_batch("2025-02-04", 2)).to_dict()
+    assert again["rows_appended"] == {}
+    observaciones = pd.read_csv(base / "stde_observaciones.csv")
+    observaciones.iloc[:-2].to_csv(base / "stde_observaciones.csv", index=False)
+    reingested = ingestor.ingest({"observaciones": _batch("2025-02-04", 2)["observaciones"]})
+    assert reingested.rows_appended == {"observaciones": 2}
+
+
+@pytest.mark.parametrize("tokens", [("True", "False"), ("true", "false")])
+def test_f02_034_bool_encoding_follows_existing_rows(tmp_path, tokens):
+    base = tmp_path / "synthetic"
+    shutil.copytree(REPO_ROOT / "data" / "synthetic", base)
+    path = base / "stde_observaciones.csv"
+    df = pd.read_csv(path, dtype=str)
+    df["is_control_critico"] = df["is_control_critico"].map({"TRUE": tokens[0], "FALSE": tokens[1]})
+    df.to_csv(path, index=False)
+
+    ingestor = DailyIngestor(base, partitioned_path="", cache=DatasetCache(), snapshot_path="")
+    ingestor.ingest({"observaciones": _batch("2025-02-03", 1)["observaciones"]})
+
+    raw = pd.read_csv(path, dtype=str)
+    assert raw["is_control_critico"].tail(2).tolist() == list(tokens)
@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+# =====================================================
+# Explicit project root resolution
+# =====================================================
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pandas as pd
+
+from src.graph.main_graph import build_k9_graph
+from src.nodes.operational_analysis_node import iter_traceability, operational_analysis_node
+from src.state.state import K9State
+from src.time.data_slice import DataSlice
+
+
+def _command(**payload):
+    return {
+        "type": "K9_COMMAND",
+        "intent": "OPERATIONAL_QUERY",
+        "entity": "risks",
+        "operation": "expose_evidence",
+        "payload": payload,
+    }
+
+
+def test_operational_node_builds_columnar_evidence_from_slice_and_graph():
+    """
+    F01_OPERATIONAL_005
+
+    Regla:
+    - Registros con nombres alternativos se normalizan por columna
+    - Sin registros explícitos → observaciones del DataSlice (+ auditorías
+      del mismo riesgo / área / semana)
+    - traceability es una página; el resto se emite a pedido
+    - El grafo ejecuta el nodo para OPERATIONAL_QUERY
+    """
+
+    # 1️⃣ Registros explícitos con alias mixtos
+    state = K9State(
+        k9_command=_command(),
+        risk_enrichment={
+            "occ_records": [
+                {"occ_id": "OCC_1", "riesgo_id": "R01", "tipo": "occ", "id_control": "C1", "is_critical": True},
+                {"id": "OPG_1", "risk_id": "R01", "type": "OPG", "control_id": "C2"},
+                {"id_observacion": "OCC_2", "id_riesgo": "R02", "control": "C3", "id_auditoria": "A9"},
+                {"id": "SIN_RIESGO", "type": "OCC"},
+            ]
+        },
+    )
+    op = operational_analysis_node(state).analysis["operational_analysis"]
+
+    assert list(op["evidence_by_risk"]) == ["R01", "R02"]
+    r01 = op["evidence_by_risk"]["R01"]
+    assert (r01["occ_count"], r01["opg_count"]) == (1, 1)
+    assert r01["controls_affected"] == ["C1", "C2"]
+    assert r01["critical_controls_affected"] == ["C1"]
+    assert op["evidence_by_risk"]["R02"]["occ_count"] == 1
+    assert op["traceability"][-1] == {
+        "occ_id": "OCC_2", "risk_id": "R02", "control_id": "C3", "audit_id": "A9",
+    }
+
+    # 2️⃣ Observaciones del DataSlice + join con auditorías
+    data_slice = DataSlice(resolution="INDEX", start=8, end=12)
+    state = operational_analysis_node(
+        K9State(k9_command=_command(traceability_page={"offset": 10, "limit": 5}), data_slice=data_slice)
+    )
+    ctx = state.data_context
+    op = state.analysis["operational_analysis"]
+
+    obs = ctx.observaciones()
+    occ = obs[obs["riesgo_id"].notna()]
+    assert op["meta"]["records_total"] == len(occ)
+    assert {r: e["occ_count"] for r, e in op["evidence_by_risk"].items()} == {
+        str(r): int(n) for r, n in occ.groupby("riesgo_id", observed=True).size().items()
+    }
+
+    page = op["meta"]["traceability_page"]
+    assert (page["offset"], page["limit"], len(op["traceability"])) == (10, 5, 5)
+    assert page["next_offset"] == 15
+
+    audits = ctx.auditorias()
+    linked = [t for t in op["traceability"] if t["audit_id"] is not None]
+    for t in linked:
+        row = obs[obs["id_observacion"] == t["occ_id"]].iloc[0]
+        audit = audits[audits["id_auditoria_final"] == t["audit_id"]].iloc[0]
+        assert (str(audit["riesgo_focal"]), str(audit["id_area"]), audit["semana"]) == (
+            t["risk_id"], str(row["id_area"]), row["semana"]
+        )
+
+    # Emisión a pedido: mismo contenido que la página
+    frame = pd.DataFrame(
+        {"id": ["X1", "X2"], "risk_id": ["R01", "R02"], "control_id": [None, "C1"], "audit_id": [None, None]}
+    )
+    assert list(iter_traceability(frame, offset=1)) == [
+        {"occ_id": "X2", "risk_id": "R02", "control_id": "C1", "audit_id": None}
+    ]
+
+    # 3️⃣ Grafo: OPERATIONAL_QUERY → operational_analysis → analyst
+    edges = {(e.source, e.target) for e in build_k9_graph().get_graph().edges}
+    assert ("occ_enrichment", "operational_analysis") in edges
+    assert ("operational_analysis", "analyst") in edges